@@ -10,3 +10,6 @@ class InsightsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.insights"
     verbose_name = "Insights"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -0,0 +1,45 @@
+"""Helpers for HTTP conditional requests (ETag / Last-Modified)."""
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts: object) -> str:
+    """Return a strong, quoted ETag hashed from the given version parts."""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def not_modified(
+    request: HttpRequest,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+) -> Optional[HttpResponseBase]:
+    """Return a 304/412 response if the request's validators still match."""
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_validators(response, etag=etag, last_modified=last_modified)
+    return response
+
+
+def set_validators(
+    response: HttpResponseBase,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+) -> HttpResponseBase:
+    """Attach ETag and Last-Modified headers to ``response``."""
+    if etag:
+        response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
@@ -0,0 +1,157 @@
+"""
+Plain-function serializers for the country payload.
+
+These mirror ``CountrySerializer`` and its nested serializers field for field,
+producing dictionaries that render to the same JSON bytes without building
+DRF field objects or resolving ``source`` paths per row. Enable them with the
+``INSIGHTS_FAST_SERIALIZER`` setting; ``benchmark_country_serializers`` checks
+parity against the DRF serializers.
+"""
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.exceptions import ObjectDoesNotExist
+
+from .models import Country, CountryNewsItem, CountrySentiment, CountrySummary, CountryWeather
+from .projection import FULL_PROJECTION, CountryProjection
+from .sentiment import DEFAULT_WINDOW, SentimentWindow
+
+
+def _related(instance: Any, attr: str) -> Any:
+    """Return a one-to-one relation or ``None`` when it does not exist."""
+    try:
+        return getattr(instance, attr)
+    except ObjectDoesNotExist:
+        return None
+
+
+def _str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def serialize_sentiment(point: CountrySentiment) -> Dict[str, Any]:
+    """Match ``CountrySentimentSerializer``."""
+    if point.label:
+        date = point.label
+    elif point.recorded_date:
+        date = point.recorded_date.isoformat()
+    else:
+        date = ""
+    return {"date": date, "score": int(point.score)}
+
+
+def serialize_news_item(item: CountryNewsItem) -> Dict[str, Any]:
+    """Match ``CountryNewsItemSerializer``."""
+    return {
+        "title": str(item.title),
+        "summary": str(item.summary),
+        "url": str(item.url),
+        "category": str(item.category),
+        "tone": str(item.tone),
+    }
+
+
+def serialize_sentiment_series(
+    points: Iterable[CountrySentiment], window: SentimentWindow = DEFAULT_WINDOW
+) -> List[Dict[str, Any]]:
+    """Match ``CountrySentimentListSerializer``, downsampling to ``window``."""
+    if window.points is not None:
+        points = window.downsample(list(points), attrgetter("recorded_date"), attrgetter("score"))
+    return [serialize_sentiment(point) for point in points]
+
+
+def serialize_weather(weather: Optional[CountryWeather]) -> Optional[Dict[str, Any]]:
+    """Match ``CountryWeatherSerializer``."""
+    if weather is None:
+        return None
+    return {
+        "condition": str(weather.condition),
+        "temperature": int(weather.temperature),
+        "feelsLike": int(weather.feels_like),
+        "humidity": int(weather.humidity),
+        "wind": str(weather.wind),
+        "precipitationChance": int(weather.precipitation_chance),
+    }
+
+
+def serialize_summary(summary: Optional[CountrySummary]) -> Optional[Dict[str, Any]]:
+    """Match ``CountrySummarySerializer``."""
+    if summary is None:
+        return None
+    return {
+        "headline": str(summary.headline),
+        "weather": str(summary.weather),
+        "persona": str(summary.persona),
+    }
+
+
+def serialize_country(
+    country: Country,
+    projection: CountryProjection = FULL_PROJECTION,
+    window: SentimentWindow = DEFAULT_WINDOW,
+) -> Dict[str, Any]:
+    """Match ``CountrySerializer``, including the ``insights`` block."""
+    if projection.is_full:
+        summary = _related(country, "summary")
+        return {
+            "code": str(country.code),
+            "name": str(country.name),
+            "lat": float(country.latitude),
+            "lng": float(country.longitude),
+            "summary": serialize_summary(summary),
+            "insights": {
+                "sentiment": serialize_sentiment_series(country.sentiments.all(), window),
+                "news": [serialize_news_item(item) for item in country.news_items.all()],
+                "weatherNow": serialize_weather(_related(country, "weather")),
+                "moodNarrative": _str(summary.mood_narrative) if summary else None,
+                "todaySummary": _str(summary.today_summary) if summary else None,
+            },
+        }
+    return _serialize_projected(country, projection, window)
+
+
+def _serialize_projected(
+    country: Country, projection: CountryProjection, window: SentimentWindow
+) -> Dict[str, Any]:
+    """Serialize only the fields selected by ``projection``."""
+    summary = _related(country, "summary") if projection.needs_summary else None
+    data: Dict[str, Any] = {}
+    for name in projection.fields:
+        if name == "code":
+            data["code"] = str(country.code)
+        elif name == "name":
+            data["name"] = str(country.name)
+        elif name == "lat":
+            data["lat"] = float(country.latitude)
+        elif name == "lng":
+            data["lng"] = float(country.longitude)
+        elif name == "summary":
+            data["summary"] = serialize_summary(summary)
+        elif name == "insights":
+            insights: Dict[str, Any] = {}
+            for block in projection.insights:
+                if block == "sentiment":
+                    insights["sentiment"] = serialize_sentiment_series(
+                        country.sentiments.all(), window
+                    )
+                elif block == "news":
+                    insights["news"] = [serialize_news_item(item) for item in country.news_items.all()]
+                elif block == "weatherNow":
+                    insights["weatherNow"] = serialize_weather(_related(country, "weather"))
+                elif block == "moodNarrative":
+                    insights["moodNarrative"] = _str(summary.mood_narrative) if summary else None
+                elif block == "todaySummary":
+                    insights["todaySummary"] = _str(summary.today_summary) if summary else None
+            data["insights"] = insights
+    return data
+
+
+def serialize_countries(
+    countries: Iterable[Country],
+    projection: CountryProjection = FULL_PROJECTION,
+    window: SentimentWindow = DEFAULT_WINDOW,
+) -> List[Dict[str, Any]]:
+    """Serialize many countries; equivalent to ``CountrySerializer(many=True)``."""
+    return [serialize_country(country, projection, window) for country in countries]
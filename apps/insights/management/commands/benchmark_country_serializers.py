@@ -0,0 +1,122 @@
+"""Management command comparing the DRF and plain-function country serializers."""
+from __future__ import annotations
+
+import timeit
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.insights import fast_serializers
+from apps.insights.models import (
+    Country,
+    CountryNewsItem,
+    CountrySentiment,
+    CountrySummary,
+    CountryWeather,
+)
+from apps.insights.serializers import CountrySerializer
+
+
+def _prefetched(instance, name, objects) -> None:
+    """Attach ``objects`` as the prefetched result of relation ``name``."""
+    queryset = getattr(instance, name).all()
+    queryset._result_cache = list(objects)
+    queryset._prefetch_done = True
+    instance._prefetched_objects_cache[name] = queryset
+
+
+def build_countries(count: int, sentiments: int, news: int) -> list[Country]:
+    """Build unsaved countries shaped like the output of ``CountryViewSet.queryset``."""
+    countries = []
+    for index in range(count):
+        country = Country(
+            id=index + 1,
+            code=f"c{index}",
+            name=f"Country {index}",
+            latitude=Decimal("35.12345"),
+            longitude=Decimal("-139.54321"),
+        )
+        country._prefetched_objects_cache = {}
+        # Leave every tenth country without summary/weather to cover the null paths.
+        if index % 10:
+            country.summary = CountrySummary(
+                headline="Headline",
+                weather="Sunny",
+                persona="Calm",
+                mood_narrative="Narrative",
+                today_summary="Summary",
+            )
+            country.weather = CountryWeather(
+                condition="Clear",
+                temperature=21,
+                feels_like=20,
+                humidity=40,
+                wind="NE 5 km/h",
+                precipitation_chance=10,
+            )
+        else:
+            country._state.fields_cache["summary"] = None
+            country._state.fields_cache["weather"] = None
+        _prefetched(
+            country,
+            "sentiments",
+            [
+                CountrySentiment(
+                    label="" if point % 2 else f"Day {point + 1}",
+                    recorded_date=date(2024, 1, 1) + timedelta(days=point) if point % 3 else None,
+                    score=50 + point % 40,
+                )
+                for point in range(sentiments)
+            ],
+        )
+        _prefetched(
+            country,
+            "news_items",
+            [
+                CountryNewsItem(
+                    title=f"News {item}",
+                    summary="Summary",
+                    url="https://example.com/news",
+                    category="General",
+                    tone=CountryNewsItem.Tone.OPTIMISTIC,
+                )
+                for item in range(news)
+            ],
+        )
+        countries.append(country)
+    return countries
+
+
+class Command(BaseCommand):
+    """Check byte parity and time both country serializer paths in memory."""
+
+    help = "Benchmark CountrySerializer against apps.insights.fast_serializers (no database access)."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--countries", type=int, default=1000)
+        parser.add_argument("--sentiments", type=int, default=30)
+        parser.add_argument("--news", type=int, default=5)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *_args, **options) -> None:
+        countries = build_countries(options["countries"], options["sentiments"], options["news"])
+        renderer = JSONRenderer()
+
+        def drf() -> bytes:
+            return renderer.render(CountrySerializer(countries, many=True).data)
+
+        def fast() -> bytes:
+            return renderer.render(fast_serializers.serialize_countries(countries))
+
+        if drf() != fast():
+            raise CommandError("Fast serializer output differs from CountrySerializer.")
+        self.stdout.write("Parity: rendered JSON is byte-identical.")
+
+        per_thousand = 1000 / max(len(countries), 1)
+        drf_time = min(timeit.repeat(drf, number=1, repeat=options["repeat"])) * per_thousand
+        fast_time = min(timeit.repeat(fast, number=1, repeat=options["repeat"])) * per_thousand
+        self.stdout.write(f"CountrySerializer: {drf_time * 1000:.1f} ms per 1k countries")
+        self.stdout.write(f"fast_serializers:  {fast_time * 1000:.1f} ms per 1k countries")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {drf_time / fast_time:.1f}x"))
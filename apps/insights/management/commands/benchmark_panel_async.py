@@ -0,0 +1,112 @@
+"""Management command comparing blocking and async panel reads against a fake S3 server."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from apps.insights.tests.fake_s3 import FakeS3Server
+from apps.insights.models import PanelDiscussionObject
+from apps.insights.services import aws_clients
+from apps.insights.services.panel_discussion_service import PanelDiscussionService
+
+BUCKET = "panel-benchmark"
+
+
+def build_discussion(index: int) -> dict:
+    return {
+        "country_code": "JP",
+        "topic": f"Benchmark topic {index}",
+        "final_mood": "neutral",
+        "final_score": 50 + index % 50,
+        "introduction": "Introduction",
+        "conclusion": "Conclusion",
+        "metadata": {"timestamp": "2026-01-01T00:00:00+00:00", "total_turns": 40},
+        "votes": [],
+        "transcript": [{"speaker": "expert", "content": "x" * 400}] * 40,
+    }
+
+
+class Command(BaseCommand):
+    """Fetch N discussions sequentially, then concurrently through the async API."""
+
+    help = (
+        "Start an in-memory fake S3 server with simulated latency and time N cold "
+        "get_discussion calls done sequentially vs. aget_discussion calls gathered on one event loop."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--count", type=int, default=200, help="Discussions to fetch.")
+        parser.add_argument("--latency-ms", type=float, default=50.0, help="Simulated S3 latency per request.")
+        parser.add_argument("--threads", type=int, default=256, help="PANEL_ASYNC_IO_THREADS and pool size.")
+
+    def handle(self, *_args, **options) -> None:
+        count = options["count"]
+        server = FakeS3Server().start()
+        os.environ["AWS_ENDPOINT_URL_S3"] = server.endpoint_url
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+        ids = [f"bench-{index:05d}" for index in range(count)]
+        try:
+            with override_settings(
+                PANEL_RESULTS_BUCKET=BUCKET,
+                PANEL_ASYNC_IO_THREADS=options["threads"],
+                AWS_MAX_POOL_CONNECTIONS=options["threads"],
+            ):
+                aws_clients.reset_clients()
+                self._seed(ids)
+                server.latency = options["latency_ms"] / 1000
+
+                sync_seconds = self._run_sync(ids)
+                async_seconds = self._run_async(ids)
+        finally:
+            PanelDiscussionObject.objects.filter(discussion_id__in=ids).delete()
+            aws_clients.reset_clients()
+            os.environ.pop("AWS_ENDPOINT_URL_S3", None)
+            server.stop()
+
+        self.stdout.write(f"sequential get_discussion: {sync_seconds:.2f}s for {count}")
+        self.stdout.write(f"gathered aget_discussion:  {async_seconds:.2f}s for {count}")
+        self.stdout.write(self.style.SUCCESS(f"speedup: {sync_seconds / async_seconds:.1f}x"))
+
+    def _seed(self, ids: list[str]) -> None:
+        service = PanelDiscussionService()
+        service.s3_client.create_bucket(Bucket=BUCKET)
+        entries = []
+        for index, discussion_id in enumerate(ids):
+            data = build_discussion(index)
+            key = service.discussion_key(data["country_code"], discussion_id)
+            service.s3_client.put_object(Bucket=BUCKET, Key=key, Body=json.dumps(data).encode("utf-8"))
+            entries.append({"discussion_id": discussion_id, "country_code": "JP", "s3_key": key})
+        service.index_discussions(entries)
+
+    def _fresh_service(self, ids: list[str]) -> PanelDiscussionService:
+        """A service with an empty local LRU and the benchmark keys dropped from the shared cache."""
+        service = PanelDiscussionService()
+        caches[service.cache.alias].delete_many([f"panel_discussion_{discussion_id}" for discussion_id in ids])
+        return service
+
+    def _run_sync(self, ids: list[str]) -> float:
+        service = self._fresh_service(ids)
+        started = time.perf_counter()
+        for discussion_id in ids:
+            assert service.get_discussion(discussion_id) is not None
+        return time.perf_counter() - started
+
+    def _run_async(self, ids: list[str]) -> float:
+        service = self._fresh_service(ids)
+
+        async def fetch_all():
+            return await asyncio.gather(*(service.aget_discussion(discussion_id) for discussion_id in ids))
+
+        started = time.perf_counter()
+        results = asyncio.run(fetch_all())
+        elapsed = time.perf_counter() - started
+        assert all(result is not None for result in results)
+        return elapsed
@@ -0,0 +1,112 @@
+"""Management command measuring the cost of agent traces and per-call clients in RAG chat."""
+from __future__ import annotations
+
+import os
+import time
+import tracemalloc
+import uuid
+from typing import Callable
+
+import boto3
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from apps.insights.services import aws_clients
+from apps.insights.services.rag_chat_service import RAGChatService
+
+
+class StubAgentRuntime:
+    """Local stand-in for bedrock-agent-runtime that streams canned completion events."""
+
+    def __init__(self, chunks: int, trace_events: int, trace_bytes: int):
+        self.chunks = chunks
+        self.trace_events = trace_events
+        self.trace_bytes = trace_bytes
+
+    def invoke_agent(self, **kwargs) -> dict:
+        return {"completion": self._events(kwargs.get("enableTrace", False))}
+
+    def _events(self, traced: bool):
+        for index in range(self.chunks):
+            if traced:
+                # Bedrock interleaves orchestration traces with the answer chunks.
+                for _ in range(self.trace_events // self.chunks):
+                    yield {"trace": self._trace(index)}
+            yield {"chunk": {"bytes": f"Answer part {index}. ".encode("utf-8")}}
+
+    def _trace(self, index: int) -> dict:
+        return {
+            "agentId": "stub",
+            "trace": {
+                "orchestrationTrace": {
+                    "modelInvocationInput": {"text": "x" * self.trace_bytes, "traceId": f"trace-{index}"},
+                }
+            },
+        }
+
+
+class Command(BaseCommand):
+    """Time chat() against a stub runtime with traces off and on, and client creation vs. reuse."""
+
+    help = (
+        "Run RAGChatService.chat against a local stub agent runtime with RAG_TRACE_MODE off and with "
+        "traces collected, and compare creating a bedrock-agent-runtime client per call with the shared client."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--calls", type=int, default=200, help="chat() calls per mode.")
+        parser.add_argument("--clients", type=int, default=20, help="Client creations to time.")
+        parser.add_argument("--chunks", type=int, default=20, help="Answer chunks per response.")
+        parser.add_argument("--trace-events", type=int, default=40, help="Trace events per traced response.")
+        parser.add_argument("--trace-bytes", type=int, default=2048, help="Payload size of each trace event.")
+
+    def handle(self, *_args, **options) -> None:
+        os.environ.setdefault("RAG_AGENT_ID", "benchmark")
+        stub = StubAgentRuntime(options["chunks"], options["trace_events"], options["trace_bytes"])
+        calls = options["calls"]
+
+        with override_settings(RAG_RESPONSE_CACHE_TTL=0, RAG_TRACE_MODE="off"):
+            service = RAGChatService()
+            service.bedrock_runtime = stub
+            untraced = self._measure(calls, lambda: service.chat("How is Japan?", str(uuid.uuid4())))
+
+        with override_settings(RAG_RESPONSE_CACHE_TTL=0, RAG_TRACE_MODE="debug", DEBUG=True):
+            service = RAGChatService()
+            service.bedrock_runtime = stub
+            traced = self._measure(calls, lambda: service.chat("How is Japan?", str(uuid.uuid4()), trace=True))
+
+        region = aws_clients.default_region()
+        per_call = self._measure(
+            options["clients"], lambda: boto3.session.Session().client("bedrock-agent-runtime", region_name=region)
+        )
+        aws_clients.get_client("bedrock-agent-runtime", region)
+        shared = self._measure(options["clients"], lambda: aws_clients.get_client("bedrock-agent-runtime", region))
+
+        self._report("chat, traces collected", traced)
+        self._report("chat, RAG_TRACE_MODE=off", untraced)
+        self._report("new client per call", per_call)
+        self._report("shared client", shared)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"traces off saves {traced[0] - untraced[0]:.3f} ms and {traced[1] - untraced[1]:.1f} KiB per chat; "
+                f"the shared client saves {per_call[0] - shared[0]:.3f} ms and {per_call[1] - shared[1]:.1f} KiB per call"
+            )
+        )
+
+    def _measure(self, count: int, call: Callable[[], object]) -> tuple[float, float]:
+        """Mean milliseconds per call and mean peak traced allocation (KiB) per call."""
+        started = time.perf_counter()
+        for _ in range(count):
+            call()
+        elapsed_ms = (time.perf_counter() - started) * 1000 / count
+
+        peaks = 0
+        for _ in range(min(count, 20)):
+            tracemalloc.start()
+            call()
+            peaks += tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return elapsed_ms, peaks / min(count, 20) / 1024
+
+    def _report(self, label: str, result: tuple[float, float]) -> None:
+        self.stdout.write(f"{label:<26} {result[0]:8.3f} ms/call  {result[1]:9.1f} KiB peak/call")
@@ -0,0 +1,53 @@
+"""Management command warming the panel listing and body caches."""
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.insights.services.panel_prefetch import prefetch_panels
+
+
+class Command(BaseCommand):
+    """Refresh ``list_discussions`` for every country and pre-warm the newest bodies."""
+
+    help = (
+        "Refresh cached panel listings for every Country.code and load the newest discussion "
+        "bodies. Runs once, or every --interval seconds. Needs a shared CACHE_URL (e.g. Redis): "
+        "a per-process cache would be warmed for this command only."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Repeat every N seconds (keep it below the 300s listing TTL).",
+        )
+
+    def handle(self, *_args, **options) -> None:
+        alias = getattr(settings, "PANEL_CACHE_ALIAS", "default")
+        if isinstance(caches[alias], (LocMemCache, DummyCache)):
+            raise CommandError(
+                f"The {alias!r} cache is local to this process, so the web workers would never see "
+                "what it warms. Point CACHE_URL at a shared cache (e.g. redis://...)."
+            )
+
+        interval = options["interval"]
+        while True:
+            started = time.monotonic()
+            stats = prefetch_panels()
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Refreshed {stats['listings']} listings and {stats['bodies']} bodies "
+                    f"in {elapsed:.1f}s ({stats['failures']} failures)."
+                )
+            )
+            if not interval:
+                return
+            time.sleep(max(0.0, interval - elapsed))
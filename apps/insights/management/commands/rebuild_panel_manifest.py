@@ -0,0 +1,41 @@
+"""Management command rebuilding the panel discussion manifests in S3."""
+from __future__ import annotations
+
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from apps.insights.services.panel_discussion_service import PanelDiscussionService
+from apps.insights.snapshots import PANEL_DATA_VERSION_KEY, bump_data_version
+
+
+class Command(BaseCommand):
+    """List and HEAD every stored discussion, then write the manifests and key index."""
+
+    help = (
+        "Rebuild discussions/_manifest.json, the per-country manifests and the "
+        "discussion key index from the S3 listing."
+    )
+
+    def handle(self, *_args, **_options) -> None:
+        service = PanelDiscussionService()
+        discussions = service.scan_discussions()
+
+        # Group by the key's country folder, which is what list_discussions filters on.
+        by_country = defaultdict(list)
+        for discussion in discussions:
+            parts = discussion["s3_key"].split("/")
+            if len(parts) > 2:
+                by_country[parts[1]].append(discussion)
+
+        service.write_manifest(discussions)
+        service.index_discussions(discussions)
+        for country_code, entries in by_country.items():
+            service.write_manifest(entries, country_code)
+        bump_data_version(PANEL_DATA_VERSION_KEY)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote manifests for {len(discussions)} discussions across {len(by_country)} countries."
+            )
+        )
@@ -0,0 +1,38 @@
+"""Management command replaying stored discussions into the rolling trend table."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.insights.models import PanelCountryTrend
+from apps.insights.services.panel_discussion_service import PanelDiscussionService
+from apps.insights.trends import apply_discussion
+
+
+class Command(BaseCommand):
+    """Rebuild ``PanelCountryTrend`` from the manifest (or a full S3 scan) in time order."""
+
+    help = "Recompute the rolling panel trends of every country from the stored discussions."
+
+    def handle(self, *_args, **_options) -> None:
+        service = PanelDiscussionService()
+        discussions = service.read_manifest()
+        if discussions is None:
+            discussions = service.scan_discussions()
+
+        trends = {}
+        for entry in sorted(discussions, key=lambda item: item["timestamp"]):
+            trend = trends.get(entry["country_code"])
+            if trend is None:
+                trend = trends[entry["country_code"]] = PanelCountryTrend(
+                    country_code=entry["country_code"]
+                )
+            apply_discussion(trend, entry)
+
+        with transaction.atomic():
+            PanelCountryTrend.objects.all().delete()
+            PanelCountryTrend.objects.bulk_create(trends.values())
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt trends for {len(trends)} countries from {len(discussions)} discussions.")
+        )
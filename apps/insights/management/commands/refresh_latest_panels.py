@@ -0,0 +1,55 @@
+"""Management command rebuilding the latest-panel-per-country summary table."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.insights.models import PanelLatestDiscussion
+from apps.insights.queries import latest_panel_discussions
+
+SUMMARY_FIELDS = [
+    "discussion_id",
+    "topic",
+    "final_mood",
+    "final_score",
+    "discussion_date",
+    "created_at",
+    "updated_at",
+    "refreshed_at",
+]
+
+
+class Command(BaseCommand):
+    """Upsert the newest discussion of every country into ``PanelLatestDiscussion``."""
+
+    help = "Refresh the latest panel discussion per country (run after each panel ingest)."
+
+    def handle(self, *_args, **_options) -> None:
+        rows = [
+            PanelLatestDiscussion(
+                country_code=discussion.country_code,
+                discussion_id=discussion.pk,
+                topic=discussion.topic,
+                final_mood=discussion.final_mood,
+                final_score=discussion.final_score,
+                discussion_date=discussion.discussion_date,
+                created_at=discussion.created_at,
+                updated_at=discussion.updated_at,
+            )
+            for discussion in latest_panel_discussions()
+        ]
+
+        with transaction.atomic():
+            PanelLatestDiscussion.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["country_code"],
+                update_fields=SUMMARY_FIELDS,
+            )
+            stale = PanelLatestDiscussion.objects.exclude(
+                country_code__in=[row.country_code for row in rows]
+            ).delete()[0]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {len(rows)} countries; removed {stale} stale rows.")
+        )
@@ -14,6 +14,7 @@ from apps.insights.models import (
     CountrySummary,
     CountryWeather,
 )
+from apps.insights.snapshots import bump_data_version
 
 
 class Command(BaseCommand):
@@ -87,4 +88,6 @@ class Command(BaseCommand):
                     ]
                 )
 
+        # bulk_create skips post_save, so invalidate snapshots explicitly.
+        bump_data_version()
         self.stdout.write(self.style.SUCCESS("Demo insights data loaded."))
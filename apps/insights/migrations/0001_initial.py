@@ -0,0 +1,277 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="PanelDiscussion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("country_code", models.CharField(max_length=10)),
+                ("topic", models.TextField()),
+                (
+                    "final_mood",
+                    models.CharField(
+                        choices=[
+                            ("happy", "Happy"),
+                            ("neutral", "Neutral"),
+                            ("sad", "Sad"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("final_score", models.DecimalField(decimal_places=2, max_digits=5)),
+                ("introduction", models.TextField(blank=True, null=True)),
+                ("conclusion", models.TextField(blank=True, null=True)),
+                ("discussion_date", models.DateField()),
+                ("total_turns", models.IntegerField(null=True)),
+                ("debate_rounds", models.IntegerField(null=True)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField(null=True)),
+            ],
+            options={
+                "db_table": "panel_discussions",
+                "ordering": ["-discussion_date", "-id"],
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="PanelExpertAnalysis",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("expert_role", models.CharField(max_length=50)),
+                ("analysis_text", models.TextField()),
+                ("round_number", models.IntegerField()),
+                ("created_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "panel_expert_analyses",
+                "ordering": ["round_number", "id"],
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="PanelTranscript",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("speaker", models.CharField(max_length=50)),
+                ("content", models.TextField()),
+                ("round_number", models.IntegerField(null=True)),
+                ("turn_order", models.IntegerField()),
+                ("created_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "panel_transcripts",
+                "ordering": ["turn_order"],
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="PanelVote",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("expert_role", models.CharField(max_length=50)),
+                ("vote_mood", models.CharField(max_length=20)),
+                ("confidence", models.DecimalField(decimal_places=2, max_digits=5)),
+                ("reasoning", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "panel_votes",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Country",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("code", models.CharField(max_length=8, unique=True)),
+                ("name", models.CharField(max_length=128)),
+                ("latitude", models.DecimalField(decimal_places=5, max_digits=8)),
+                ("longitude", models.DecimalField(decimal_places=5, max_digits=8)),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="CountryWeather",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("condition", models.CharField(max_length=128)),
+                ("temperature", models.SmallIntegerField()),
+                ("feels_like", models.SmallIntegerField()),
+                ("humidity", models.PositiveSmallIntegerField()),
+                ("wind", models.CharField(max_length=64)),
+                ("precipitation_chance", models.PositiveSmallIntegerField()),
+                (
+                    "country",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="weather",
+                        to="insights.country",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Country weather",
+                "verbose_name_plural": "Country weather",
+            },
+        ),
+        migrations.CreateModel(
+            name="CountrySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("headline", models.CharField(max_length=255)),
+                ("weather", models.CharField(max_length=255)),
+                ("persona", models.CharField(max_length=255)),
+                ("mood_narrative", models.TextField()),
+                ("today_summary", models.TextField()),
+                (
+                    "country",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="summary",
+                        to="insights.country",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Country summary",
+                "verbose_name_plural": "Country summaries",
+            },
+        ),
+        migrations.CreateModel(
+            name="CountrySentiment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("label", models.CharField(max_length=32)),
+                ("recorded_date", models.DateField(blank=True, null=True)),
+                ("score", models.PositiveSmallIntegerField()),
+                (
+                    "country",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sentiments",
+                        to="insights.country",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["recorded_date", "id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="CountryNewsItem",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("summary", models.TextField()),
+                ("url", models.URLField(max_length=500)),
+                ("category", models.CharField(max_length=64)),
+                (
+                    "tone",
+                    models.CharField(
+                        choices=[
+                            ("celebratory", "Celebratory"),
+                            ("optimistic", "Optimistic"),
+                            ("cautious", "Cautious"),
+                            ("urgent", "Urgent"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "country",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="news_items",
+                        to="insights.country",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insights", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="countrynewsitem",
+            index=models.Index(
+                fields=["country", "id"], name="insights_news_country_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="countrysentiment",
+            index=models.Index(
+                fields=["country", "recorded_date", "id"],
+                name="insights_sentiment_series_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insights", "0002_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PanelLatestDiscussion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("country_code", models.CharField(max_length=10, unique=True)),
+                ("discussion_id", models.BigIntegerField()),
+                ("topic", models.TextField()),
+                (
+                    "final_mood",
+                    models.CharField(
+                        choices=[
+                            ("happy", "Happy"),
+                            ("neutral", "Neutral"),
+                            ("sad", "Sad"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("final_score", models.DecimalField(decimal_places=2, max_digits=5)),
+                ("discussion_date", models.DateField()),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField(null=True)),
+                ("refreshed_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Latest panel discussion",
+                "ordering": ["country_code"],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insights", "0003_panel_latest_discussion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PanelDiscussionObject",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("discussion_id", models.CharField(max_length=128, unique=True)),
+                ("country_code", models.CharField(blank=True, max_length=10)),
+                ("s3_key", models.CharField(max_length=1024)),
+                ("indexed_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Panel discussion object",
+            },
+        ),
+    ]
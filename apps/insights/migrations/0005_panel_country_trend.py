@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insights", "0004_panel_discussion_object"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PanelCountryTrend",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("country_code", models.CharField(max_length=10, unique=True)),
+                ("discussion_count", models.PositiveIntegerField(default=0)),
+                ("last_discussion_id", models.CharField(blank=True, max_length=128)),
+                ("last_timestamp", models.CharField(blank=True, max_length=64)),
+                ("last_score", models.FloatField(null=True)),
+                ("last_mood", models.CharField(blank=True, max_length=20)),
+                ("score_stats", models.JSONField(default=dict)),
+                ("mood_transitions", models.JSONField(default=dict)),
+                ("mood_streak", models.PositiveIntegerField(default=0)),
+                ("score_streak", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Panel country trend",
+                "ordering": ["country_code"],
+            },
+        ),
+    ]
@@ -78,6 +78,13 @@ class CountrySentiment(models.Model):
 
     class Meta:
         ordering = ["recorded_date", "id"]
+        indexes = [
+            # Per-country series in chart order, also serving ?from=&to= range scans.
+            models.Index(
+                fields=["country", "recorded_date", "id"],
+                name="insights_sentiment_series_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         if self.label:
@@ -107,6 +114,9 @@ class CountryNewsItem(models.Model):
 
     class Meta:
         ordering = ["id"]
+        indexes = [
+            models.Index(fields=["country", "id"], name="insights_news_country_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.country.code.upper()} news: {self.title}"
@@ -123,6 +133,13 @@ class PanelDiscussion(models.Model):
         managed = False  # Django does not manage this table
         db_table = 'panel_discussions'
         ordering = ['-discussion_date', '-id']
+        # Unmanaged tables: these indexes ship as apps/insights/sql/panel_indexes.sql.
+        indexes = [
+            models.Index(
+                fields=['country_code', '-discussion_date', '-id'],
+                name='panel_disc_country_latest_idx',
+            ),
+        ]
 
     class MoodChoices(models.TextChoices):
         HAPPY = 'happy', 'Happy'
@@ -152,6 +169,12 @@ class PanelExpertAnalysis(models.Model):
         managed = False
         db_table = 'panel_expert_analyses'
         ordering = ['round_number', 'id']
+        indexes = [
+            models.Index(
+                fields=['discussion', 'round_number', 'id'],
+                name='panel_analysis_disc_round_idx',
+            ),
+        ]
 
     discussion = models.ForeignKey(
         PanelDiscussion,
@@ -173,6 +196,9 @@ class PanelVote(models.Model):
     class Meta:
         managed = False
         db_table = 'panel_votes'
+        indexes = [
+            models.Index(fields=['discussion', 'id'], name='panel_vote_discussion_idx'),
+        ]
 
     discussion = models.ForeignKey(
         PanelDiscussion,
@@ -196,6 +222,12 @@ class PanelTranscript(models.Model):
         managed = False
         db_table = 'panel_transcripts'
         ordering = ['turn_order']
+        indexes = [
+            models.Index(
+                fields=['discussion', 'turn_order'],
+                name='panel_transcript_disc_turn_idx',
+            ),
+        ]
 
     discussion = models.ForeignKey(
         PanelDiscussion,
@@ -210,3 +242,78 @@ class PanelTranscript(models.Model):
 
     def __str__(self) -> str:
         return f"{self.speaker} (Turn {self.turn_order})"
+
+
+class PanelLatestDiscussion(models.Model):
+    """Latest panel discussion per country, refreshed by ``refresh_latest_panels``."""
+
+    country_code = models.CharField(max_length=10, unique=True)
+    discussion_id = models.BigIntegerField()
+    topic = models.TextField()
+    final_mood = models.CharField(max_length=20, choices=PanelDiscussion.MoodChoices.choices)
+    final_score = models.DecimalField(max_digits=5, decimal_places=2)
+    discussion_date = models.DateField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField(null=True)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["country_code"]
+        verbose_name = "Latest panel discussion"
+
+    def __str__(self) -> str:
+        return f"{self.country_code} latest: {self.discussion_id}"
+
+
+class PanelDiscussionObject(models.Model):
+    """Location of a stored panel discussion in S3, keyed by discussion ID."""
+
+    discussion_id = models.CharField(max_length=128, unique=True)
+    country_code = models.CharField(max_length=10, blank=True)
+    s3_key = models.CharField(max_length=1024)
+    indexed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Panel discussion object"
+
+    def __str__(self) -> str:
+        return f"{self.discussion_id} -> {self.s3_key}"
+
+
+class PanelCountryTrend(models.Model):
+    """Rolling panel score and mood statistics per country, updated per discussion."""
+
+    country_code = models.CharField(max_length=10, unique=True)
+    discussion_count = models.PositiveIntegerField(default=0)
+    last_discussion_id = models.CharField(max_length=128, blank=True)
+    last_timestamp = models.CharField(max_length=64, blank=True)
+    last_score = models.FloatField(null=True)
+    last_mood = models.CharField(max_length=20, blank=True)
+    # {"<window>": [ema, ew_variance]} for every window in apps.insights.trends.TREND_WINDOWS
+    score_stats = models.JSONField(default=dict)
+    # {"<from>-><to>": count}
+    mood_transitions = models.JSONField(default=dict)
+    mood_streak = models.PositiveIntegerField(default=0)
+    # Consecutive score moves in one direction: positive up, negative down
+    score_streak = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["country_code"]
+        verbose_name = "Panel country trend"
+
+    def __str__(self) -> str:
+        return f"{self.country_code} trend over {self.discussion_count} discussions"
+
+
+class DataVersion(models.Model):
+    """Invalidation counter shared by every process, e.g. for the country snapshots."""
+
+    key = models.CharField(max_length=64, unique=True)
+    version = models.BigIntegerField()
+
+    class Meta:
+        verbose_name = "Data version"
+
+    def __str__(self) -> str:
+        return f"{self.key} v{self.version}"
@@ -0,0 +1,18 @@
+"""Pagination classes for insights APIs."""
+from __future__ import annotations
+
+from rest_framework.pagination import CursorPagination
+
+
+class CountryCursorPagination(CursorPagination):
+    """
+    Opt-in cursor pagination for countries.
+
+    Responses stay a plain list unless ``?page_size=`` is given, so existing
+    clients are unaffected.
+    """
+
+    ordering = ("name", "id")
+    page_size = None
+    page_size_query_param = "page_size"
+    max_page_size = 500
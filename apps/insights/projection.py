@@ -0,0 +1,125 @@
+"""Field projection for the country payload (``?fields=`` / ``?include=``)."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Optional, Tuple
+
+from django.db.models import Prefetch, QuerySet
+from rest_framework.exceptions import ValidationError
+
+from .models import Country
+
+COUNTRY_FIELDS = ("code", "name", "lat", "lng", "summary", "insights")
+INSIGHT_FIELDS = ("sentiment", "news", "weatherNow", "moodNarrative", "todaySummary")
+
+# Model columns backing the scalar top-level fields.
+SCALAR_COLUMNS = {"code": "code", "name": "name", "lat": "latitude", "lng": "longitude"}
+
+
+def _parse(raw: Optional[str], allowed: Tuple[str, ...], param: str) -> Tuple[str, ...]:
+    """Parse a comma-separated selection, keeping the canonical field order."""
+    if raw is None:
+        return allowed
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise ValidationError(
+            {
+                param: [
+                    f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                    f"Choose from {', '.join(allowed)}."
+                ]
+            }
+        )
+    return tuple(name for name in allowed if name in requested)
+
+
+@dataclass(frozen=True)
+class CountryProjection:
+    """
+    Selected top-level fields and insight blocks.
+
+    ``fields`` picks top-level keys of each country; ``include`` picks which
+    blocks appear inside ``insights``. Omitting either selects everything.
+    """
+
+    fields: Tuple[str, ...] = COUNTRY_FIELDS
+    insights: Tuple[str, ...] = INSIGHT_FIELDS
+
+    @classmethod
+    def from_query_params(cls, params: Mapping[str, str]) -> "CountryProjection":
+        """Build a projection from request query parameters."""
+        return cls(
+            fields=_parse(params.get("fields"), COUNTRY_FIELDS, "fields"),
+            insights=_parse(params.get("include"), INSIGHT_FIELDS, "include"),
+        )
+
+    @property
+    def is_full(self) -> bool:
+        return self.fields == COUNTRY_FIELDS and self.insights == INSIGHT_FIELDS
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used in snapshot cache keys; empty when full."""
+        if self.is_full:
+            return ""
+        return f"f={','.join(self.fields)};i={','.join(self.insights)}"
+
+    def includes_insight(self, name: str) -> bool:
+        return "insights" in self.fields and name in self.insights
+
+    @property
+    def needs_summary(self) -> bool:
+        return (
+            "summary" in self.fields
+            or self.includes_insight("moodNarrative")
+            or self.includes_insight("todaySummary")
+        )
+
+    @property
+    def needs_weather(self) -> bool:
+        return self.includes_insight("weatherNow")
+
+    @property
+    def needs_sentiments(self) -> bool:
+        return self.includes_insight("sentiment")
+
+    @property
+    def needs_news(self) -> bool:
+        return self.includes_insight("news")
+
+    def apply(
+        self, queryset: QuerySet[Country], sentiments: Optional[QuerySet] = None
+    ) -> QuerySet[Country]:
+        """
+        Restrict joins, prefetches and columns to what the projection renders.
+
+        ``sentiments`` optionally replaces the queryset used to prefetch the
+        sentiment series (e.g. a date-bounded one).
+        """
+        queryset = queryset.select_related(None).prefetch_related(None)
+        related = []
+        if self.needs_summary:
+            related.append("summary")
+        if self.needs_weather:
+            related.append("weather")
+        prefetch = []
+        if self.needs_sentiments:
+            prefetch.append(
+                "sentiments" if sentiments is None else Prefetch("sentiments", queryset=sentiments)
+            )
+        if self.needs_news:
+            prefetch.append("news_items")
+
+        if related:
+            queryset = queryset.select_related(*related)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if not related and not prefetch:
+            # "name" is the ordering/cursor column, so keep it loaded.
+            columns = {SCALAR_COLUMNS[name] for name in self.fields if name in SCALAR_COLUMNS}
+            queryset = queryset.only("id", "name", *sorted(columns))
+        return queryset
+
+
+FULL_PROJECTION = CountryProjection()
@@ -0,0 +1,170 @@
+"""
+Flat query plans for the country payload and panel lookups.
+
+``country_list_payload`` builds the same structure as ``CountrySerializer`` from
+at most three queries (countries joined to summary and weather, then
+sentiments, then news) grouped in Python, so no model instances are created.
+Queries for blocks excluded by the projection are skipped.
+Select it with ``INSIGHTS_COUNTRY_QUERY_PLAN = "values"``.
+
+``latest_panel_discussions`` resolves the newest discussion of every country
+(or of a given set of codes) in one window-function query.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db.models import F, QuerySet, Window
+from django.db.models.functions import RowNumber
+
+from .models import Country, CountryNewsItem, CountrySentiment, PanelDiscussion
+from .projection import FULL_PROJECTION, SCALAR_COLUMNS, CountryProjection
+from .sentiment import DEFAULT_WINDOW, SentimentWindow
+
+SUMMARY_COLUMNS = (
+    "summary__id",
+    "summary__headline",
+    "summary__weather",
+    "summary__persona",
+    "summary__mood_narrative",
+    "summary__today_summary",
+)
+WEATHER_COLUMNS = (
+    "weather__id",
+    "weather__condition",
+    "weather__temperature",
+    "weather__feels_like",
+    "weather__humidity",
+    "weather__wind",
+    "weather__precipitation_chance",
+)
+SENTIMENT_COLUMNS = ("country_id", "label", "recorded_date", "score")
+NEWS_COLUMNS = ("country_id", "title", "summary", "url", "category", "tone")
+
+
+def _sentiment_date(label: str, recorded_date) -> str:
+    if label:
+        return label
+    if recorded_date:
+        return recorded_date.isoformat()
+    return ""
+
+
+def sentiment_series(
+    queryset: QuerySet[CountrySentiment], window: SentimentWindow = DEFAULT_WINDOW
+) -> Dict[int, List[Dict[str, Any]]]:
+    """Group serialized sentiment points by country id, downsampled to ``window``."""
+    rows: Dict[int, List[tuple]] = defaultdict(list)
+    for row in queryset.values_list(*SENTIMENT_COLUMNS):
+        rows[row[0]].append(row)
+    series = {}
+    for country_id, points in rows.items():
+        if window.points is not None:
+            points = window.downsample(points, itemgetter(2), itemgetter(3))
+        series[country_id] = [
+            {"date": _sentiment_date(label, recorded_date), "score": score}
+            for _country_id, label, recorded_date, score in points
+        ]
+    return series
+
+
+def _weather(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if row["weather__id"] is None:
+        return None
+    return {
+        "condition": row["weather__condition"],
+        "temperature": row["weather__temperature"],
+        "feelsLike": row["weather__feels_like"],
+        "humidity": row["weather__humidity"],
+        "wind": row["weather__wind"],
+        "precipitationChance": row["weather__precipitation_chance"],
+    }
+
+
+def country_list_payload(
+    countries: QuerySet[Country] | None = None,
+    projection: CountryProjection = FULL_PROJECTION,
+    window: SentimentWindow = DEFAULT_WINDOW,
+) -> List[Dict[str, Any]]:
+    """Return the serialized country list using at most three queries."""
+    if countries is None:
+        countries = Country.objects.all()
+    countries = countries.select_related(None).prefetch_related(None)
+    country_ids = countries.values("id")
+
+    sentiments: Dict[int, List[Dict[str, Any]]] = {}
+    if projection.needs_sentiments:
+        sentiments = sentiment_series(
+            window.filter(CountrySentiment.objects.filter(country_id__in=country_ids)), window
+        )
+
+    news: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    if projection.needs_news:
+        for country_id, title, summary, url, category, tone in CountryNewsItem.objects.filter(
+            country_id__in=country_ids
+        ).values_list(*NEWS_COLUMNS):
+            news[country_id].append(
+                {"title": title, "summary": summary, "url": url, "category": category, "tone": tone}
+            )
+
+    columns = ["id", *(SCALAR_COLUMNS[name] for name in projection.fields if name in SCALAR_COLUMNS)]
+    if projection.needs_summary:
+        columns.extend(SUMMARY_COLUMNS)
+    if projection.needs_weather:
+        columns.extend(WEATHER_COLUMNS)
+
+    payload = []
+    for row in countries.values(*columns):
+        has_summary = projection.needs_summary and row["summary__id"] is not None
+        data: Dict[str, Any] = {}
+        for name in projection.fields:
+            if name in ("code", "name"):
+                data[name] = row[name]
+            elif name in ("lat", "lng"):
+                data[name] = float(row[SCALAR_COLUMNS[name]])
+            elif name == "summary":
+                data["summary"] = (
+                    {
+                        "headline": row["summary__headline"],
+                        "weather": row["summary__weather"],
+                        "persona": row["summary__persona"],
+                    }
+                    if has_summary
+                    else None
+                )
+            elif name == "insights":
+                insights: Dict[str, Any] = {}
+                for block in projection.insights:
+                    if block == "sentiment":
+                        insights["sentiment"] = sentiments.get(row["id"], [])
+                    elif block == "news":
+                        insights["news"] = news.get(row["id"], [])
+                    elif block == "weatherNow":
+                        insights["weatherNow"] = _weather(row)
+                    elif block == "moodNarrative":
+                        insights["moodNarrative"] = (
+                            row["summary__mood_narrative"] if has_summary else None
+                        )
+                    elif block == "todaySummary":
+                        insights["todaySummary"] = (
+                            row["summary__today_summary"] if has_summary else None
+                        )
+                data["insights"] = insights
+        payload.append(data)
+    return payload
+
+
+def latest_panel_discussions(codes: Optional[Iterable[str]] = None) -> QuerySet[PanelDiscussion]:
+    """Latest discussion per ``country_code`` (by discussion_date, then id) in one query."""
+    queryset = PanelDiscussion.objects.all()
+    if codes is not None:
+        queryset = queryset.filter(country_code__in=list(codes))
+    return queryset.annotate(
+        recency=Window(
+            RowNumber(),
+            partition_by=[F("country_code")],
+            order_by=[F("discussion_date").desc(), F("id").desc()],
+        )
+    ).filter(recency=1)
@@ -0,0 +1,150 @@
+"""Time-bounded, downsampled sentiment series (``?from=&to=&points=``)."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
+
+from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+
+MIN_POINTS = 2
+MAX_POINTS = 5000
+
+
+def lttb(series: Sequence[Tuple[float, float]], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of at most ``threshold`` points of ``series`` (sorted
+    by x) that best preserve its visual shape. The first and last points are
+    always kept.
+    """
+    size = len(series)
+    if threshold >= size:
+        return list(range(size))
+    if threshold <= 2:
+        return [0, size - 1][:max(threshold, 0)]
+
+    selected = [0]
+    bucket = (size - 2) / (threshold - 2)
+    anchor = 0
+    for index in range(threshold - 2):
+        # Average of the next bucket is the third vertex of the triangle.
+        next_start = int((index + 1) * bucket) + 1
+        next_end = min(int((index + 2) * bucket) + 1, size)
+        next_points = series[next_start:next_end]
+        avg_x = sum(point[0] for point in next_points) / len(next_points)
+        avg_y = sum(point[1] for point in next_points) / len(next_points)
+
+        anchor_x, anchor_y = series[anchor]
+        best_area = -1.0
+        best = int(index * bucket) + 1
+        for candidate in range(int(index * bucket) + 1, int((index + 1) * bucket) + 1):
+            x, y = series[candidate]
+            area = abs((anchor_x - avg_x) * (y - anchor_y) - (anchor_x - x) * (avg_y - anchor_y))
+            if area > best_area:
+                best_area = area
+                best = candidate
+        selected.append(best)
+        anchor = best
+    selected.append(size - 1)
+    return selected
+
+
+def _parse_date(raw: Optional[str], param: str) -> Optional[date]:
+    if not raw:
+        return None
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        raise ValidationError({param: ["Use an ISO date (YYYY-MM-DD)."]}) from None
+
+
+def _parse_points(raw: Optional[str]) -> Optional[int]:
+    if not raw:
+        return None
+    try:
+        points = int(raw)
+    except ValueError:
+        points = 0
+    if not MIN_POINTS <= points <= MAX_POINTS:
+        raise ValidationError(
+            {"points": [f"Must be an integer between {MIN_POINTS} and {MAX_POINTS}."]}
+        )
+    return points
+
+
+@dataclass(frozen=True)
+class SentimentWindow:
+    """
+    Date bounds and target size for a sentiment series.
+
+    ``start``/``end`` filter on ``recorded_date`` in SQL (undated points are
+    excluded once either bound is set); ``points`` caps the series length
+    using LTTB.
+    """
+
+    start: Optional[date] = None
+    end: Optional[date] = None
+    points: Optional[int] = None
+
+    @classmethod
+    def from_query_params(cls, params: Mapping[str, str]) -> "SentimentWindow":
+        """Build a window from ``from``, ``to`` and ``points`` query parameters."""
+        window = cls(
+            start=_parse_date(params.get("from"), "from"),
+            end=_parse_date(params.get("to"), "to"),
+            points=_parse_points(params.get("points")),
+        )
+        if window.start and window.end and window.start > window.end:
+            raise ValidationError({"from": ["Must not be after 'to'."]})
+        return window
+
+    @property
+    def is_bounded(self) -> bool:
+        return self.start is not None or self.end is not None
+
+    @property
+    def is_default(self) -> bool:
+        return not self.is_bounded and self.points is None
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used in snapshot cache keys; empty by default."""
+        if self.is_default:
+            return ""
+        return f"from={self.start or ''};to={self.end or ''};n={self.points or ''}"
+
+    def filter(self, queryset: QuerySet) -> QuerySet:
+        """Apply the date bounds to a ``CountrySentiment`` queryset."""
+        if self.start is not None:
+            queryset = queryset.filter(recorded_date__gte=self.start)
+        if self.end is not None:
+            queryset = queryset.filter(recorded_date__lte=self.end)
+        return queryset
+
+    def downsample(
+        self,
+        rows: Sequence[Any],
+        recorded_date: Callable[[Any], Optional[date]],
+        score: Callable[[Any], int],
+    ) -> Sequence[Any]:
+        """
+        Reduce ordered ``rows`` to at most ``points`` entries.
+
+        Points are placed on the date axis when every row is dated and on
+        their index otherwise (e.g. the labelled demo series).
+        """
+        if self.points is None or len(rows) <= self.points:
+            return rows
+        dates = [recorded_date(row) for row in rows]
+        if all(dates):
+            xs = [value.toordinal() for value in dates]
+        else:
+            xs = list(range(len(rows)))
+        series = [(x, score(row)) for x, row in zip(xs, rows)]
+        return [rows[index] for index in lttb(series, self.points)]
+
+
+DEFAULT_WINDOW = SentimentWindow()
@@ -1,6 +1,9 @@
 """Serializers for insights app."""
 from __future__ import annotations
 
+from operator import attrgetter
+
+from django.db import models
 from rest_framework import serializers
 
 from .models import (
@@ -11,11 +14,25 @@ from .models import (
     CountryWeather,
     PanelDiscussion,
     PanelExpertAnalysis,
+    PanelLatestDiscussion,
     PanelVote,
     PanelTranscript,
 )
 
 
+class CountrySentimentListSerializer(serializers.ListSerializer):
+    """Downsample the series to the ``sentiment_window`` context entry, if any."""
+
+    def to_representation(self, data):
+        points = data.all() if isinstance(data, models.manager.BaseManager) else data
+        window = self.context.get("sentiment_window")
+        if window is not None:
+            points = window.downsample(
+                list(points), attrgetter("recorded_date"), attrgetter("score")
+            )
+        return [self.child.to_representation(point) for point in points]
+
+
 class CountrySentimentSerializer(serializers.ModelSerializer):
     """Serialize sentiment points for the chart."""
 
@@ -24,6 +41,7 @@ class CountrySentimentSerializer(serializers.ModelSerializer):
     class Meta:
         model = CountrySentiment
         fields = ["date", "score"]
+        list_serializer_class = CountrySentimentListSerializer
 
     def get_date(self, obj: CountrySentiment) -> str:
         """Return a label or ISO date for the point."""
@@ -69,6 +87,15 @@ class CountryInsightsSerializer(serializers.Serializer):
     moodNarrative = serializers.CharField(source="summary.mood_narrative")
     todaySummary = serializers.CharField(source="summary.today_summary")
 
+    def get_fields(self):
+        """Drop insight blocks excluded by the ``projection`` context entry."""
+        fields = super().get_fields()
+        projection = self.context.get("projection")
+        if projection is not None:
+            for name in set(fields).difference(projection.insights):
+                fields.pop(name)
+        return fields
+
 
 class CountrySummarySerializer(serializers.ModelSerializer):
     """Serialize the summary block for a country."""
@@ -90,6 +117,15 @@ class CountrySerializer(serializers.ModelSerializer):
         model = Country
         fields = ["code", "name", "lat", "lng", "summary", "insights"]
 
+    def get_fields(self):
+        """Drop top-level fields excluded by the ``projection`` context entry."""
+        fields = super().get_fields()
+        projection = self.context.get("projection")
+        if projection is not None:
+            for name in set(fields).difference(projection.fields):
+                fields.pop(name)
+        return fields
+
 
 # ============================================================================
 # Panel Discussion Serializers
@@ -145,6 +181,13 @@ class PanelDiscussionSerializer(serializers.ModelSerializer):
             "transcripts",
         ]
 
+    def get_fields(self):
+        """Omit transcripts when the context sets ``include_transcripts`` to False"""
+        fields = super().get_fields()
+        if not self.context.get("include_transcripts", True):
+            fields.pop("transcripts")
+        return fields
+
 
 class PanelDiscussionListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for listing discussions"""
@@ -160,3 +203,20 @@ class PanelDiscussionListSerializer(serializers.ModelSerializer):
             "discussion_date",
             "created_at",
         ]
+
+
+class PanelLatestDiscussionSerializer(serializers.ModelSerializer):
+    """Serialize headline fields of a country's latest discussion"""
+
+    class Meta:
+        model = PanelLatestDiscussion
+        fields = [
+            "country_code",
+            "discussion_id",
+            "topic",
+            "final_mood",
+            "final_score",
+            "discussion_date",
+            "created_at",
+            "updated_at",
+        ]
@@ -0,0 +1,93 @@
+"""
+AWS Client Registry
+Process-wide, thread-safe boto3 clients with a tuned connection pool
+"""
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+
+_clients: Dict[Tuple[str, str], object] = {}
+_lock = threading.Lock()
+
+
+def client_config() -> Config:
+    """
+    botocore Config shared by every client
+
+    Returns:
+        Config with pool size, keep-alive, retry and timeout settings
+    """
+    return Config(
+        max_pool_connections=getattr(settings, 'AWS_MAX_POOL_CONNECTIONS', 32),
+        tcp_keepalive=True,
+        connect_timeout=getattr(settings, 'AWS_CONNECT_TIMEOUT', 2),
+        read_timeout=getattr(settings, 'AWS_READ_TIMEOUT', 60),
+        retries={
+            'mode': 'adaptive',
+            'total_max_attempts': getattr(settings, 'AWS_MAX_ATTEMPTS', 4)
+        }
+    )
+
+
+def default_region() -> str:
+    """Region of every client and Bedrock ARN (AWS_REGION)"""
+    return getattr(settings, 'AWS_REGION', 'ap-northeast-1')
+
+
+def get_client(service_name: str, region_name: Optional[str] = None):
+    """
+    Get the shared client for a service and region
+
+    boto3 clients are thread-safe, so one instance (and its connection
+    pool) serves every request thread in the process. Creation goes
+    through a dedicated Session because the default session is not.
+
+    Args:
+        service_name: boto3 service name (e.g. 's3')
+        region_name: AWS region (default: AWS_REGION)
+
+    Returns:
+        boto3 client
+    """
+    key = (service_name, region_name or default_region())
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = boto3.session.Session().client(
+                service_name,
+                region_name=key[1],
+                config=client_config()
+            )
+            _clients[key] = client
+    return client
+
+
+def warm_up(service_names: Optional[Iterable[str]] = None):
+    """
+    Create clients ahead of the first request
+
+    Called from the WSGI/ASGI entry points so credential and endpoint
+    resolution happens at worker start instead of on a user request.
+
+    Args:
+        service_names: Services to create (default: AWS_WARM_UP_CLIENTS)
+    """
+    if service_names is None:
+        service_names = getattr(settings, 'AWS_WARM_UP_CLIENTS', ['s3', 'bedrock-agent-runtime'])
+
+    for service_name in service_names:
+        get_client(service_name)
+
+
+def reset_clients():
+    """Drop every cached client (e.g. after changing credentials in tests)"""
+    with _lock:
+        _clients.clear()
@@ -0,0 +1,116 @@
+"""
+Circuit Breaker
+Shared failure counting and backoff so an unhealthy dependency is not
+hammered by every worker
+"""
+
+import logging
+from typing import Any, Callable
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} is unavailable; retry in {int(retry_after)}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Open a circuit after repeated failures, for every process
+
+    Failures are counted in the shared cache within `window` seconds.
+    Reaching `threshold` opens the circuit for `backoff` seconds, during
+    which calls raise CircuitOpenError without touching the dependency.
+    The first failure after the backoff reopens it straight away.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int = 5,
+        window: float = 30,
+        backoff: float = 30,
+        alias: str = 'default'
+    ):
+        self.name = name
+        self.threshold = threshold
+        self.window = window
+        self.backoff = backoff
+        self.alias = alias
+
+    @property
+    def _cache(self):
+        return caches[self.alias]
+
+    @property
+    def _failures_key(self) -> str:
+        return f"circuit:{self.name}:failures"
+
+    @property
+    def _open_key(self) -> str:
+        return f"circuit:{self.name}:open"
+
+    @property
+    def _tripped_key(self) -> str:
+        return f"circuit:{self.name}:tripped"
+
+    def is_open(self) -> bool:
+        return self._cache.get(self._open_key) is not None
+
+    def call(self, fn: Callable[[], Any], is_failure: Callable[[Exception], bool] = lambda e: True) -> Any:
+        """
+        Call `fn` through the breaker
+
+        Args:
+            fn: Zero-argument callable
+            is_failure: Whether an exception raised by `fn` counts as a failure
+
+        Returns:
+            Result of `fn`
+
+        Raises:
+            CircuitOpenError: The circuit is open
+        """
+        if self.is_open():
+            raise CircuitOpenError(self.name, self.backoff)
+
+        try:
+            result = fn()
+        except Exception as e:
+            if is_failure(e):
+                self.record_failure()
+            raise
+
+        self.record_success()
+        return result
+
+    def record_success(self):
+        self._cache.delete_many([self._failures_key, self._tripped_key])
+
+    def record_failure(self):
+        cache = self._cache
+        if cache.get(self._tripped_key) is not None:
+            # Still failing right after a backoff: open again immediately
+            failures = self.threshold
+        else:
+            cache.add(self._failures_key, 0, timeout=self.window)
+            try:
+                failures = cache.incr(self._failures_key)
+            except ValueError:
+                # The window expired between add() and incr()
+                cache.set(self._failures_key, 1, timeout=self.window)
+                failures = 1
+
+        if failures >= self.threshold:
+            logger.warning("Circuit %s open for %ss after %s failures", self.name, self.backoff, failures)
+            cache.set(self._open_key, 1, timeout=self.backoff)
+            # Remember the trip until well after the backoff ends
+            cache.set(self._tripped_key, 1, timeout=self.backoff + self.window)
+            cache.delete(self._failures_key)
@@ -3,11 +3,75 @@ Panel Discussion Service
 Retrieves stored panel discussion results from S3
 """
 
-import boto3
+import asyncio
+import functools
+import gzip
+import heapq
 import json
-from typing import Dict, List, Optional
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+from botocore.exceptions import BotoCoreError, ClientError
 from django.conf import settings
-from django.core.cache import cache
+
+from ..models import PanelCountryTrend, PanelDiscussionObject
+from ..snapshots import PANEL_DATA_VERSION_KEY, bump_data_version
+from ..trends import DEFAULT_TREND_WINDOW, record_discussion as record_trend, trend_payload
+from .aws_clients import default_region, get_client
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .tiered_cache import TieredCache, call_and_close_db
+
+try:
+    import zstandard
+except ImportError:  # optional: zstd-encoded discussions
+    zstandard = None
+
+try:
+    import ijson
+except ImportError:  # optional: incremental parsing of summary fields
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+DISCUSSIONS_PREFIX = 'discussions/'
+MANIFEST_NAME = '_manifest.json'
+
+# S3 error codes that mean "back off" rather than "bad request"
+THROTTLING_CODES = {'SlowDown', 'Throttling', 'ThrottlingException', 'RequestLimitExceeded'}
+
+# Top-level discussion fields needed to build a summary. The transcript is
+# written last, so an incremental parse can stop before reaching it.
+SUMMARY_SOURCE_FIELDS = (
+    'country_code', 'topic', 'final_mood', 'final_score',
+    'introduction', 'conclusion', 'metadata', 'votes',
+)
+
+# New discussions are stored as discussions/<country_code>/<YYYY-MM-DD>/<id>.json,
+# partitioned by the UTC date they are written, so the newest ones can be found
+# by listing the latest partitions only. Legacy keys directly under
+# discussions/<country_code>/ are still read.
+DATE_PARTITION = re.compile(r'(\d{4}-\d{2}-\d{2})/$')
+
+
+class PanelStorageUnavailable(Exception):
+    """S3 is failing or its circuit is open; callers should retry later"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _is_outage(exc: Exception) -> bool:
+    """Whether an S3 error should count against the circuit breaker"""
+    if isinstance(exc, ClientError):
+        status = exc.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        code = exc.response.get('Error', {}).get('Code', '')
+        return status >= 500 or code in THROTTLING_CODES
+    return isinstance(exc, BotoCoreError)
 
 
 class PanelDiscussionService:
@@ -15,8 +79,18 @@ class PanelDiscussionService:
 
     def __init__(self):
         self.s3_bucket = getattr(settings, 'PANEL_RESULTS_BUCKET', 'hackthon-panel-discussions')
-        self.region = getattr(settings, 'AWS_REGION', 'ap-northeast-1')
-        self.s3_client = boto3.client('s3', region_name=self.region)
+        self.region = default_region()
+        self.head_concurrency = getattr(settings, 'PANEL_S3_HEAD_CONCURRENCY', 8)
+        self.s3_client = get_client('s3', self.region)
+        self.cache = TieredCache(
+            alias=getattr(settings, 'PANEL_CACHE_ALIAS', 'default'),
+            local_max_entries=getattr(settings, 'PANEL_CACHE_LOCAL_MAX_ENTRIES', 512),
+            local_ttl=getattr(settings, 'PANEL_CACHE_LOCAL_TTL', 30),
+            stale_ttl=getattr(settings, 'PANEL_CACHE_STALE_TTL', 300),
+            negative_ttl=getattr(settings, 'PANEL_CACHE_NEGATIVE_TTL', 30),
+            jitter=getattr(settings, 'PANEL_CACHE_TTL_JITTER', 0.1)
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
 
     def list_discussions(
         self,
@@ -32,52 +106,34 @@ class PanelDiscussionService:
 
         Returns:
             List of discussion metadata
-        """
-        cache_key = f"panel_discussions_{country_code or 'all'}_{limit}"
-        cached = cache.get(cache_key)
-
-        if cached:
-            return cached
-
-        try:
-            prefix = f"discussions/{country_code}/" if country_code else "discussions/"
-
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.s3_bucket,
-                Prefix=prefix
-            )
-
-            discussions = []
-            for obj in response.get('Contents', [])[:limit]:
-                # Get metadata
-                head = self.s3_client.head_object(
-                    Bucket=self.s3_bucket,
-                    Key=obj['Key']
-                )
-
-                metadata = head.get('Metadata', {})
-                discussion_id = obj['Key'].split('/')[-1].replace('.json', '')
-
-                discussions.append({
-                    'discussion_id': discussion_id,
-                    'country_code': metadata.get('country_code', 'UNKNOWN'),
-                    'timestamp': obj['LastModified'].isoformat(),
-                    'final_mood': metadata.get('final_mood', 'unknown'),
-                    'final_score': float(metadata.get('final_score', 50)),
-                    's3_key': obj['Key']
-                })
-
-            # Sort by timestamp descending
-            discussions.sort(key=lambda x: x['timestamp'], reverse=True)
-
-            # Cache for 5 minutes
-            cache.set(cache_key, discussions, 300)
 
-            return discussions
-
-        except Exception as e:
-            print(f"Error listing discussions: {e}")
-            return []
+        Raises:
+            PanelStorageUnavailable: S3 is failing or backing off
+        """
+        # Cache for 5 minutes
+        return self._read_through(
+            self._list_cache_key(country_code, limit),
+            self._prefix(country_code),
+            lambda: self._load_discussions(country_code, limit),
+            ttl=300
+        )
+
+    def _load_discussions(self, country_code: Optional[str], limit: int) -> List[Dict]:
+        """Read discussion metadata from the manifest or, without one, the listing"""
+        discussions = self.read_manifest(country_code)
+
+        if discussions is None:
+            # No manifest yet: find the newest objects, then HEAD only those
+            if country_code:
+                objects = self._newest_objects(self._prefix(country_code), limit)
+            else:
+                objects = self._newest_objects_all_countries(limit)
+            discussions = self._describe_objects(objects)
+            self.index_discussions(discussions)
+
+        # Sort by timestamp descending
+        discussions.sort(key=lambda x: x['timestamp'], reverse=True)
+        return discussions[:limit]
 
     def get_discussion(self, discussion_id: str) -> Optional[Dict]:
         """
@@ -88,47 +144,156 @@ class PanelDiscussionService:
 
         Returns:
             Full discussion data or None
+
+        Raises:
+            PanelStorageUnavailable: S3 is failing or backing off
         """
         cache_key = f"panel_discussion_{discussion_id}"
-        cached = cache.get(cache_key)
 
-        if cached:
-            return cached
+        # Cache for 1 hour
+        return self._read_through(
+            cache_key,
+            DISCUSSIONS_PREFIX,
+            lambda: self._load_discussion(discussion_id),
+            ttl=3600
+        )
 
-        try:
-            # Find the S3 key by listing
-            discussions = self.list_discussions()
-            s3_key = None
-
-            for disc in discussions:
-                if disc['discussion_id'] == discussion_id:
-                    s3_key = disc['s3_key']
-                    break
+    def _load_discussion(self, discussion_id: str) -> Optional[Dict]:
+        """Read a full discussion, decompressing as the body is read"""
+        s3_key = self.resolve_key(discussion_id)
 
-            if not s3_key:
-                return None
+        if not s3_key:
+            return None
 
-            # Get full data from S3
+        try:
             response = self.s3_client.get_object(
                 Bucket=self.s3_bucket,
                 Key=s3_key
             )
+        except self.s3_client.exceptions.NoSuchKey:
+            return None
 
-            data = json.loads(response['Body'].read())
+        with self._open_body(response) as body:
+            return self._read_document(body)
 
-            # Cache for 1 hour
-            cache.set(cache_key, data, 3600)
+    def prefetch(
+        self,
+        country_codes: Iterable[str],
+        limits: Iterable[int] = (20, 10),
+        bodies: int = 3
+    ) -> Dict[str, int]:
+        """
+        Refresh cached listings and pre-warm the newest discussion bodies
 
-            return data
+        Listings for every country (and the all-countries listing) are
+        reloaded even when still fresh, so a scheduler running more often
+        than the listing TTL keeps them permanently warm. The `bodies`
+        newest discussions of each country are loaded if not cached.
 
-        except Exception as e:
-            print(f"Error getting discussion {discussion_id}: {e}")
-            return None
+        Args:
+            country_codes: Country codes as stored in S3 (e.g. 'JP')
+            limits: Listing sizes to refresh (the API defaults are 20 and 10)
+            bodies: Newest discussion bodies to pre-warm per country
+
+        Returns:
+            Counts of refreshed listings, warmed bodies and failures
+        """
+        limits = sorted(set(limits), reverse=True)
+        stats = {'listings': 0, 'bodies': 0, 'failures': 0}
+
+        def prefetch_country(country_code: Optional[str]):
+            counts = {'listings': 0, 'bodies': 0, 'failures': 0}
+            try:
+                discussions = []
+                for limit in limits:
+                    listing = self.cache.refresh(
+                        self._list_cache_key(country_code, limit),
+                        lambda: self._breaker(self._prefix(country_code)).call(
+                            lambda: self._load_discussions(country_code, limit),
+                            is_failure=_is_outage
+                        ),
+                        ttl=300
+                    )
+                    discussions = discussions or listing
+                    counts['listings'] += 1
+
+                if country_code:
+                    for disc in discussions[:bodies]:
+                        self.get_discussion(disc['discussion_id'])
+                        counts['bodies'] += 1
+            except (CircuitOpenError, PanelStorageUnavailable, BotoCoreError, ClientError) as e:
+                logger.warning("Prefetch for %s failed: %s", country_code or 'all countries', e)
+                counts['failures'] += 1
+            return counts
+
+        codes = [None, *country_codes]
+        workers = max(1, min(self.head_concurrency, len(codes)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='panel-prefetch') as executor:
+            for counts in executor.map(
+                lambda code: call_and_close_db(prefetch_country, code),
+                codes
+            ):
+                for name, value in counts.items():
+                    stats[name] += value
+
+        return stats
+
+    def _read_through(
+        self,
+        cache_key: str,
+        prefix: str,
+        loader: Callable,
+        ttl: float
+    ):
+        """
+        Read through the cache, guarding S3 with the prefix's circuit breaker
+
+        Args:
+            cache_key: Cache key
+            prefix: S3 prefix whose breaker guards the loader
+            loader: Zero-argument callable reading from S3
+            ttl: Seconds the value stays fresh
+
+        Returns:
+            Cached or loaded value (None / empty results are cached briefly)
+
+        Raises:
+            PanelStorageUnavailable: S3 failed or the circuit is open
+        """
+        breaker = self._breaker(prefix)
+
+        try:
+            return self.cache.get_or_load(
+                cache_key,
+                lambda: breaker.call(loader, is_failure=_is_outage),
+                ttl=ttl
+            )
+
+        except CircuitOpenError as e:
+            raise PanelStorageUnavailable(str(e), e.retry_after) from e
+
+        except (BotoCoreError, ClientError) as e:
+            logger.warning("S3 read for %s failed: %s", cache_key, e)
+            raise PanelStorageUnavailable(f"Panel storage read failed: {e}", breaker.backoff) from e
+
+    def _breaker(self, prefix: str) -> CircuitBreaker:
+        """Circuit breaker for one bucket/prefix, shared by every worker"""
+        breaker = self._breakers.get(prefix)
+        if breaker is None:
+            breaker = self._breakers[prefix] = CircuitBreaker(
+                f"s3:{self.s3_bucket}:{prefix}",
+                threshold=getattr(settings, 'PANEL_S3_BREAKER_THRESHOLD', 5),
+                window=getattr(settings, 'PANEL_S3_BREAKER_WINDOW', 30),
+                backoff=getattr(settings, 'PANEL_S3_BREAKER_BACKOFF', 30),
+                alias=self.cache.alias
+            )
+        return breaker
 
     def get_country_history(
         self,
         country_code: str,
-        limit: int = 10
+        limit: int = 10,
+        window: int = DEFAULT_TREND_WINDOW
     ) -> Dict:
         """
         Get discussion history for a country with trends
@@ -136,17 +301,25 @@ class PanelDiscussionService:
         Args:
             country_code: Country code
             limit: Maximum results
+            window: EMA window of the rolling analytics (see trends.TREND_WINDOWS)
 
         Returns:
-            Dict with discussions and trend analysis
+            Dict with discussions, trend analysis and rolling analytics
         """
         discussions = self.list_discussions(country_code, limit)
 
+        # Rolling statistics are maintained per discussion: one row read
+        analytics = trend_payload(
+            PanelCountryTrend.objects.filter(country_code=country_code).first(),
+            window
+        )
+
         if not discussions:
             return {
                 'country_code': country_code,
                 'discussions': [],
-                'trend': None
+                'trend': None,
+                'analytics': analytics
             }
 
         # Calculate trend
@@ -168,6 +341,7 @@ class PanelDiscussionService:
             'country_code': country_code,
             'discussions': discussions,
             'trend': trend,
+            'analytics': analytics,
             'latest': discussions[0] if discussions else None
         }
 
@@ -175,30 +349,553 @@ class PanelDiscussionService:
         """
         Get concise summary of a discussion
 
+        Reads the small summary sidecar written next to the discussion.
+        Objects stored without one are streamed and parsed only up to the
+        summary fields.
+
         Args:
             discussion_id: Discussion ID
 
         Returns:
             Summary dict or None
+
+        Raises:
+            PanelStorageUnavailable: S3 is failing or backing off
+        """
+        cache_key = f"panel_discussion_summary_{discussion_id}"
+
+        # Cache for 1 hour
+        return self._read_through(
+            cache_key,
+            DISCUSSIONS_PREFIX,
+            lambda: self._load_summary(discussion_id),
+            ttl=3600
+        )
+
+    def _load_summary(self, discussion_id: str) -> Optional[Dict]:
+        """Read the summary sidecar, or the summary fields of the body"""
+        s3_key = self.resolve_key(discussion_id)
+
+        if not s3_key:
+            return None
+
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.s3_bucket,
+                Key=self._summary_key(s3_key)
+            )
+            return json.loads(response['Body'].read())
+        except self.s3_client.exceptions.NoSuchKey:
+            pass
+
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.s3_bucket,
+                Key=s3_key
+            )
+        except self.s3_client.exceptions.NoSuchKey:
+            return None
+
+        with self._open_body(response) as body:
+            return self._summarize(discussion_id, self._read_summary_fields(body))
+
+    def store_discussion(self, discussion_id: str, data: Dict) -> Dict:
+        """
+        Store a discussion with its summary sidecar and index it
+
+        The body is compressed with PANEL_S3_COMPRESSION ('gzip', 'zstd'
+        or 'none') and tagged with Content-Encoding so readers know how to
+        decode it.
+
+        Args:
+            discussion_id: Discussion ID
+            data: Full discussion data
+
+        Returns:
+            Discussion metadata recorded in the manifests
+        """
+        s3_key = self.discussion_key(data['country_code'], discussion_id)
+        encoding = getattr(settings, 'PANEL_S3_COMPRESSION', 'gzip')
+
+        # Keep the transcript last so partial parses can stop early
+        ordered = {key: value for key, value in data.items() if key != 'transcript'}
+        if 'transcript' in data:
+            ordered['transcript'] = data['transcript']
+
+        extra = {}
+        if encoding != 'none':
+            extra['ContentEncoding'] = encoding
+
+        self.s3_client.put_object(
+            Bucket=self.s3_bucket,
+            Key=s3_key,
+            Body=self._compress(json.dumps(ordered).encode('utf-8'), encoding),
+            ContentType='application/json',
+            Metadata={
+                'country_code': data['country_code'],
+                'final_mood': data['final_mood'],
+                'final_score': str(data['final_score'])
+            },
+            **extra
+        )
+        self.s3_client.put_object(
+            Bucket=self.s3_bucket,
+            Key=self._summary_key(s3_key),
+            Body=json.dumps(self._summarize(discussion_id, data)).encode('utf-8'),
+            ContentType='application/json'
+        )
+
+        entry = {
+            'discussion_id': discussion_id,
+            'country_code': data['country_code'],
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'final_mood': data['final_mood'],
+            'final_score': float(data['final_score']),
+            's3_key': s3_key
+        }
+        self.record_discussion(entry)
+        return entry
+
+    @staticmethod
+    def _summarize(discussion_id: str, data: Dict) -> Dict:
+        """Build the summary dict from (at least) the summary source fields"""
+        return {
+            'discussion_id': discussion_id,
+            'country_code': data['country_code'],
+            'topic': data['topic'],
+            'final_mood': data['final_mood'],
+            'final_score': data['final_score'],
+            'introduction': data['introduction'],
+            'conclusion': data['conclusion'],
+            'timestamp': data['metadata']['timestamp'],
+            'total_turns': data['metadata']['total_turns'],
+            'votes': data['votes']
+        }
+
+    # ------------------------------------------------------------------
+    # Body encoding
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _compress(payload: bytes, encoding: str) -> bytes:
+        if encoding == 'gzip':
+            return gzip.compress(payload)
+        if encoding == 'zstd':
+            if zstandard is None:
+                raise RuntimeError("PANEL_S3_COMPRESSION='zstd' requires the zstandard package")
+            return zstandard.ZstdCompressor().compress(payload)
+        return payload
+
+    @staticmethod
+    @contextmanager
+    def _open_body(response: Dict):
+        """
+        Decode a GetObject body as it is read
+
+        The underlying stream is closed on exit, including when a partial
+        read stops early.
+
+        Args:
+            response: get_object response
+
+        Yields:
+            Readable binary file object
+        """
+        body = response['Body']
+        encoding = response.get('ContentEncoding')
+
+        try:
+            if encoding == 'gzip':
+                yield gzip.GzipFile(fileobj=body, mode='rb')
+            elif encoding == 'zstd':
+                if zstandard is None:
+                    raise RuntimeError('Reading zstd-encoded discussions requires the zstandard package')
+                yield zstandard.ZstdDecompressor().stream_reader(body)
+            else:
+                yield body
+        finally:
+            body.close()
+
+    @staticmethod
+    def _read_document(body) -> Dict:
+        """
+        Parse a whole discussion body
+
+        With ijson installed the body is parsed as it is read, so the
+        decoded JSON text is never held in memory next to the result;
+        otherwise it is read whole and parsed with json.
+
+        Args:
+            body: Readable binary file object
+
+        Returns:
+            Discussion data
+        """
+        if ijson is None:
+            return json.load(body)
+        return next(ijson.items(body, '', use_float=True))
+
+    @staticmethod
+    def _read_summary_fields(body) -> Dict:
+        """
+        Parse only the summary fields from a discussion body
+
+        With ijson installed the body is parsed incrementally and reading
+        stops once every summary field has been seen; otherwise the whole
+        document is parsed.
+
+        Args:
+            body: Readable binary file object
+
+        Returns:
+            Dict of the summary source fields that were found
         """
-        full_data = self.get_discussion(discussion_id)
+        if ijson is None:
+            data = json.load(body)
+            return {key: data[key] for key in SUMMARY_SOURCE_FIELDS if key in data}
+
+        found = {}
+        for key, value in ijson.kvitems(body, '', use_float=True):
+            if key in SUMMARY_SOURCE_FIELDS:
+                found[key] = value
+                if len(found) == len(SUMMARY_SOURCE_FIELDS):
+                    break
+        return found
+
+    @staticmethod
+    def _summary_key(s3_key: str) -> str:
+        """Sidecar key: underscore-prefixed so listings skip it"""
+        folder, _, name = s3_key.rpartition('/')
+        return f"{folder}/_{name[:-len('.json')]}.summary.json"
+
+    # ------------------------------------------------------------------
+    # Async API
+    #
+    # For async views under ASGI. Blocking boto3 calls run on a dedicated
+    # thread pool sized by PANEL_ASYNC_IO_THREADS, so one event loop can
+    # keep that many S3 requests in flight; keep AWS_MAX_POOL_CONNECTIONS
+    # at least as large.
+    # ------------------------------------------------------------------
+
+    async def alist_discussions(self, country_code: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """Async list_discussions"""
+        return await self._offload(self.list_discussions, country_code, limit)
+
+    async def aget_discussion(self, discussion_id: str) -> Optional[Dict]:
+        """Async get_discussion"""
+        return await self._offload(self.get_discussion, discussion_id)
+
+    async def aget_discussion_summary(self, discussion_id: str) -> Optional[Dict]:
+        """Async get_discussion_summary"""
+        return await self._offload(self.get_discussion_summary, discussion_id)
+
+    async def aget_country_history(
+        self,
+        country_code: str,
+        limit: int = 10,
+        window: int = DEFAULT_TREND_WINDOW
+    ) -> Dict:
+        """Async get_country_history"""
+        return await self._offload(self.get_country_history, country_code, limit, window)
+
+    async def _offload(self, fn: Callable, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_io_executor(), functools.partial(call_and_close_db, fn, *args))
+
+    # ------------------------------------------------------------------
+    # Manifest
+    #
+    # The panel writer keeps a JSON index of discussion metadata under
+    # discussions/_manifest.json (all countries) and
+    # discussions/<country_code>/_manifest.json, so listings cost one GET
+    # instead of a LIST plus one HEAD per object.
+    # ------------------------------------------------------------------
+
+    def read_manifest(self, country_code: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Read discussion metadata from the manifest object
+
+        Args:
+            country_code: Optional country whose manifest to read
 
-        if not full_data:
+        Returns:
+            List of discussion metadata, or None if no manifest exists
+        """
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.s3_bucket,
+                Key=self._manifest_key(country_code)
+            )
+        except self.s3_client.exceptions.NoSuchKey:
             return None
 
+        manifest = json.loads(response['Body'].read())
+        return manifest.get('discussions', [])
+
+    def write_manifest(self, discussions: List[Dict], country_code: Optional[str] = None):
+        """
+        Write the manifest for all discussions or a single country
+
+        Args:
+            discussions: Discussion metadata as returned by list_discussions
+            country_code: Optional country whose manifest to write
+        """
+        body = {
+            'version': 1,
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'discussions': sorted(discussions, key=lambda x: x['timestamp'], reverse=True),
+        }
+        self.s3_client.put_object(
+            Bucket=self.s3_bucket,
+            Key=self._manifest_key(country_code),
+            Body=json.dumps(body).encode('utf-8'),
+            ContentType='application/json'
+        )
+
+    def record_discussion(self, entry: Dict):
+        """
+        Add or replace one discussion in the manifests, the key index and
+        its country's rolling trend, and move the panel data version
+
+        Called by the panel writer after storing a discussion. Manifests are
+        read-modify-written, so a single writer is assumed. A missing
+        manifest is first rebuilt from the listing, so discussions stored
+        before it existed stay listed. A re-stored discussion (already in
+        the key index) replaces its manifest entries but is not counted
+        again in the trend.
+
+        Args:
+            entry: Discussion metadata (discussion_id, country_code,
+                timestamp, final_mood, final_score, s3_key)
+        """
+        for country_code in (None, entry['country_code']):
+            existing = self.read_manifest(country_code)
+            if existing is None:
+                existing = self.scan_discussions(country_code)
+            discussions = [
+                disc for disc in existing
+                if disc['discussion_id'] != entry['discussion_id']
+            ]
+            discussions.append(entry)
+            self.write_manifest(discussions, country_code)
+
+        restored = PanelDiscussionObject.objects.filter(discussion_id=entry['discussion_id']).exists()
+        self.index_discussions([entry])
+        if not restored:
+            record_trend(entry)
+        bump_data_version(PANEL_DATA_VERSION_KEY)
+
+    def scan_discussions(self, country_code: Optional[str] = None) -> List[Dict]:
+        """
+        Describe every stored discussion by listing and HEADing all objects
+
+        Used to (re)build manifests; request paths read the manifest instead.
+
+        Args:
+            country_code: Optional filter by country
+
+        Returns:
+            List of discussion metadata, newest first
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        objects = [
+            obj
+            for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=self._prefix(country_code))
+            for obj in page.get('Contents', [])
+            if self._is_discussion_key(obj['Key'])
+        ]
+        discussions = self._describe_objects(objects)
+        discussions.sort(key=lambda x: x['timestamp'], reverse=True)
+        return discussions
+
+    # ------------------------------------------------------------------
+    # Key index
+    #
+    # PanelDiscussionObject maps discussion IDs to S3 keys so a detail or
+    # summary lookup is one indexed row read plus one GET, however large
+    # the archive grows.
+    # ------------------------------------------------------------------
+
+    def resolve_key(self, discussion_id: str) -> Optional[str]:
+        """
+        Resolve the S3 key of a discussion
+
+        The index is authoritative: an ID it does not hold is unknown, so a
+        miss never scans the manifest or the listing. record_discussion
+        indexes new discussions; rebuild_panel_manifest backfills older ones.
+
+        Args:
+            discussion_id: Discussion ID
+
+        Returns:
+            S3 key or None if the discussion is unknown
+        """
+        return PanelDiscussionObject.objects.filter(
+            discussion_id=discussion_id
+        ).values_list('s3_key', flat=True).first()
+
+    def index_discussions(self, discussions: Iterable[Dict]):
+        """
+        Upsert discussion ID -> S3 key rows
+
+        Args:
+            discussions: Discussion metadata as returned by list_discussions
+        """
+        rows = [
+            PanelDiscussionObject(
+                discussion_id=disc['discussion_id'],
+                country_code=disc.get('country_code', ''),
+                s3_key=disc['s3_key']
+            )
+            for disc in discussions
+        ]
+        if not rows:
+            return
+
+        PanelDiscussionObject.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['discussion_id'],
+            update_fields=['country_code', 's3_key', 'indexed_at']
+        )
+
+    @staticmethod
+    def discussion_key(
+        country_code: str,
+        discussion_id: str,
+        stored_on: Optional[date] = None
+    ) -> str:
+        """
+        S3 key under which a writer should store a discussion
+
+        Args:
+            country_code: Country code
+            discussion_id: Discussion ID
+            stored_on: UTC date of the write (default: today)
+
+        Returns:
+            Date-partitioned S3 key
+        """
+        stored_on = stored_on or datetime.now(timezone.utc).date()
+        return f"{DISCUSSIONS_PREFIX}{country_code}/{stored_on.isoformat()}/{discussion_id}.json"
+
+    # ------------------------------------------------------------------
+    # Listing engine
+    # ------------------------------------------------------------------
+
+    def _newest_objects(self, prefix: str, limit: int) -> List[Dict]:
+        """
+        Find the `limit` most recently modified discussion objects under a prefix
+
+        Pages through the listing with a paginator and keeps a bounded
+        min-heap, so memory is O(limit). Date partitions are visited newest
+        first and the walk stops once a partition is older than everything
+        already kept.
+
+        Args:
+            prefix: Country prefix (discussions/<country_code>/)
+            limit: Maximum number of objects
+
+        Returns:
+            Listed objects, newest first
+        """
+        if limit <= 0:
+            return []
+
+        heap = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+
+        partitions = []
+        for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix, Delimiter='/'):
+            partitions.extend(
+                common['Prefix'] for common in page.get('CommonPrefixes', [])
+                if DATE_PARTITION.search(common['Prefix'])
+            )
+            self._keep_newest(heap, page.get('Contents', []), limit)
+
+        for partition in sorted(partitions, reverse=True):
+            partition_date = DATE_PARTITION.search(partition).group(1)
+            if len(heap) >= limit and partition_date < heap[0][0].date().isoformat():
+                break
+            for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=partition):
+                self._keep_newest(heap, page.get('Contents', []), limit)
+
+        return [entry[2] for entry in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def _newest_objects_all_countries(self, limit: int) -> List[Dict]:
+        """Merge the newest objects of every country prefix"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+
+        country_prefixes = []
+        heap = []
+        for page in paginator.paginate(
+            Bucket=self.s3_bucket, Prefix=DISCUSSIONS_PREFIX, Delimiter='/'
+        ):
+            country_prefixes.extend(common['Prefix'] for common in page.get('CommonPrefixes', []))
+            self._keep_newest(heap, page.get('Contents', []), limit)
+
+        for prefix in country_prefixes:
+            self._keep_newest(heap, self._newest_objects(prefix, limit), limit)
+
+        return [entry[2] for entry in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def _keep_newest(self, heap: List, objects: Iterable[Dict], limit: int):
+        """Push discussion objects onto a min-heap bounded to `limit` entries"""
+        for obj in objects:
+            if not self._is_discussion_key(obj['Key']):
+                continue
+            entry = (obj['LastModified'], obj['Key'], obj)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+    def _describe_objects(self, objects: List[Dict]) -> List[Dict]:
+        """HEAD listed objects over a bounded thread pool"""
+        if not objects:
+            return []
+
+        workers = max(1, min(self.head_concurrency, len(objects)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._describe_object, objects))
+
+    def _describe_object(self, obj: Dict) -> Dict:
+        """Build discussion metadata for one listed object"""
+        head = self.s3_client.head_object(
+            Bucket=self.s3_bucket,
+            Key=obj['Key']
+        )
+
+        metadata = head.get('Metadata', {})
+        discussion_id = obj['Key'].split('/')[-1].replace('.json', '')
+
         return {
             'discussion_id': discussion_id,
-            'country_code': full_data['country_code'],
-            'topic': full_data['topic'],
-            'final_mood': full_data['final_mood'],
-            'final_score': full_data['final_score'],
-            'introduction': full_data['introduction'],
-            'conclusion': full_data['conclusion'],
-            'timestamp': full_data['metadata']['timestamp'],
-            'total_turns': full_data['metadata']['total_turns'],
-            'votes': full_data['votes']
+            'country_code': metadata.get('country_code', 'UNKNOWN'),
+            'timestamp': obj['LastModified'].isoformat(),
+            'final_mood': metadata.get('final_mood', 'unknown'),
+            'final_score': float(metadata.get('final_score', 50)),
+            's3_key': obj['Key']
         }
 
+    @staticmethod
+    def _list_cache_key(country_code: Optional[str], limit: int) -> str:
+        return f"panel_discussions_{country_code or 'all'}_{limit}"
+
+    @staticmethod
+    def _prefix(country_code: Optional[str] = None) -> str:
+        return f"{DISCUSSIONS_PREFIX}{country_code}/" if country_code else DISCUSSIONS_PREFIX
+
+    @classmethod
+    def _manifest_key(cls, country_code: Optional[str] = None) -> str:
+        return f"{cls._prefix(country_code)}{MANIFEST_NAME}"
+
+    @staticmethod
+    def _is_discussion_key(key: str) -> bool:
+        """Discussion objects are JSON files; underscore-prefixed names are indexes and sidecars"""
+        name = key.split('/')[-1]
+        return name.endswith('.json') and not name.startswith('_')
+
     def _compare_moods(self, old_mood: str, new_mood: str) -> str:
         """Compare two moods"""
         mood_order = {'sad': 0, 'neutral': 1, 'happy': 2}
@@ -212,3 +909,39 @@ class PanelDiscussionService:
             return 'declining'
         else:
             return 'stable'
+
+
+# Thread pool for the async API
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _io_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(
+                        settings,
+                        'PANEL_ASYNC_IO_THREADS',
+                        getattr(settings, 'AWS_MAX_POOL_CONNECTIONS', 32)
+                    ),
+                    thread_name_prefix='panel-io'
+                )
+    return _executor
+
+
+# Singleton instance
+_panel_service = None
+
+
+def get_panel_service() -> PanelDiscussionService:
+    """Get or create panel discussion service instance"""
+    global _panel_service
+
+    if _panel_service is None:
+        _panel_service = PanelDiscussionService()
+
+    return _panel_service
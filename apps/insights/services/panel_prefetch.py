@@ -0,0 +1,99 @@
+"""
+Panel Prefetch
+Keeps panel listings and the newest discussion bodies warm in the cache,
+from the prefetch_panels command or an optional in-process scheduler
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+from ..models import Country
+from .panel_discussion_service import get_panel_service
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = 'panel_prefetch:lock'
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def prefetch_panels() -> Dict[str, int]:
+    """
+    Refresh listings for every Country.code and pre-warm their newest bodies
+
+    Returns:
+        Counts of refreshed listings, warmed bodies and failures
+    """
+    codes = [code.upper() for code in Country.objects.values_list('code', flat=True)]
+    return get_panel_service().prefetch(
+        codes,
+        limits=getattr(settings, 'PANEL_PREFETCH_LIMITS', (20, 10)),
+        bodies=getattr(settings, 'PANEL_PREFETCH_BODIES', 3)
+    )
+
+
+class PrefetchScheduler(threading.Thread):
+    """
+    Daemon thread running prefetch_panels every `interval` seconds
+
+    Each gunicorn/uvicorn worker may start one; a lock in the shared cache
+    lets only one of them prefetch per interval.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(name='panel-prefetch-scheduler', daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.run_once()
+            self.stopped.wait(self.interval)
+
+    def run_once(self) -> Optional[Dict[str, int]]:
+        cache = caches[getattr(settings, 'PANEL_CACHE_ALIAS', 'default')]
+        # Expire just before the next tick so a crashed worker cannot hold it
+        if not cache.add(LOCK_KEY, 1, timeout=max(1, self.interval - 1)):
+            return None
+
+        try:
+            stats = prefetch_panels()
+            logger.info("Panel prefetch: %s", stats)
+            return stats
+        except Exception:
+            logger.exception("Panel prefetch failed")
+            return None
+        finally:
+            connections.close_all()
+
+    def stop(self):
+        self.stopped.set()
+
+
+def start_scheduler() -> Optional[PrefetchScheduler]:
+    """
+    Start the in-process scheduler if PANEL_PREFETCH_INTERVAL is set
+
+    Called from the WSGI/ASGI entry points; a no-op when the interval is
+    0 (the default) or the scheduler is already running.
+
+    Returns:
+        The running scheduler, or None
+    """
+    global _scheduler
+
+    interval = getattr(settings, 'PANEL_PREFETCH_INTERVAL', 0)
+    if not interval:
+        return None
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = PrefetchScheduler(interval)
+            _scheduler.start()
+    return _scheduler
@@ -2,20 +2,30 @@
 RAG Chat Service - Bedrock Agent with Knowledge Base integration
 """
 
-import boto3
+import codecs
+import json
+import logging
 import os
-from typing import List, Dict, Optional
-from django.core.cache import cache
+import random
+import uuid
+from typing import Iterator, List, Dict, Optional
+from django.conf import settings
+
+from .aws_clients import default_region, get_client
+from .response_cache import ResponseCache
+from .session_store import get_session_store
+from .single_flight import SharedSingleFlight
+
+# Agent traces of sampled or debug requests; route it to your log sink
+trace_logger = logging.getLogger('apps.insights.rag_trace')
 
 
 class RAGChatService:
     """Service for interacting with RAG Chat Agent"""
 
     def __init__(self):
-        self.bedrock_runtime = boto3.client(
-            'bedrock-agent-runtime',
-            region_name=os.getenv('AWS_REGION', 'ap-northeast-1')
-        )
+        self.region = default_region()
+        self.bedrock_runtime = get_client('bedrock-agent-runtime', self.region)
 
         # Agent IDs from environment
         self.rag_agent_id = os.getenv('RAG_AGENT_ID')
@@ -25,23 +35,137 @@ class RAGChatService:
         if not self.rag_agent_id:
             raise ValueError("RAG_AGENT_ID environment variable not set")
 
+        # Answers reused until the panel data changes; see response_cache.py
+        self.chat_cache = ResponseCache.from_settings('chat')
+        self.kb_cache = ResponseCache.from_settings('kb')
+        self.sessions = get_session_store()
+        # Concurrent identical KB queries share one upstream call
+        self.kb_flight = SharedSingleFlight(
+            alias=getattr(settings, 'RAG_RESPONSE_CACHE_ALIAS', 'default'),
+            across_workers=getattr(settings, 'RAG_COALESCE_ACROSS_WORKERS', False),
+            wait=getattr(settings, 'RAG_COALESCE_WAIT', 30)
+        )
+
     def chat(
         self,
         message: str,
-        session_id: str,
-        country_code: Optional[str] = None
+        session_id: Optional[str] = None,
+        country_code: Optional[str] = None,
+        trace: bool = False
     ) -> Dict[str, any]:
         """
         Send a chat message to RAG agent
 
         Args:
             message: User message
-            session_id: Session ID for conversation continuity
+            session_id: Session ID for conversation continuity (None starts
+                a new session)
             country_code: Optional country code for context filtering
+            trace: Return the agent trace (honored in RAG_TRACE_MODE 'debug')
 
         Returns:
             Dict with response and metadata
         """
+        parts = []
+        citations = []
+        traces = []
+        has_kb_results = False
+
+        for event in self.stream_chat(message, session_id, country_code, trace):
+            if event['type'] == 'chunk':
+                parts.append(event['text'])
+            elif event['type'] == 'citations':
+                citations.extend(event['citations'])
+            elif event['type'] == 'trace':
+                traces.append(event['trace'])
+            elif event['type'] == 'done':
+                session_id = event['session_id']
+                has_kb_results = event['has_kb_results']
+
+        result = {
+            'response': ''.join(parts).strip(),
+            'session_id': session_id,
+            'citations': citations,
+            'has_kb_results': has_kb_results
+        }
+        if traces:
+            result['trace'] = traces
+        return result
+
+    def trace_mode(self, requested: bool = False) -> Optional[str]:
+        """
+        Decide whether this request runs with enableTrace
+
+        RAG_TRACE_MODE 'off' (default) never traces. 'sampled' traces a
+        RAG_TRACE_SAMPLE_RATE fraction of requests to trace_logger.
+        'debug' traces requests that ask for it, returning the trace to the
+        caller, but only while DEBUG is on.
+
+        Args:
+            requested: The caller asked for the trace
+
+        Returns:
+            'return' (send trace events to the caller), 'log', or None
+        """
+        mode = getattr(settings, 'RAG_TRACE_MODE', 'off')
+        if mode == 'debug' and requested and settings.DEBUG:
+            return 'return'
+        if mode == 'sampled' and random.random() < getattr(settings, 'RAG_TRACE_SAMPLE_RATE', 0.01):
+            return 'log'
+        return None
+
+    def stream_chat(
+        self,
+        message: str,
+        session_id: Optional[str] = None,
+        country_code: Optional[str] = None,
+        trace: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Send a chat message and yield the answer as the agent produces it
+
+        Yields, in order of arrival:
+            {'type': 'chunk', 'text': ...} for each piece of answer text
+            {'type': 'citations', 'citations': [...]} for each attribution
+            {'type': 'trace', 'trace': {...}} for each agent trace, only
+                when `trace` is requested and allowed (see trace_mode)
+        and finally {'type': 'done', 'session_id': ..., 'has_kb_results': ...}
+        once the session history has been stored.
+
+        A message that starts a new session (no session_id) is answered
+        from the response cache when the same (or, with embeddings enabled,
+        a similar) question was asked about the same country since the
+        panel data last changed. Messages of an existing session always go
+        to the agent, which holds the session context; the first one after
+        a cached answer seeds the agent with that exchange.
+
+        Args:
+            message: User message
+            session_id: Session ID for conversation continuity (None starts
+                a new session, returned in the done event)
+            country_code: Optional country code for context filtering
+            trace: Ask for the agent trace
+        """
+        trace_mode = self.trace_mode(trace)
+        # A cached answer has no trace to show
+        cacheable = session_id is None and trace_mode != 'return' and self.chat_cache.enabled
+        session_id = session_id or str(uuid.uuid4())
+        # Read on the request thread; the rest of a stream may run elsewhere
+        version = self.chat_cache.version() if cacheable else None
+        cached = self.chat_cache.get(message, country_code, version=version) if cacheable else None
+        if cached is not None:
+            yield {'type': 'chunk', 'text': cached['response']}
+            if cached['citations']:
+                yield {'type': 'citations', 'citations': cached['citations']}
+            self._store_turn(session_id, message, cached['response'])
+            # The agent never saw this exchange
+            self.chat_cache.shared.set(self._unseeded_key(session_id), 1, timeout=self.sessions.ttl)
+            yield {
+                'type': 'done',
+                'session_id': session_id,
+                'has_kb_results': cached['has_kb_results']
+            }
+            return
 
         # Add country context if provided
         if country_code:
@@ -49,6 +173,12 @@ class RAGChatService:
         else:
             contextualized_message = message
 
+        extra = {}
+        if self.chat_cache.shared.delete(self._unseeded_key(session_id)):
+            history = self._conversation_history(session_id)
+            if history:
+                extra['sessionState'] = {'conversationHistory': {'messages': history}}
+
         try:
             # Invoke agent with streaming
             response = self.bedrock_runtime.invoke_agent(
@@ -56,53 +186,66 @@ class RAGChatService:
                 agentAliasId=self.rag_agent_alias_id,
                 sessionId=session_id,
                 inputText=contextualized_message,
-                enableTrace=True  # Enable for debugging
+                enableTrace=trace_mode is not None,
+                **extra
             )
 
-            # Extract response from stream
-            full_response = ""
+            # Forward the stream; a multi-byte character may span chunks
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            parts = []
             citations = []
-            trace_data = []
+            has_citations = False
 
             for event in response.get('completion', []):
                 if 'chunk' in event:
                     chunk = event['chunk']
                     if 'bytes' in chunk:
-                        full_response += chunk['bytes'].decode('utf-8')
+                        text = decoder.decode(chunk['bytes'])
+                        if text:
+                            parts.append(text)
+                            yield {'type': 'chunk', 'text': text}
 
                     # Extract citations if available
                     if 'attribution' in chunk:
                         attribution = chunk['attribution']
                         if 'citations' in attribution:
-                            citations.extend(attribution['citations'])
-
-                # Capture trace for debugging
-                if 'trace' in event:
-                    trace_data.append(event['trace'])
-
-            # Store session in cache (30 min TTL)
-            cache_key = f"rag_session_{session_id}"
-            session_history = cache.get(cache_key, [])
-            session_history.append({
-                'role': 'user',
-                'content': message
-            })
-            session_history.append({
-                'role': 'assistant',
-                'content': full_response
-            })
-            cache.set(cache_key, session_history, timeout=1800)
-
-            return {
-                'response': full_response.strip(),
-                'session_id': session_id,
-                'citations': self._format_citations(citations),
-                'has_kb_results': len(citations) > 0
-            }
+                            formatted = self._format_citations(attribution['citations'])
+                            citations.extend(formatted)
+                            has_citations = has_citations or bool(attribution['citations'])
+                            yield {'type': 'citations', 'citations': formatted}
+
+                if 'trace' in event and trace_mode:
+                    if trace_mode == 'return':
+                        yield {'type': 'trace', 'trace': event['trace']}
+                    else:
+                        trace_logger.info(
+                            "session=%s %s", session_id, json.dumps(event['trace'], default=str)
+                        )
+
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                parts.append(tail)
+                yield {'type': 'chunk', 'text': tail}
+
+            full_response = ''.join(parts)
+            self._store_turn(session_id, message, full_response)
+
+            if cacheable and full_response.strip():
+                self.chat_cache.set(message, {
+                    'response': full_response,
+                    'citations': citations,
+                    'has_kb_results': has_citations
+                }, country_code, version=version)
 
         except Exception as e:
             raise Exception(f"RAG chat failed: {str(e)}")
 
+        yield {
+            'type': 'done',
+            'session_id': session_id,
+            'has_kb_results': has_citations
+        }
+
     def _format_citations(self, citations: List[Dict]) -> List[Dict]:
         """Format citations for frontend display"""
         formatted = []
@@ -119,15 +262,44 @@ class RAGChatService:
 
         return formatted
 
-    def get_session_history(self, session_id: str) -> List[Dict]:
-        """Get conversation history for a session"""
-        cache_key = f"rag_session_{session_id}"
-        return cache.get(cache_key, [])
+    def _store_turn(self, session_id: str, message: str, response: str):
+        """Append a user/assistant exchange to the session"""
+        self.sessions.append_turn(session_id, message, response)
+
+    @staticmethod
+    def _unseeded_key(session_id: str) -> str:
+        """Marks a session whose history the agent has not seen (cached answers)"""
+        return f'rag_session_unseeded:{session_id}'
+
+    def _conversation_history(self, session_id: str) -> List[Dict]:
+        """Session history as InvokeAgent sessionState conversationHistory messages"""
+        return [
+            {'role': message['role'], 'content': [{'text': message['content']}]}
+            for message in self.sessions.history(session_id)
+        ]
+
+    def get_session_history(
+        self,
+        session_id: str,
+        limit: Optional[int] = None,
+        before: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Get conversation history for a session
+
+        Args:
+            session_id: Session ID
+            limit: Max turns, counted back from the newest (default: all retained)
+            before: Only turns older than this turn number
+
+        Returns:
+            Chronological messages with role, content and turn number
+        """
+        return self.sessions.history(session_id, limit=limit, before=before)
 
     def clear_session(self, session_id: str):
         """Clear conversation history"""
-        cache_key = f"rag_session_{session_id}"
-        cache.delete(cache_key)
+        self.sessions.clear(session_id)
 
     def query_knowledge_base_directly(
         self,
@@ -138,12 +310,25 @@ class RAGChatService:
         """
         Direct Knowledge Base query (without agent)
         Useful for advanced searches
+
+        Answers are cached per (query, country_code, max_results) until
+        the panel data changes, and concurrent misses for the same key
+        share one retrieve_and_generate call
         """
         if not self.knowledge_base_id:
             raise ValueError("KNOWLEDGE_BASE_ID not configured")
 
-        kb_client = boto3.client('bedrock-agent-runtime')
+        cached = self.kb_cache.get(query, country_code, max_results)
+        if cached is not None:
+            return cached
 
+        return self.kb_flight.do(
+            self.kb_cache.key(query, country_code, max_results),
+            lambda: self._retrieve_and_generate(query, country_code, max_results)
+        )
+
+    def _retrieve_and_generate(self, query: str, country_code: Optional[str], max_results: int) -> Dict:
+        """Run one knowledge base query upstream and cache the answer"""
         # Build retrieval configuration
         retrieval_config = {
             'vectorSearchConfiguration': {
@@ -161,19 +346,19 @@ class RAGChatService:
             }
 
         try:
-            response = kb_client.retrieve_and_generate(
+            response = self.bedrock_runtime.retrieve_and_generate(
                 input={'text': query},
                 retrieveAndGenerateConfiguration={
                     'type': 'KNOWLEDGE_BASE',
                     'knowledgeBaseConfiguration': {
                         'knowledgeBaseId': self.knowledge_base_id,
-                        'modelArn': f'arn:aws:bedrock:{os.getenv("AWS_REGION", "ap-northeast-1")}::foundation-model/anthropic.claude-3-5-sonnet-20241022-v2:0',
+                        'modelArn': f'arn:aws:bedrock:{self.region}::foundation-model/anthropic.claude-3-5-sonnet-20241022-v2:0',
                         'retrievalConfiguration': retrieval_config
                     }
                 }
             )
 
-            return {
+            result = {
                 'response': response['output']['text'],
                 'citations': response.get('citations', [])
             }
@@ -181,6 +366,9 @@ class RAGChatService:
         except Exception as e:
             raise Exception(f"Knowledge Base query failed: {str(e)}")
 
+        self.kb_cache.set(query, result, country_code, max_results)
+        return result
+
 
 # Singleton instance
 _rag_service = None
@@ -0,0 +1,253 @@
+"""
+RAG Response Cache
+Reuses agent and knowledge base answers for identical or near-identical
+questions while the panel data they were generated from is unchanged
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import math
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from ..snapshots import PANEL_DATA_VERSION_KEY, get_data_version
+from .aws_clients import get_client
+
+logger = logging.getLogger(__name__)
+
+# Sentence punctuation and quotes; operators, signs and decimal points stay
+_PUNCTUATION = re.compile(r'[?!;:"\'`\u00a1\u00bf\u2018\u2019\u201c\u201d\u2026\u3001\u3002]|(?<!\d)[.,]|[.,](?!\d)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_query(text: str) -> str:
+    """
+    Canonical form of a question for exact-match lookups
+
+    Case, Unicode width/compatibility forms, sentence punctuation, quotes
+    and repeated whitespace are ignored, so "What's the mood in Japan?"
+    and "whats the mood in japan" share a cache entry. Operators, signs
+    and decimal separators are kept: "2+2" and "22" do not.
+    """
+    text = unicodedata.normalize('NFKC', text).casefold()
+    text = _PUNCTUATION.sub('', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+class LocalVectorIndex:
+    """
+    Bounded in-process index of unit-length query embeddings
+
+    Entries are grouped by scope (namespace, filters, data version) and
+    searched by brute-force cosine similarity, which stays cheap at the
+    few hundred entries a worker holds compared to a model call.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key: str, scope: Tuple, vector: List[float]):
+        with self._lock:
+            self._entries[key] = (scope, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def search(self, scope: Tuple, vector: List[float]) -> Tuple[Optional[str], float]:
+        """
+        Most similar entry within `scope`
+
+        Returns:
+            (key, cosine similarity), or (None, 0.0) when the scope is empty
+        """
+        with self._lock:
+            candidates = [(key, entry[1]) for key, entry in self._entries.items() if entry[0] == scope]
+
+        best_key, best_score = None, 0.0
+        for key, candidate in candidates:
+            score = sum(a * b for a, b in zip(vector, candidate))
+            if score > best_score:
+                best_key, best_score = key, score
+        return best_key, best_score
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def prune(self, keep_version: int):
+        """Drop entries indexed under an older data version"""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[0][-1] != keep_version]:
+                del self._entries[key]
+
+
+class ResponseCache:
+    """
+    Answer cache keyed by the normalized question and its filters
+
+    Keys embed the panel data version, so recording a new discussion
+    retires every cached answer at once; `ttl` only bounds how long an
+    answer lives while the data is unchanged. With an embedding model
+    configured, a miss falls back to the most similar cached question of
+    the same scope if its cosine similarity reaches `similarity_threshold`.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        alias: str = 'default',
+        ttl: float = 3600,
+        embedding_model: str = '',
+        similarity_threshold: float = 0.92,
+        index_max_entries: int = 512
+    ):
+        self.namespace = namespace
+        self.alias = alias
+        self.ttl = ttl
+        self.embedding_model = embedding_model
+        self.similarity_threshold = similarity_threshold
+        self.index = LocalVectorIndex(index_max_entries)
+        self._indexed_version = None
+
+    @classmethod
+    def from_settings(cls, namespace: str) -> 'ResponseCache':
+        return cls(
+            namespace,
+            alias=getattr(settings, 'RAG_RESPONSE_CACHE_ALIAS', 'default'),
+            ttl=getattr(settings, 'RAG_RESPONSE_CACHE_TTL', 3600),
+            embedding_model=getattr(settings, 'RAG_RESPONSE_CACHE_EMBEDDING_MODEL', ''),
+            similarity_threshold=getattr(settings, 'RAG_RESPONSE_CACHE_SIMILARITY', 0.92),
+            index_max_entries=getattr(settings, 'RAG_RESPONSE_CACHE_INDEX_MAX_ENTRIES', 512)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def get(
+        self,
+        query: str,
+        country_code: Optional[str] = None,
+        max_results: Optional[int] = None,
+        version: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Cached answer for a question, exact match first, then semantic
+
+        Args:
+            query: User question
+            country_code: Country filter the answer was produced with
+            max_results: Retrieval size the answer was produced with
+            version: Panel data version read earlier with version()
+                (default: read it now)
+
+        Returns:
+            Cached answer dict, or None
+        """
+        if not self.enabled:
+            return None
+
+        version = self.version() if version is None else version
+        key = self._key(query, country_code, max_results, version)
+        answer = self.shared.get(key)
+        if answer is not None or not self.embedding_model:
+            return answer
+
+        vector = self._embed(query)
+        if vector is None:
+            return None
+
+        match, score = self.index.search(self._scope(country_code, max_results, version), vector)
+        if match is None or score < self.similarity_threshold:
+            return None
+
+        answer = self.shared.get(match)
+        if answer is None:
+            # Expired or evicted from the shared tier
+            self.index.delete(match)
+        else:
+            logger.debug("Semantic cache hit for %r (similarity %.3f)", query, score)
+        return answer
+
+    def set(
+        self,
+        query: str,
+        answer: Dict,
+        country_code: Optional[str] = None,
+        max_results: Optional[int] = None,
+        version: Optional[int] = None
+    ):
+        """
+        Store an answer and index its question for similarity lookups
+
+        Pass the `version` read before generating the answer when storing
+        from a stream: reading it reaches the database, which must not
+        happen on the thread driving the stream.
+        """
+        if not self.enabled:
+            return
+
+        version = self.version() if version is None else version
+        key = self._key(query, country_code, max_results, version)
+        self.shared.set(key, answer, timeout=self.ttl)
+
+        if self.embedding_model:
+            vector = self._embed(query)
+            if vector is not None:
+                self.index.add(key, self._scope(country_code, max_results, version), vector)
+
+    def key(self, query: str, country_code: Optional[str] = None, max_results: Optional[int] = None) -> str:
+        """Cache key of a question at the current panel data version"""
+        return self._key(query, country_code, max_results, self.version())
+
+    def version(self) -> int:
+        """Current panel data version (one database read)"""
+        version = get_data_version(PANEL_DATA_VERSION_KEY)
+        if version != self._indexed_version:
+            self.index.prune(version)
+            self._indexed_version = version
+        return version
+
+    def _scope(self, country_code: Optional[str], max_results: Optional[int], version: int) -> Tuple:
+        return (self.namespace, country_code or '', max_results, version)
+
+    def _key(self, query: str, country_code: Optional[str], max_results: Optional[int], version: int) -> str:
+        parts = json.dumps([normalize_query(query), country_code or '', max_results])
+        digest = hashlib.sha256(parts.encode('utf-8')).hexdigest()
+        return f"rag_response:{self.namespace}:v{version}:{digest}"
+
+    def _embed(self, query: str) -> Optional[List[float]]:
+        """Embedding of the normalized question, or None if the model call fails"""
+        try:
+            return list(_embed(self.embedding_model, normalize_query(query)))
+        except Exception:
+            logger.warning("Embedding the query for the response cache failed", exc_info=True)
+            return None
+
+
+@functools.lru_cache(maxsize=256)
+def _embed(model_id: str, text: str) -> Tuple[float, ...]:
+    """Unit-length Bedrock embedding; memoized so a miss and its store embed once"""
+    response = get_client('bedrock-runtime').invoke_model(
+        modelId=model_id,
+        body=json.dumps({'inputText': text}),
+        contentType='application/json',
+        accept='application/json'
+    )
+    vector = json.loads(response['body'].read())['embedding']
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return tuple(value / norm for value in vector)
@@ -0,0 +1,348 @@
+"""
+RAG Session Store
+Bounded, compact conversation history with atomic appends, kept in the
+Django cache, on a Redis list, or in-process for development
+"""
+
+import json
+import threading
+import time
+import uuid
+import zlib
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+try:
+    import msgpack
+except ImportError:  # optional: denser turn encoding than JSON
+    msgpack = None
+
+try:
+    import redis
+except ImportError:  # optional: shared sessions across workers
+    redis = None
+
+# Entry header flags
+_MSGPACK = 0x01
+_ZLIB = 0x02
+
+# Turns smaller than this are stored uncompressed
+COMPRESS_MIN_BYTES = 256
+
+
+def encode_turn(turn: Dict) -> bytes:
+    """
+    Serialize one turn as a flag byte plus msgpack (or JSON), zlib'd when large
+
+    Args:
+        turn: {'user': ..., 'assistant': ...}
+
+    Returns:
+        Encoded entry
+    """
+    flags = 0
+    if msgpack is not None:
+        payload = msgpack.packb(turn, use_bin_type=True)
+        flags |= _MSGPACK
+    else:
+        payload = json.dumps(turn, separators=(',', ':')).encode('utf-8')
+
+    if len(payload) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(payload)
+        if len(compressed) < len(payload):
+            payload = compressed
+            flags |= _ZLIB
+
+    return bytes([flags]) + payload
+
+
+def decode_turn(entry: bytes) -> Dict:
+    """Inverse of encode_turn"""
+    flags, payload = entry[0], entry[1:]
+    if flags & _ZLIB:
+        payload = zlib.decompress(payload)
+    if flags & _MSGPACK:
+        if msgpack is None:
+            raise RuntimeError('Reading msgpack-encoded session turns requires the msgpack package')
+        return msgpack.unpackb(payload, raw=False)
+    return json.loads(payload)
+
+
+class SessionBusy(Exception):
+    """Another writer held the session's append lock for too long"""
+
+
+def _trim(session: dict, max_entries: int, max_bytes: int):
+    """Drop the oldest entries until the limits hold, keeping the newest"""
+    entries = session['entries']
+    while len(entries) > 1 and (len(entries) > max_entries or session['bytes'] > max_bytes):
+        session['bytes'] -= len(entries.popleft()[1])
+
+
+class CacheSessionBackend:
+    """
+    One Django cache entry per session, the default backend
+
+    Shared by every worker whenever CACHE_URL points at a shared cache.
+    Appends read-modify-write the entry under an add()-based lock, so
+    concurrent turns on one session never overwrite each other: a writer
+    that cannot take the lock within `lock_wait` seconds raises
+    SessionBusy instead of writing. An entry is bounded by the byte limit,
+    so each append costs one small GET and SET. The cache expires
+    sessions by itself.
+    """
+
+    def __init__(self, alias: str = 'default', lock_ttl: float = 5, lock_wait: float = 5):
+        self.alias = alias
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_wait
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def append(self, key: str, entry: bytes, max_entries: int, max_bytes: int, ttl: int) -> int:
+        lock_key = f'{key}:lock'
+        token = uuid.uuid4().hex
+        deadline = time.time() + self.lock_wait
+        while not self.cache.add(lock_key, token, timeout=self.lock_ttl):
+            if time.time() >= deadline:
+                raise SessionBusy(f'Session {key} is locked by another writer')
+            time.sleep(0.01)
+
+        try:
+            session = self.cache.get(key) or {'entries': deque(), 'bytes': 0, 'seq': 0}
+            session['seq'] += 1
+            session['entries'].append((session['seq'], entry))
+            session['bytes'] += len(entry)
+            _trim(session, max_entries, max_bytes)
+            self.cache.set(key, session, timeout=ttl)
+            return session['seq']
+        finally:
+            # Release only our own lock, not one taken after ours expired
+            if self.cache.get(lock_key) == token:
+                self.cache.delete(lock_key)
+
+    def range(self, key: str, limit: int, before: Optional[int]) -> List[Tuple[int, bytes]]:
+        session = self.cache.get(key)
+        if session is None:
+            return []
+        entries = [item for item in session['entries'] if before is None or item[0] < before]
+        return entries[-limit:]
+
+    def delete(self, key: str):
+        self.cache.delete(key)
+
+
+class LocalSessionBackend:
+    """
+    In-process ring buffers with the same semantics as the shared backends
+
+    Sessions are not shared between workers: for development only.
+    Expired sessions are swept on append, at most every `sweep_interval`
+    seconds.
+    """
+
+    def __init__(self, sweep_interval: float = 60):
+        self._sessions: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.sweep_interval = sweep_interval
+        self._next_sweep = 0.0
+
+    def append(self, key: str, entry: bytes, max_entries: int, max_bytes: int, ttl: int) -> int:
+        now = time.time()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            session = self._live(key, now)
+            if session is None:
+                session = self._sessions[key] = {'entries': deque(), 'bytes': 0, 'seq': 0}
+            session['seq'] += 1
+            session['entries'].append((session['seq'], entry))
+            session['bytes'] += len(entry)
+            _trim(session, max_entries, max_bytes)
+            session['expires_at'] = now + ttl
+            return session['seq']
+
+    def range(self, key: str, limit: int, before: Optional[int]) -> List[Tuple[int, bytes]]:
+        with self._lock:
+            session = self._live(key, time.time())
+            if session is None:
+                return []
+            entries = [item for item in session['entries'] if before is None or item[0] < before]
+        return entries[-limit:]
+
+    def delete(self, key: str):
+        with self._lock:
+            self._sessions.pop(key, None)
+
+    def _sweep(self, now: float):
+        for key in [key for key, session in self._sessions.items() if session['expires_at'] <= now]:
+            del self._sessions[key]
+        self._next_sweep = now + self.sweep_interval
+
+    def _live(self, key: str, now: float) -> Optional[dict]:
+        session = self._sessions.get(key)
+        if session is not None and session['expires_at'] <= now:
+            del self._sessions[key]
+            return None
+        return session
+
+
+class RedisSessionBackend:
+    """
+    One Redis list per session, appended and trimmed by a Lua script
+
+    The script runs atomically, so concurrent turns on one session never
+    overwrite each other, and each append costs O(1) amortized: RPUSH,
+    then LPOP of the oldest entries until the turn and byte limits hold.
+    Entries are prefixed with a per-session sequence number.
+    """
+
+    APPEND_SCRIPT = """
+local seq = redis.call('INCR', KEYS[3])
+local entry = seq .. ':' .. ARGV[1]
+local n = redis.call('RPUSH', KEYS[1], entry)
+local size = redis.call('INCRBY', KEYS[2], string.len(entry))
+local max_entries, max_bytes = tonumber(ARGV[2]), tonumber(ARGV[3])
+while n > 1 and (n > max_entries or size > max_bytes) do
+    local oldest = redis.call('LPOP', KEYS[1])
+    size = redis.call('DECRBY', KEYS[2], string.len(oldest))
+    n = n - 1
+end
+for i = 1, 3 do
+    redis.call('EXPIRE', KEYS[i], ARGV[4])
+end
+return seq
+"""
+
+    def __init__(self, url: str):
+        if redis is None:
+            raise RuntimeError('RAG_SESSION_STORE_URL requires the redis package')
+        self.client = redis.Redis.from_url(url)
+        self._append = self.client.register_script(self.APPEND_SCRIPT)
+
+    def append(self, key: str, entry: bytes, max_entries: int, max_bytes: int, ttl: int) -> int:
+        return int(self._append(
+            keys=[key, f'{key}:bytes', f'{key}:seq'],
+            args=[entry, max_entries, max_bytes, ttl]
+        ))
+
+    def range(self, key: str, limit: int, before: Optional[int]) -> List[Tuple[int, bytes]]:
+        if before is None:
+            raw = self.client.lrange(key, -limit, -1)
+        else:
+            # Sequence numbers are contiguous, so `before` maps to a list index
+            oldest = self.client.lindex(key, 0)
+            if oldest is None:
+                return []
+            end = before - self._split(oldest)[0] - 1
+            if end < 0:
+                return []
+            raw = self.client.lrange(key, max(0, end - limit + 1), end)
+        return [self._split(item) for item in raw]
+
+    def delete(self, key: str):
+        self.client.delete(key, f'{key}:bytes', f'{key}:seq')
+
+    @staticmethod
+    def _split(item: bytes) -> Tuple[int, bytes]:
+        seq, _, entry = item.partition(b':')
+        return int(seq), entry
+
+
+class SessionStore:
+    """
+    Conversation history per session, kept as a ring buffer of turns
+
+    A turn is one user message and the assistant's answer. Only the
+    newest `max_turns` turns, and no more than `max_bytes` of encoded
+    history, are retained; the whole session expires `ttl` seconds after
+    its last turn.
+    """
+
+    def __init__(self, backend, max_turns: int = 50, max_bytes: int = 256 * 1024, ttl: int = 1800):
+        self.backend = backend
+        self.max_turns = max_turns
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f'rag_session:{session_id}'
+
+    def append_turn(self, session_id: str, message: str, response: str) -> int:
+        """
+        Atomically add a user/assistant exchange
+
+        Returns:
+            Sequence number of the new turn (1 for the first turn)
+        """
+        return self.backend.append(
+            self._key(session_id),
+            encode_turn({'user': message, 'assistant': response}),
+            self.max_turns,
+            self.max_bytes,
+            self.ttl
+        )
+
+    def history(self, session_id: str, limit: Optional[int] = None, before: Optional[int] = None) -> List[Dict]:
+        """
+        Messages of the newest `limit` turns older than turn `before`
+
+        Args:
+            session_id: Session ID
+            limit: Max turns (default: every retained turn)
+            before: Only turns with a lower sequence number
+
+        Returns:
+            Chronological {'role', 'content', 'turn'} messages
+        """
+        entries = self.backend.range(self._key(session_id), limit or self.max_turns, before)
+        messages = []
+        for seq, entry in entries:
+            turn = decode_turn(entry)
+            messages.append({'role': 'user', 'content': turn['user'], 'turn': seq})
+            messages.append({'role': 'assistant', 'content': turn['assistant'], 'turn': seq})
+        return messages
+
+    def clear(self, session_id: str):
+        self.backend.delete(self._key(session_id))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def _backend(url: str):
+    """Session backend for RAG_SESSION_STORE_URL"""
+    if not url:
+        return CacheSessionBackend(getattr(settings, 'RAG_SESSION_CACHE_ALIAS', 'default'))
+    if url == 'memory://':
+        return LocalSessionBackend()
+    return RedisSessionBackend(url)
+
+
+def get_session_store() -> SessionStore:
+    """
+    Get the process-wide session store
+
+    The RAG_SESSION_CACHE_ALIAS Django cache by default, Redis lists when
+    RAG_SESSION_STORE_URL is a redis:// URL, and in-process buffers
+    (development only) when it is memory://.
+    """
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SessionStore(
+                    _backend(getattr(settings, 'RAG_SESSION_STORE_URL', '')),
+                    max_turns=getattr(settings, 'RAG_SESSION_MAX_TURNS', 50),
+                    max_bytes=getattr(settings, 'RAG_SESSION_MAX_BYTES', 256 * 1024),
+                    ttl=getattr(settings, 'RAG_SESSION_TTL', 1800)
+                )
+    return _store
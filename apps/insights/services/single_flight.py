@@ -0,0 +1,130 @@
+"""
+Single-flight call coalescing
+Concurrent callers asking for the same key share one execution
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from django.core.cache import caches
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time within this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Call `fn`, or wait for the in-flight call with the same key
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument callable
+
+        Returns:
+            Result of the shared call (its exception is re-raised to every waiter)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for `key` is currently running"""
+        with self._lock:
+            return key in self._calls
+
+
+class SharedSingleFlight:
+    """
+    SingleFlight within the process, optionally extended across workers
+
+    Across workers, the process-level leader takes an add()-based lock in
+    the shared cache. The lock holder calls `fn` and publishes the result
+    for `wait` seconds; the other workers poll for it instead of making
+    the same call, and fall back to calling `fn` themselves if the holder
+    fails or the wait runs out.
+    """
+
+    def __init__(self, alias: str = 'default', across_workers: bool = False, lock_ttl: float = 60, wait: float = 30):
+        self.alias = alias
+        self.across_workers = across_workers
+        self.lock_ttl = lock_ttl
+        self.wait = wait
+        self._local = SingleFlight()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Call `fn` once for all concurrent callers with the same key
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument callable
+
+        Returns:
+            Result of the shared call
+        """
+        if not self.across_workers:
+            return self._local.do(key, fn)
+        return self._local.do(key, lambda: self._shared_do(key, fn))
+
+    def _shared_do(self, key: str, fn: Callable[[], Any]) -> Any:
+        shared = caches[self.alias]
+        lock_key = f'{key}:lock'
+        result_key = f'{key}:result'
+
+        envelope = shared.get(result_key)
+        if envelope is not None:
+            return envelope[0]
+
+        if not shared.add(lock_key, 1, timeout=self.lock_ttl):
+            # Another worker is calling: wait for its result
+            deadline = time.time() + self.wait
+            while time.time() < deadline:
+                time.sleep(0.05)
+                # Lock first: once it is released the result is already published
+                holder_running = shared.get(lock_key) is not None
+                envelope = shared.get(result_key)
+                if envelope is not None:
+                    return envelope[0]
+                if not holder_running:
+                    break
+            return fn()
+
+        try:
+            result = fn()
+            # Wrapped so a None result still counts as published
+            shared.set(result_key, (result,), timeout=self.wait)
+            return result
+        finally:
+            shared.delete(lock_key)
@@ -0,0 +1,206 @@
+"""
+Two-tier cache
+A bounded per-process LRU in front of a shared Django cache backend
+(Redis in production, LocMem as the local stand-in), with single-flight
+loading, stale-while-revalidate and jittered TTLs
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.core.cache import caches
+from django.db import connections
+
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Default for shared-tier lookups, so cached None / empty values count as hits
+MISSING = object()
+
+# Background refreshes of stale entries share a small pool per process
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cache-refresh')
+
+
+def call_and_close_db(fn: Callable, *args):
+    """Run fn on a pool thread without leaving a DB connection open there"""
+    try:
+        return fn(*args)
+    finally:
+        connections.close_all()
+
+
+class LocalLRU:
+    """Thread-safe LRU of (value, expires_at) entries"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, now: float) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, expires_at: float):
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class TieredCache:
+    """
+    Read-through cache for expensive loaders
+
+    Shared entries are stored as (value, fresh_until) and kept for
+    `stale_ttl` seconds past freshness. None and empty results are cached
+    too, for the shorter `negative_ttl`. A stale hit is served immediately
+    while one worker refreshes it in the background. Misses are loaded
+    once per process (single-flight) and, through an add()-based lock in
+    the shared backend, once across processes.
+    """
+
+    def __init__(
+        self,
+        alias: str = 'default',
+        local_max_entries: int = 512,
+        local_ttl: float = 30,
+        stale_ttl: float = 300,
+        negative_ttl: float = 30,
+        jitter: float = 0.1,
+        lock_ttl: float = 30,
+        lock_wait: float = 5
+    ):
+        self.alias = alias
+        self.local = LocalLRU(local_max_entries)
+        self.local_ttl = local_ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.jitter = jitter
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_wait
+        self._flight = SingleFlight()
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: float) -> Any:
+        """
+        Return the cached value for `key`, loading it on a miss
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+            ttl: Seconds the value stays fresh (before jitter); None and
+                empty values use negative_ttl instead
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        now = time.time()
+        entry = self.local.get(key, now)
+        if entry is not None:
+            return entry[0]
+
+        envelope = self.shared.get(key, MISSING)
+        if envelope is not MISSING:
+            value, fresh_until = envelope
+            if fresh_until > now:
+                self._set_local(key, value, fresh_until, now)
+                return value
+            # Stale: serve it and let one worker refresh in the background
+            if not self._flight.in_flight(key):
+                _refresh_executor.submit(call_and_close_db, self._refresh, key, loader, ttl)
+            return value
+
+        return self._flight.do(key, lambda: self._load_once(key, loader, ttl))
+
+    def refresh(self, key: str, loader: Callable[[], Any], ttl: float) -> Any:
+        """
+        Load `key` now and store it, whatever the state of the cached entry
+
+        Used by background prefetching to keep hot keys fresh so requests
+        never see a miss. Coalesces with in-flight loads of the same key.
+
+        Returns:
+            The loaded value
+        """
+        return self._flight.do(key, lambda: self._store(key, loader(), ttl))
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Store a value in both tiers"""
+        now = time.time()
+        fresh_until = now + self._jittered(ttl)
+        self.shared.set(key, (value, fresh_until), timeout=fresh_until - now + self.stale_ttl)
+        self._set_local(key, value, fresh_until, now)
+
+    def delete(self, key: str):
+        """Drop a key from the shared tier and this process's LRU"""
+        self.shared.delete(key)
+        self.local.delete(key)
+
+    def _load_once(self, key: str, loader: Callable[[], Any], ttl: float) -> Any:
+        """Load a missing key, coordinating with other processes"""
+        lock_key = f"{key}:lock"
+        locked = self.shared.add(lock_key, 1, timeout=self.lock_ttl)
+        if not locked:
+            # Another process is loading: wait briefly for its result
+            deadline = time.time() + self.lock_wait
+            while time.time() < deadline:
+                time.sleep(0.05)
+                envelope = self.shared.get(key, MISSING)
+                if envelope is not MISSING:
+                    return envelope[0]
+
+        try:
+            return self._store(key, loader(), ttl)
+        finally:
+            if locked:
+                self.shared.delete(lock_key)
+
+    def _refresh(self, key: str, loader: Callable[[], Any], ttl: float):
+        """Background refresh of a stale entry; failures keep the stale value"""
+        lock_key = f"{key}:lock"
+        if not self.shared.add(lock_key, 1, timeout=self.lock_ttl):
+            return
+
+        try:
+            self._flight.do(key, lambda: self._store(key, loader(), ttl))
+        except Exception:
+            logger.warning("Refreshing %s failed; keeping the stale value", key, exc_info=True)
+        finally:
+            self.shared.delete(lock_key)
+
+    def _store(self, key: str, value: Any, ttl: float) -> Any:
+        self.set(key, value, self.negative_ttl if self._is_negative(value) else ttl)
+        return value
+
+    @staticmethod
+    def _is_negative(value: Any) -> bool:
+        """None or an empty collection, e.g. an unknown ID or a country with no discussions"""
+        return value is None or (isinstance(value, (list, dict, tuple)) and not value)
+
+    def _set_local(self, key: str, value: Any, fresh_until: float, now: float):
+        self.local.set(key, value, min(fresh_until, now + self.local_ttl))
+
+    def _jittered(self, ttl: float) -> float:
+        return ttl * random.uniform(1 - self.jitter, 1 + self.jitter)
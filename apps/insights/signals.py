@@ -0,0 +1,28 @@
+"""Signal handlers keeping derived insight caches in sync with the database."""
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .models import Country, CountryNewsItem, CountrySentiment, CountrySummary, CountryWeather
+from .snapshots import bump_data_version
+
+SNAPSHOT_MODELS = (Country, CountrySummary, CountryWeather, CountrySentiment, CountryNewsItem)
+
+
+def invalidate_country_snapshots(**_kwargs) -> None:
+    """Bump the data version once the write that touched country data commits."""
+    transaction.on_commit(bump_data_version)
+
+
+for model in SNAPSHOT_MODELS:
+    post_save.connect(
+        invalidate_country_snapshots,
+        sender=model,
+        dispatch_uid=f"insights_snapshot_save_{model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_country_snapshots,
+        sender=model,
+        dispatch_uid=f"insights_snapshot_delete_{model.__name__}",
+    )
@@ -0,0 +1,60 @@
+"""Versioned snapshot cache for rendered country payloads."""
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import DataVersion
+
+DATA_VERSION_KEY = "insights:data_version"
+# Moves whenever a panel discussion is recorded; see PanelDiscussionService.record_discussion.
+PANEL_DATA_VERSION_KEY = "insights:panel_data_version"
+
+
+def get_data_version(key: str = DATA_VERSION_KEY) -> int:
+    """
+    Return the current data version, initialising it if needed.
+
+    The counter is a ``DataVersion`` row rather than a cache entry, so a bump
+    from any process (a web worker, ``seed_mock_data``, an ingest job) is seen
+    by every worker even when each one has its own local cache.
+    """
+    version = DataVersion.objects.filter(key=key).values_list("version", flat=True).first()
+    if version is None:
+        try:
+            with transaction.atomic():
+                # Seed from the clock so a recreated counter never reuses an old version.
+                version = DataVersion.objects.create(key=key, version=int(time.time() * 1000)).version
+        except IntegrityError:
+            version = DataVersion.objects.values_list("version", flat=True).get(key=key)
+    return version
+
+
+def bump_data_version(key: str = DATA_VERSION_KEY) -> int:
+    """Invalidate every snapshot by moving to a new data version."""
+    if not DataVersion.objects.filter(key=key).update(version=F("version") + 1):
+        get_data_version(key)
+        DataVersion.objects.filter(key=key).update(version=F("version") + 1)
+    return DataVersion.objects.values_list("version", flat=True).get(key=key)
+
+
+def snapshot_key(name: str, version: int) -> str:
+    """Build the cache key for a named snapshot at a given data version."""
+    return f"insights:snapshot:v{version}:{name}"
+
+
+def get_or_render(name: str, render: Callable[[], bytes], version: Optional[int] = None) -> bytes:
+    """Return the cached snapshot bytes for ``name`` or render and store them."""
+    if version is None:
+        version = get_data_version()
+    key = snapshot_key(name, version)
+    content = cache.get(key)
+    if content is None:
+        content = render()
+        cache.set(key, content, getattr(settings, "INSIGHTS_SNAPSHOT_TTL", 86400))
+    return content
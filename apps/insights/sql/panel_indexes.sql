@@ -0,0 +1,26 @@
+-- Indexes for the read-only panel tables.
+--
+-- These tables are written by the panel discussion pipeline and are not
+-- managed by Django migrations, so the indexes declared on the unmanaged
+-- models in apps/insights/models.py are applied from this file:
+--
+--   psql "postgresql://..." -f apps/insights/sql/panel_indexes.sql
+--
+-- CONCURRENTLY avoids locking writers; psql runs each statement in its own
+-- transaction, which CONCURRENTLY requires.
+
+-- latest_by_country: WHERE country_code = ? ORDER BY discussion_date DESC, id DESC LIMIT 1
+CREATE INDEX CONCURRENTLY IF NOT EXISTS panel_disc_country_latest_idx
+    ON panel_discussions (country_code, discussion_date DESC, id DESC);
+
+-- Prefetch of analyses: WHERE discussion_id IN (...) ORDER BY round_number, id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS panel_analysis_disc_round_idx
+    ON panel_expert_analyses (discussion_id, round_number, id);
+
+-- Prefetch of votes: WHERE discussion_id IN (...)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS panel_vote_discussion_idx
+    ON panel_votes (discussion_id, id);
+
+-- Prefetch of transcripts: WHERE discussion_id IN (...) ORDER BY turn_order
+CREATE INDEX CONCURRENTLY IF NOT EXISTS panel_transcript_disc_turn_idx
+    ON panel_transcripts (discussion_id, turn_order);
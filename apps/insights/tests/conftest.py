@@ -0,0 +1,55 @@
+"""Shared fixtures for the insights tests."""
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+
+from apps.insights.tests.fake_s3 import FakeS3Server
+from apps.insights.models import PanelDiscussion, PanelExpertAnalysis, PanelTranscript, PanelVote
+from apps.insights.services import aws_clients, panel_discussion_service
+
+PANEL_BUCKET = "panel-test"
+
+# Unmanaged: created by the panel pipeline in production, by the fixture in tests.
+PANEL_MODELS = (PanelDiscussion, PanelExpertAnalysis, PanelVote, PanelTranscript)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty default cache (LocMem is shared by the whole run)."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def panel_tables(transactional_db):
+    """Create the unmanaged panel tables, with their Meta.indexes, for one test."""
+    with connection.schema_editor() as editor:
+        for model in PANEL_MODELS:
+            editor.create_model(model)
+            # create_model skips Meta.indexes on unmanaged models (panel_indexes.sql in production)
+            for index in model._meta.indexes:
+                editor.add_index(model, index)
+    yield
+    with connection.schema_editor() as editor:
+        for model in reversed(PANEL_MODELS):
+            editor.delete_model(model)
+
+
+@pytest.fixture
+def fake_s3(settings, monkeypatch):
+    """Point boto3 at an in-memory S3 server holding an empty panel bucket."""
+    server = FakeS3Server().start()
+    monkeypatch.setenv("AWS_ENDPOINT_URL_S3", server.endpoint_url)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+    settings.PANEL_RESULTS_BUCKET = PANEL_BUCKET
+    aws_clients.reset_clients()
+    # The shared service holds a client of an earlier server
+    monkeypatch.setattr(panel_discussion_service, "_panel_service", None)
+    server.buckets[PANEL_BUCKET] = {}
+    yield server
+    aws_clients.reset_clients()
+    server.stop()
@@ -0,0 +1,200 @@
+"""
+In-memory fake S3 server for local tests and benchmarks.
+
+Implements the subset of the S3 REST API that ``PanelDiscussionService`` uses
+(path-style GetObject, HeadObject, PutObject, DeleteObject and ListObjectsV2
+with prefix, delimiter and pagination) on a threading HTTP server. An optional
+per-request ``latency`` simulates the round trip to real S3, which is what the
+concurrency benchmarks need. Point boto3 at it with ``AWS_ENDPOINT_URL_S3``.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from hashlib import md5
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+S3_XMLNS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+class StoredObject:
+    """Object body plus the headers S3 would return for it."""
+
+    def __init__(self, body: bytes, headers: Dict[str, str]):
+        self.body = body
+        self.headers = headers
+        self.etag = f'"{md5(body).hexdigest()}"'
+        self.last_modified = datetime.now(timezone.utc)
+
+
+class FakeS3Server(ThreadingHTTPServer):
+    """Threading HTTP server holding buckets in memory."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0), latency: float = 0.0):
+        super().__init__(address, FakeS3Handler)
+        self.latency = latency
+        self.buckets: Dict[str, Dict[str, StoredObject]] = {}
+        self.lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeS3Server":
+        """Serve from a daemon thread and return ``self``."""
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-s3", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class FakeS3Handler(BaseHTTPRequestHandler):
+    """Dispatch path-style S3 requests to the in-memory buckets."""
+
+    protocol_version = "HTTP/1.1"
+    server: FakeS3Server
+
+    def log_message(self, *_args) -> None:  # keep benchmark output clean
+        pass
+
+    def _target(self) -> Tuple[str, str, Dict[str, list]]:
+        parts = urlsplit(self.path)
+        bucket, _, key = parts.path.lstrip("/").partition("/")
+        return bucket, unquote(key), parse_qs(parts.query, keep_blank_values=True)
+
+    def _send(self, status: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _error(self, status: int, code: str) -> None:
+        body = f"<?xml version='1.0' encoding='UTF-8'?><Error><Code>{code}</Code><Message>{code}</Message></Error>"
+        self._send(status, body.encode(), {"Content-Type": "application/xml"})
+
+    def _bucket(self, name: str) -> Optional[Dict[str, StoredObject]]:
+        bucket = self.server.buckets.get(name)
+        if bucket is None:
+            self._error(404, "NoSuchBucket")
+        return bucket
+
+    def _delay(self) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+    def do_PUT(self) -> None:
+        self._delay()
+        bucket_name, key, _query = self._target()
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not key:
+            with self.server.lock:
+                self.server.buckets.setdefault(bucket_name, {})
+            self._send(200)
+            return
+        bucket = self._bucket(bucket_name)
+        if bucket is None:
+            return
+        headers = {
+            name: value
+            for name, value in self.headers.items()
+            if name.lower().startswith("x-amz-meta-") or name.lower() in ("content-type", "content-encoding")
+        }
+        stored = StoredObject(body, headers)
+        with self.server.lock:
+            bucket[key] = stored
+        self._send(200, headers={"ETag": stored.etag})
+
+    def do_DELETE(self) -> None:
+        self._delay()
+        bucket_name, key, _query = self._target()
+        bucket = self._bucket(bucket_name)
+        if bucket is None:
+            return
+        with self.server.lock:
+            bucket.pop(key, None)
+        self._send(204)
+
+    def do_HEAD(self) -> None:
+        self.do_GET()
+
+    def do_GET(self) -> None:
+        self._delay()
+        bucket_name, key, query = self._target()
+        bucket = self._bucket(bucket_name)
+        if bucket is None:
+            return
+        if not key:
+            self._list(bucket_name, bucket, query)
+            return
+        stored = bucket.get(key)
+        if stored is None:
+            self._error(404, "NoSuchKey")
+            return
+        headers = {
+            "ETag": stored.etag,
+            "Last-Modified": format_datetime(stored.last_modified, usegmt=True),
+            "Content-Type": "application/octet-stream",
+            **stored.headers,
+        }
+        self._send(200, stored.body, headers)
+
+    def _list(self, bucket_name: str, bucket: Dict[str, StoredObject], query: Dict[str, list]) -> None:
+        prefix = query.get("prefix", [""])[0]
+        delimiter = query.get("delimiter", [""])[0]
+        max_keys = int(query.get("max-keys", ["1000"])[0])
+        start_after = query.get("continuation-token", [""])[0]
+
+        with self.server.lock:
+            keys = sorted(key for key in bucket if key.startswith(prefix) and key > start_after)
+
+        contents, prefixes, last = [], [], ""
+        for key in keys:
+            if delimiter and delimiter in key[len(prefix):]:
+                common = prefix + key[len(prefix):].split(delimiter, 1)[0] + delimiter
+                if common in prefixes or common <= start_after:
+                    continue
+                prefixes.append(common)
+                last = common + "\uffff"  # skip the rest of the folder on the next page
+            else:
+                contents.append(key)
+                last = key
+            if len(contents) + len(prefixes) >= max_keys:
+                break
+        truncated = bool(last) and any(key > last for key in keys)
+
+        xml = [f'<?xml version="1.0" encoding="UTF-8"?><ListBucketResult xmlns="{S3_XMLNS}">']
+        xml.append(f"<Name>{escape(bucket_name)}</Name><Prefix>{escape(prefix)}</Prefix>")
+        xml.append(f"<KeyCount>{len(contents) + len(prefixes)}</KeyCount><MaxKeys>{max_keys}</MaxKeys>")
+        if delimiter:
+            xml.append(f"<Delimiter>{escape(delimiter)}</Delimiter>")
+        xml.append(f"<IsTruncated>{'true' if truncated else 'false'}</IsTruncated>")
+        if truncated:
+            xml.append(f"<NextContinuationToken>{escape(last)}</NextContinuationToken>")
+        for key in contents:
+            stored = bucket[key]
+            modified = stored.last_modified.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+            xml.append(
+                f"<Contents><Key>{escape(key)}</Key><LastModified>{modified}</LastModified>"
+                f"<ETag>{escape(stored.etag)}</ETag><Size>{len(stored.body)}</Size>"
+                "<StorageClass>STANDARD</StorageClass></Contents>"
+            )
+        for common in prefixes:
+            xml.append(f"<CommonPrefixes><Prefix>{escape(common)}</Prefix></CommonPrefixes>")
+        xml.append("</ListBucketResult>")
+        self._send(200, "".join(xml).encode(), {"Content-Type": "application/xml"})
@@ -0,0 +1,58 @@
+"""Shared failure counting in apps.insights.services.circuit_breaker."""
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+
+from apps.insights.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def fail():
+    raise ConnectionError("down")
+
+
+def trip(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+
+def test_opens_after_threshold_failures():
+    breaker = CircuitBreaker("s3:test", threshold=3, backoff=30)
+    trip(breaker, 2)
+    assert not breaker.is_open()
+
+    trip(breaker, 1)
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.call(lambda: pytest.fail("called through an open circuit"))
+    assert excinfo.value.retry_after == 30
+
+
+def test_open_circuit_is_seen_by_every_worker():
+    trip(CircuitBreaker("s3:test", threshold=2), 2)
+    assert CircuitBreaker("s3:test", threshold=2).is_open()
+
+
+def test_success_resets_the_count():
+    breaker = CircuitBreaker("s3:test", threshold=3)
+    trip(breaker, 2)
+    assert breaker.call(lambda: "ok") == "ok"
+    trip(breaker, 2)
+    assert not breaker.is_open()
+
+
+def test_ignored_errors_do_not_count():
+    breaker = CircuitBreaker("s3:test", threshold=1)
+    with pytest.raises(KeyError):
+        breaker.call(lambda: {}["missing"], is_failure=lambda e: not isinstance(e, KeyError))
+    assert not breaker.is_open()
+
+
+def test_first_failure_after_backoff_reopens():
+    breaker = CircuitBreaker("s3:test", threshold=3)
+    trip(breaker, 3)
+    cache.delete(breaker._open_key)  # backoff over
+    assert not breaker.is_open()
+
+    trip(breaker, 1)
+    assert breaker.is_open()
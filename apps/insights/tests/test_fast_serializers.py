@@ -0,0 +1,46 @@
+"""Byte parity between CountrySerializer and apps.insights.fast_serializers."""
+from __future__ import annotations
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from apps.insights import fast_serializers
+from apps.insights.management.commands.benchmark_country_serializers import build_countries
+from apps.insights.projection import FULL_PROJECTION, CountryProjection
+from apps.insights.sentiment import SentimentWindow
+from apps.insights.serializers import CountrySerializer
+
+PROJECTIONS = [
+    FULL_PROJECTION,
+    CountryProjection.from_query_params({"fields": "code,name,lat,lng"}),
+    CountryProjection.from_query_params({"fields": "code,summary"}),
+    CountryProjection.from_query_params({"include": "sentiment,weatherNow"}),
+    CountryProjection.from_query_params({"fields": "name,insights", "include": "news,moodNarrative,todaySummary"}),
+]
+
+
+def render_both(countries, projection, window):
+    renderer = JSONRenderer()
+    context = {"projection": projection, "sentiment_window": window}
+    drf = renderer.render(CountrySerializer(countries, many=True, context=context).data)
+    fast = renderer.render(fast_serializers.serialize_countries(countries, projection, window))
+    return drf, fast
+
+
+@pytest.mark.parametrize("projection", PROJECTIONS, ids=lambda projection: projection.key or "full")
+def test_rendered_json_is_byte_identical(projection):
+    # build_countries leaves every tenth country without summary and weather.
+    countries = build_countries(12, sentiments=8, news=2)
+    assert countries[0]._state.fields_cache == {"summary": None, "weather": None}
+
+    drf, fast = render_both(countries, projection, SentimentWindow())
+
+    assert drf == fast
+
+
+def test_downsampled_series_is_byte_identical():
+    countries = build_countries(3, sentiments=40, news=1)
+
+    drf, fast = render_both(countries, FULL_PROJECTION, SentimentWindow(points=5))
+
+    assert drf == fast
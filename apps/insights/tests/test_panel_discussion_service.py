@@ -0,0 +1,118 @@
+"""PanelDiscussionService against the in-memory fake S3 server."""
+from __future__ import annotations
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.insights.models import PanelCountryTrend, PanelDiscussionObject
+from apps.insights.services import panel_discussion_service
+from apps.insights.services.panel_discussion_service import PanelDiscussionService
+from apps.insights.tests.conftest import PANEL_BUCKET
+
+
+def discussion(index: int) -> dict:
+    return {
+        "country_code": "JP",
+        "topic": f"Topic {index}",
+        "final_mood": "neutral",
+        "final_score": 50 + index,
+        "introduction": "Introduction",
+        "conclusion": "Conclusion",
+        "metadata": {"timestamp": "2026-01-01T00:00:00+00:00", "total_turns": 1},
+        "votes": [],
+        "transcript": [{"speaker": "expert", "content": "x"}],
+    }
+
+
+def put_legacy(service: PanelDiscussionService, discussion_id: str) -> None:
+    """Store a discussion the way writers did before manifests existed."""
+    data = discussion(0)
+    service.s3_client.put_object(
+        Bucket=PANEL_BUCKET,
+        Key=service.discussion_key("JP", discussion_id),
+        Body=json.dumps(data).encode("utf-8"),
+        Metadata={"country_code": "JP", "final_mood": data["final_mood"], "final_score": str(data["final_score"])},
+    )
+
+
+@pytest.mark.django_db
+def test_first_store_without_manifest_keeps_listed_discussions(fake_s3):
+    service = PanelDiscussionService()
+    for index in range(3):
+        put_legacy(service, f"legacy{index}")
+
+    service.store_discussion("new1", discussion(1))
+
+    for country_code in (None, "JP"):
+        ids = {disc["discussion_id"] for disc in service.read_manifest(country_code)}
+        assert ids == {"legacy0", "legacy1", "legacy2", "new1"}
+
+
+@pytest.mark.django_db
+def test_store_replaces_existing_manifest_entry(fake_s3):
+    service = PanelDiscussionService()
+    service.store_discussion("d1", discussion(1))
+    service.store_discussion("d1", discussion(2))
+
+    manifest = service.read_manifest("JP")
+    assert [disc["discussion_id"] for disc in manifest] == ["d1"]
+    assert manifest[0]["final_score"] == 52.0
+
+
+@pytest.mark.django_db
+def test_restored_discussion_is_counted_once_in_the_trend(fake_s3):
+    service = PanelDiscussionService()
+    service.store_discussion("d1", discussion(1))
+    service.store_discussion("d2", discussion(2))
+    before = PanelCountryTrend.objects.values().get(country_code="JP")
+
+    service.store_discussion("d1", discussion(1))
+
+    assert PanelCountryTrend.objects.values().get(country_code="JP") == before
+    assert before["discussion_count"] == 2
+
+
+@pytest.mark.django_db
+def test_unknown_ids_are_resolved_from_the_index_alone(fake_s3, monkeypatch):
+    service = PanelDiscussionService()
+    service.store_discussion("d1", discussion(1))
+    put_legacy(service, "legacy0")
+    # Any S3 request would fail
+    monkeypatch.setattr(service, "s3_client", None)
+
+    assert service.resolve_key("d1") == service.discussion_key("JP", "d1")
+    assert service.resolve_key("legacy0") is None
+    assert service.resolve_key("missing") is None
+
+
+@pytest.mark.django_db
+def test_rebuild_panel_manifest_backfills_the_index(fake_s3):
+    service = PanelDiscussionService()
+    put_legacy(service, "legacy0")
+    assert service.get_discussion_summary("legacy0") is None
+
+    call_command("rebuild_panel_manifest", stdout=StringIO())
+
+    assert service.resolve_key("legacy0") == service.discussion_key("JP", "legacy0")
+    assert PanelDiscussionService().get_discussion("legacy0")["topic"] == "Topic 0"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("parser", ["ijson", "json"])
+@pytest.mark.parametrize("encoding", ["gzip", "none"])
+def test_get_discussion_reads_the_stored_body(fake_s3, settings, monkeypatch, parser, encoding):
+    if parser == "ijson":
+        monkeypatch.setattr(panel_discussion_service, "ijson", pytest.importorskip("ijson"))
+    else:
+        monkeypatch.setattr(panel_discussion_service, "ijson", None)
+    settings.PANEL_S3_COMPRESSION = encoding
+    service = PanelDiscussionService()
+    service.store_discussion("d1", discussion(1))
+
+    data = service.get_discussion("d1")
+
+    assert data == discussion(1)
+    assert type(data["final_score"]) is int
@@ -0,0 +1,70 @@
+"""Paging and NDJSON streaming of panel transcripts."""
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.insights.models import PanelDiscussion, PanelTranscript
+
+
+@pytest.fixture
+def discussion(panel_tables):
+    discussion = PanelDiscussion.objects.create(
+        country_code="jp",
+        topic="Topic",
+        final_mood="neutral",
+        final_score=50,
+        discussion_date=date(2026, 1, 1),
+        created_at=timezone.now(),
+    )
+    PanelTranscript.objects.bulk_create(
+        PanelTranscript(
+            discussion=discussion,
+            speaker="expert",
+            content=f"turn {turn}",
+            turn_order=turn,
+            created_at=timezone.now(),
+        )
+        for turn in range(450)
+    )
+    return discussion
+
+
+def test_stream_fetches_keyset_pages(client, discussion, settings):
+    settings.PANEL_TRANSCRIPT_CHUNK_SIZE = 200
+
+    response = client.get(f"/api/panels/{discussion.pk}/transcript/", {"stream": "1", "after_turn": "9"})
+    with CaptureQueriesContext(connection) as queries:
+        lines = b"".join(response.streaming_content).splitlines()
+
+    assert [json.loads(line)["turn_order"] for line in lines] == list(range(10, 450))
+    # 440 turns in pages of 200: two full pages and a short last one
+    assert len(queries) == 3
+    assert all("LIMIT 200" in query["sql"] for query in queries.captured_queries)
+
+
+def test_page_reports_next_after_turn(client, discussion):
+    response = client.get(f"/api/panels/{discussion.pk}/transcript/", {"after_turn": "99", "limit": "50"})
+
+    data = response.json()
+    assert [turn["turn_order"] for turn in data["results"]] == list(range(100, 150))
+    assert data["next_after_turn"] == 149
+
+
+def test_stream_is_driven_asynchronously_under_asgi(async_client, discussion, settings):
+    settings.PANEL_TRANSCRIPT_CHUNK_SIZE = 100
+
+    async def fetch():
+        response = await async_client.get(f"/api/panels/{discussion.pk}/transcript/", {"stream": "1"})
+        # A sync iterator would be buffered whole by sync_to_async(list)
+        assert response.is_async
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    lines = async_to_sync(fetch)().splitlines()
+    assert [json.loads(line)["turn_order"] for line in lines] == list(range(450))
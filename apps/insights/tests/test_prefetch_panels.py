@@ -0,0 +1,25 @@
+"""The prefetch_panels management command."""
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+
+@pytest.mark.django_db
+def test_refuses_a_process_local_cache(fake_s3):
+    with pytest.raises(CommandError, match="CACHE_URL"):
+        call_command("prefetch_panels", stdout=StringIO())
+
+
+@pytest.mark.django_db
+def test_warms_a_shared_cache(fake_s3, settings, tmp_path):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)}
+    }
+    out = StringIO()
+
+    call_command("prefetch_panels", stdout=out)
+
+    assert "Refreshed 2 listings" in out.getvalue()
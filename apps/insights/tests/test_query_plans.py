@@ -0,0 +1,28 @@
+"""The hot lookup paths are planned on their composite indexes."""
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.insights.management.commands.check_query_plans import explain, hot_queries
+
+
+@pytest.mark.parametrize(
+    "label, queryset, index_name", hot_queries(), ids=[label for label, _queryset, _index in hot_queries()]
+)
+def test_hot_query_uses_expected_index(panel_tables, label, queryset, index_name):
+    assert index_name in explain(queryset), label
+
+
+def test_command_passes_with_indexes(panel_tables):
+    call_command("check_query_plans", stdout=StringIO())
+
+
+@pytest.mark.django_db
+def test_command_fails_on_missing_tables():
+    with pytest.raises(CommandError, match="latest_by_country"):
+        call_command("check_query_plans", stdout=StringIO())
+
+    call_command("check_query_plans", "--skip-missing", stdout=StringIO())
@@ -0,0 +1,136 @@
+"""Answer reuse in apps.insights.services.response_cache and RAGChatService."""
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db.backends.signals import connection_created
+
+from apps.insights.services.rag_chat_service import RAGChatService
+from apps.insights.services.response_cache import normalize_query
+from apps.insights.views import rag_chat_views
+from apps.insights.views.rag_chat_views import RAGChatView
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        ("What's the mood in Japan?", "whats the mood in japan"),
+        ("Ｊａｐａｎ　mood？", "japan mood"),
+        ("“Japan”, please!", "japan please"),
+        ("Mood in the U.S.", "mood in the us"),
+    ],
+)
+def test_equivalent_questions_share_a_key(left, right):
+    assert normalize_query(left) == normalize_query(right)
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [("2+2", "22"), ("score -5", "score 5"), ("3.5 points", "35 points"), ("a/b", "ab"), ("x = y", "x y")],
+)
+def test_operators_and_signs_are_kept(left, right):
+    assert normalize_query(left) != normalize_query(right)
+
+
+class FakeAgent:
+    """bedrock-agent-runtime stand-in recording every invoke_agent call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def invoke_agent(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"completion": [{"chunk": {"bytes": f"answer {len(self.calls)}".encode()}}]}
+
+
+@pytest.fixture
+def service(monkeypatch, settings):
+    monkeypatch.setenv("RAG_AGENT_ID", "agent")
+    settings.RAG_RESPONSE_CACHE_TTL = 3600
+    settings.RAG_TRACE_MODE = "off"
+    service = RAGChatService()
+    service.bedrock_runtime = FakeAgent()
+    return service
+
+
+@pytest.mark.django_db
+def test_new_sessions_reuse_cached_answers(service):
+    first = service.chat("How is Japan?")
+    second = service.chat("how is japan")
+
+    assert first["response"] == second["response"] == "answer 1"
+    assert len(service.bedrock_runtime.calls) == 1
+    assert first["session_id"] != second["session_id"]
+    assert service.get_session_history(second["session_id"])[1]["content"] == "answer 1"
+
+
+@pytest.mark.django_db
+def test_existing_sessions_are_never_answered_from_cache(service):
+    service.chat("How is Japan?")
+    session_id = service.chat("Hello")["session_id"]
+
+    # Another user's cached answer must not leak into this conversation
+    assert service.chat("How is Japan?", session_id)["response"] == "answer 3"
+
+
+@pytest.mark.django_db
+def test_follow_up_to_a_cached_answer_seeds_the_agent(service):
+    service.chat("How is Japan?")
+    session_id = service.chat("How is Japan?")["session_id"]
+
+    service.chat("And Korea?", session_id)
+    service.chat("And China?", session_id)
+
+    seeded, plain = service.bedrock_runtime.calls[1:]
+    assert seeded["sessionId"] == session_id
+    assert seeded["sessionState"] == {
+        "conversationHistory": {
+            "messages": [
+                {"role": "user", "content": [{"text": "How is Japan?"}]},
+                {"role": "assistant", "content": [{"text": "answer 1"}]},
+            ]
+        }
+    }
+    assert "sessionState" not in plain
+
+
+@pytest.mark.django_db(transaction=True)
+def test_streamed_cache_write_reads_the_database_on_the_request_thread(service, async_client, monkeypatch):
+    monkeypatch.setattr(rag_chat_views, "get_rag_service", lambda: service)
+    request_threads = []
+    monkeypatch.setattr(RAGChatView, "post", _recording_thread(RAGChatView.post, request_threads))
+    query_threads = []
+    connection_created.connect(_record_connection(query_threads), weak=False, dispatch_uid="stream-test")
+
+    async def stream():
+        response = await async_client.post(
+            "/api/insights/chat/?stream=ndjson", {"message": "How is Japan?"}, content_type="application/json"
+        )
+        return [json.loads(line) async for line in response.streaming_content]
+
+    try:
+        events = async_to_sync(stream)()
+    finally:
+        connection_created.disconnect(dispatch_uid="stream-test")
+
+    assert events[-1]["type"] == "done"
+    # The answer was cached by the stream...
+    assert service.chat_cache.get("How is Japan?")["response"] == "answer 1"
+    # ...without opening a connection on a thread other than the request's
+    assert set(query_threads) <= set(request_threads)
+
+
+def _recording_thread(view, threads):
+    def post(self, request):
+        threads.append(threading.get_ident())
+        return view(self, request)
+    return post
+
+
+def _record_connection(threads):
+    def receiver(sender, connection, **kwargs):
+        threads.append(threading.get_ident())
+    return receiver
@@ -0,0 +1,36 @@
+"""LTTB downsampling in apps.insights.sentiment."""
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from apps.insights.sentiment import lttb
+
+
+def wave(size: int) -> list:
+    return [(float(x), math.sin(x / 10)) for x in range(size)]
+
+
+@pytest.mark.parametrize("threshold", [5, 10])
+def test_short_series_are_returned_whole(threshold):
+    assert lttb(wave(5), threshold) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("threshold, expected", [(0, []), (1, [0]), (2, [0, 9])])
+def test_tiny_thresholds_keep_the_endpoints(threshold, expected):
+    assert lttb(wave(10), threshold) == expected
+
+
+@pytest.mark.parametrize("threshold", [3, 17, 100])
+def test_keeps_threshold_ordered_points_with_both_ends(threshold):
+    indices = lttb(wave(1000), threshold)
+    assert len(indices) == threshold
+    assert indices == sorted(set(indices))
+    assert indices[0] == 0 and indices[-1] == 999
+
+
+def test_keeps_a_spike():
+    series = [(float(x), 0.0) for x in range(100)]
+    series[42] = (42.0, 10.0)
+    assert 42 in lttb(series, 10)
@@ -0,0 +1,160 @@
+"""Bounded conversation history in apps.insights.services.session_store."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache import cache
+
+from apps.insights.services import session_store
+from apps.insights.services.session_store import (
+    CacheSessionBackend,
+    LocalSessionBackend,
+    RedisSessionBackend,
+    SessionBusy,
+    SessionStore,
+    decode_turn,
+    encode_turn,
+)
+
+
+@pytest.fixture(params=["cache", "local", "redis"])
+def backend(request, monkeypatch):
+    if request.param == "cache":
+        return CacheSessionBackend()
+    if request.param == "local":
+        return LocalSessionBackend()
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        session_store.redis.Redis, "from_url", classmethod(lambda cls, url: fakeredis.FakeRedis(server=server))
+    )
+    return RedisSessionBackend("redis://test")
+
+
+def turns(history: list) -> list:
+    return [message["turn"] for message in history if message["role"] == "user"]
+
+
+@pytest.mark.parametrize("answer", ["short", "long answer " * 100])
+def test_turn_encoding_round_trips(answer):
+    turn = {"user": "How is Japan?", "assistant": answer}
+    entry = encode_turn(turn)
+    assert decode_turn(entry) == turn
+    if len(answer) > 500:
+        assert len(entry) < len(answer)
+
+
+def test_keeps_the_newest_turns(backend):
+    store = SessionStore(backend, max_turns=3)
+    for index in range(1, 6):
+        assert store.append_turn("s1", f"q{index}", f"a{index}") == index
+
+    history = store.history("s1")
+    assert turns(history) == [3, 4, 5]
+    assert history[-2:] == [
+        {"role": "user", "content": "q5", "turn": 5},
+        {"role": "assistant", "content": "a5", "turn": 5},
+    ]
+
+
+def test_pages_back_with_before(backend):
+    store = SessionStore(backend, max_turns=10)
+    for index in range(1, 8):
+        store.append_turn("s1", f"q{index}", f"a{index}")
+
+    assert turns(store.history("s1", limit=3)) == [5, 6, 7]
+    assert turns(store.history("s1", limit=3, before=5)) == [2, 3, 4]
+    assert turns(store.history("s1", limit=3, before=2)) == [1]
+    assert store.history("s1", limit=3, before=1) == []
+
+
+def test_byte_limit_keeps_at_least_the_newest_turn(backend):
+    store = SessionStore(backend, max_turns=10, max_bytes=64)
+    store.append_turn("s1", "q1", "x" * 40)
+    store.append_turn("s1", "q2", "y" * 40)
+    assert turns(store.history("s1")) == [2]
+
+    store.append_turn("s1", "q3", "z" * 500)
+    assert turns(store.history("s1")) == [3]
+
+
+def test_sessions_are_isolated_and_clearable(backend):
+    store = SessionStore(backend)
+    store.append_turn("s1", "q", "a")
+    store.append_turn("s2", "q", "a")
+
+    store.clear("s1")
+    assert store.history("s1") == []
+    assert turns(store.history("s2")) == [1]
+    assert store.append_turn("s1", "q", "a") == 1
+
+
+def test_local_sessions_expire(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(session_store.time, "time", lambda: clock[0])
+    store = SessionStore(LocalSessionBackend(), ttl=60)
+    store.append_turn("s1", "q", "a")
+
+    clock[0] += 59
+    assert turns(store.history("s1")) == [1]
+    clock[0] += 2
+    assert store.history("s1") == []
+
+
+def test_concurrent_appends_are_not_lost(backend):
+    store = SessionStore(backend, max_turns=100)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        seqs = list(executor.map(lambda index: store.append_turn("s1", f"q{index}", "a"), range(40)))
+
+    assert sorted(seqs) == list(range(1, 41))
+    assert turns(store.history("s1")) == list(range(1, 41))
+
+
+def test_cache_backend_refuses_to_write_without_the_lock():
+    backend = CacheSessionBackend(lock_wait=0.1)
+    store = SessionStore(backend)
+    cache.add("rag_session:s1:lock", "other writer")
+
+    with pytest.raises(SessionBusy):
+        store.append_turn("s1", "q", "a")
+    assert store.history("s1") == []
+    # The other writer's lock is left alone
+    assert cache.get("rag_session:s1:lock") == "other writer"
+
+
+def test_cache_backend_releases_only_its_own_lock(monkeypatch):
+    backend = CacheSessionBackend()
+    real_set = backend.cache.set
+
+    def set_after_lock_expired(key, value, timeout=None):
+        # Our lock expired mid-write and another writer took it
+        backend.cache.set = real_set
+        cache.set("rag_session:s1:lock", "other writer")
+        real_set(key, value, timeout=timeout)
+
+    monkeypatch.setattr(backend.cache, "set", set_after_lock_expired)
+    SessionStore(backend).append_turn("s1", "q", "a")
+
+    assert cache.get("rag_session:s1:lock") == "other writer"
+
+
+def test_local_backend_sweeps_expired_sessions(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(session_store.time, "time", lambda: clock[0])
+    backend = LocalSessionBackend(sweep_interval=10)
+    store = SessionStore(backend, ttl=60)
+    for index in range(5):
+        store.append_turn(f"s{index}", "q", "a")
+
+    clock[0] += 61
+    store.append_turn("fresh", "q", "a")
+    assert list(backend._sessions) == ["rag_session:fresh"]
+
+
+@pytest.mark.parametrize(
+    "url, expected", [("", CacheSessionBackend), ("memory://", LocalSessionBackend)]
+)
+def test_backend_is_chosen_by_url(url, expected):
+    assert isinstance(session_store._backend(url), expected)
@@ -0,0 +1,75 @@
+"""Call coalescing in apps.insights.services.single_flight."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache import cache
+
+from apps.insights.services.single_flight import SharedSingleFlight, SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return "answer"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(flight.do, "key", slow) for _ in range(5)]
+        while not flight.in_flight("key"):
+            pass
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["answer"] * 5
+    assert len(calls) == 1
+    assert not flight.in_flight("key")
+
+
+def test_error_reaches_every_waiter_and_is_not_kept():
+    flight = SingleFlight()
+    with pytest.raises(RuntimeError):
+        flight.do("key", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_sequential_calls_are_not_cached():
+    flight = SingleFlight()
+    assert [flight.do("key", lambda value=value: value) for value in (1, 2)] == [1, 2]
+
+
+def test_shared_result_is_reused_by_another_worker():
+    calls = []
+    first, second = SharedSingleFlight(across_workers=True), SharedSingleFlight(across_workers=True)
+
+    assert first.do("kb:q", lambda: calls.append(1) or None) is None
+    # A None result is published too, so the second worker does not repeat the call
+    assert second.do("kb:q", lambda: calls.append(2) or "again") is None
+    assert calls == [1]
+    assert cache.get("kb:q:lock") is None
+
+
+def test_waiter_gets_the_lock_holders_result():
+    flight = SharedSingleFlight(across_workers=True, wait=5)
+    cache.add("kb:q:lock", 1)
+    timer = threading.Timer(0.2, lambda: (cache.set("kb:q:result", ("published",)), cache.delete("kb:q:lock")))
+    timer.start()
+
+    assert flight.do("kb:q", lambda: "own call") == "published"
+    timer.join()
+
+
+def test_waiter_calls_itself_when_the_holder_gives_up():
+    flight = SharedSingleFlight(across_workers=True, wait=5)
+    cache.add("kb:q:lock", 1)
+    timer = threading.Timer(0.2, cache.delete, args=["kb:q:lock"])
+    timer.start()
+
+    assert flight.do("kb:q", lambda: "own call") == "own call"
+    timer.join()
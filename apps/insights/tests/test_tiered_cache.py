@@ -0,0 +1,106 @@
+"""Read-through behaviour of apps.insights.services.tiered_cache."""
+from __future__ import annotations
+
+import time
+
+import pytest
+from django.core.cache import cache
+
+from apps.insights.services import tiered_cache
+from apps.insights.services.tiered_cache import TieredCache
+
+
+class InlineExecutor:
+    """Run background refreshes synchronously so tests can observe them."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(fn)
+        fn(*args)
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    inline = InlineExecutor()
+    monkeypatch.setattr(tiered_cache, "_refresh_executor", inline)
+    return inline
+
+
+def make_stale(key: str, value) -> None:
+    """Store an entry whose freshness ran out a second ago."""
+    cache.set(key, (value, time.time() - 1), timeout=60)
+
+
+def test_miss_loads_once_then_hits():
+    store = TieredCache(jitter=0)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return ["d1"]
+
+    assert store.get_or_load("k", loader, ttl=60) == ["d1"]
+    assert TieredCache().get_or_load("k", loader, ttl=60) == ["d1"]
+    assert store.get_or_load("k", loader, ttl=60) == ["d1"]
+    assert len(calls) == 1
+
+
+def test_stale_entry_is_served_while_it_is_refreshed(executor):
+    make_stale("k", "old")
+    store = TieredCache(jitter=0)
+
+    assert store.get_or_load("k", lambda: "new", ttl=60) == "old"
+    # The refresh ran on the pool thread, closing its DB connections afterwards
+    assert executor.submitted == [tiered_cache.call_and_close_db]
+    value, fresh_until = cache.get("k")
+    assert value == "new" and fresh_until > time.time()
+
+
+def test_failed_refresh_keeps_the_stale_value(executor):
+    make_stale("k", "old")
+
+    def failing():
+        raise RuntimeError("S3 down")
+
+    assert TieredCache().get_or_load("k", failing, ttl=60) == "old"
+    assert cache.get("k")[0] == "old"
+    assert cache.get("k:lock") is None
+
+
+def test_stale_entry_is_refreshed_by_one_worker_only(executor):
+    make_stale("k", "old")
+    cache.add("k:lock", 1)
+    calls = []
+
+    assert TieredCache().get_or_load("k", lambda: calls.append(1), ttl=60) == "old"
+    assert calls == []
+
+
+@pytest.mark.parametrize("empty", [None, [], {}])
+def test_empty_results_use_the_negative_ttl(empty):
+    store = TieredCache(negative_ttl=5, jitter=0)
+    before = time.time()
+
+    assert store.get_or_load("k", lambda: empty, ttl=3600) == empty
+    _value, fresh_until = cache.get("k")
+    assert before + 5 <= fresh_until <= time.time() + 5
+    # Cached None still counts as a hit
+    assert TieredCache().get_or_load("k", lambda: pytest.fail("reloaded"), ttl=3600) == empty
+
+
+def test_ttl_jitter_stays_within_bounds():
+    store = TieredCache(jitter=0.1)
+    assert all(90 <= store._jittered(100) <= 110 for _ in range(100))
+
+
+def test_local_tier_is_bounded_and_expires():
+    store = TieredCache(local_max_entries=2, local_ttl=30)
+    for key in ("a", "b", "c"):
+        store.set(key, key, ttl=60)
+
+    now = time.time()
+    assert store.local.get("a", now) is None
+    assert store.local.get("c", now)[0] == "c"
+    assert store.local.get("c", now + 31) is None
@@ -0,0 +1,130 @@
+"""
+Incremental panel trend analytics.
+
+Every stored discussion updates its country's ``PanelCountryTrend`` row in
+O(1): an exponential moving average and exponentially weighted variance of
+``final_score`` per window in ``TREND_WINDOWS``, mood transition counts and
+the current mood / score-direction streaks. Reading a trend is a single row
+lookup, whatever the length of the history.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Mapping, Optional
+
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from .models import PanelCountryTrend
+
+# EMA spans, in discussions, selectable with ``?window=``.
+TREND_WINDOWS = (5, 10, 30)
+DEFAULT_TREND_WINDOW = 10
+
+
+def parse_window(raw: Optional[str]) -> int:
+    """Validate a ``?window=`` value against ``TREND_WINDOWS``."""
+    if not raw:
+        return DEFAULT_TREND_WINDOW
+    try:
+        window = int(raw)
+    except ValueError:
+        window = 0
+    if window not in TREND_WINDOWS:
+        choices = ", ".join(str(value) for value in TREND_WINDOWS)
+        raise ValidationError({"window": [f"Must be one of {choices}."]})
+    return window
+
+
+def _update_stats(stats: Dict[str, list], score: float) -> Dict[str, list]:
+    updated = {}
+    for window in TREND_WINDOWS:
+        previous = stats.get(str(window))
+        if previous is None:
+            updated[str(window)] = [score, 0.0]
+            continue
+        ema, variance = previous
+        alpha = 2 / (window + 1)
+        delta = score - ema
+        increment = alpha * delta
+        updated[str(window)] = [
+            round(ema + increment, 4),
+            round((1 - alpha) * (variance + delta * increment), 4),
+        ]
+    return updated
+
+
+def apply_discussion(trend: PanelCountryTrend, entry: Mapping[str, Any]) -> bool:
+    """
+    Fold one discussion into ``trend`` in place.
+
+    ``entry`` is discussion metadata as kept in the manifests
+    (``discussion_id``, ``timestamp``, ``final_score``, ``final_mood``).
+    Entries not newer than the last one applied, or repeating it, are
+    ignored, so replays are idempotent. Returns whether the trend changed.
+    """
+    if trend.last_timestamp and entry["timestamp"] <= trend.last_timestamp:
+        return False
+    if entry["discussion_id"] == trend.last_discussion_id:
+        return False
+
+    score = float(entry["final_score"])
+    mood = entry["final_mood"]
+
+    if trend.discussion_count:
+        transition = f"{trend.last_mood}->{mood}"
+        trend.mood_transitions[transition] = trend.mood_transitions.get(transition, 0) + 1
+        trend.mood_streak = trend.mood_streak + 1 if mood == trend.last_mood else 1
+        if score > trend.last_score:
+            trend.score_streak = trend.score_streak + 1 if trend.score_streak > 0 else 1
+        elif score < trend.last_score:
+            trend.score_streak = trend.score_streak - 1 if trend.score_streak < 0 else -1
+        else:
+            trend.score_streak = 0
+    else:
+        trend.mood_streak = 1
+
+    trend.score_stats = _update_stats(trend.score_stats, score)
+    trend.discussion_count += 1
+    trend.last_discussion_id = entry["discussion_id"]
+    trend.last_timestamp = entry["timestamp"]
+    trend.last_score = score
+    trend.last_mood = mood
+    return True
+
+
+def record_discussion(entry: Mapping[str, Any]) -> None:
+    """Apply a newly stored discussion to its country's trend row."""
+    with transaction.atomic():
+        trend, _created = PanelCountryTrend.objects.select_for_update().get_or_create(
+            country_code=entry["country_code"]
+        )
+        if apply_discussion(trend, entry):
+            trend.save()
+
+
+def trend_payload(
+    trend: Optional[PanelCountryTrend], window: int = DEFAULT_TREND_WINDOW
+) -> Optional[Dict[str, Any]]:
+    """Serialize the rolling statistics of ``trend`` for one ``window``."""
+    if trend is None or not trend.discussion_count:
+        return None
+    ema, variance = trend.score_stats[str(window)]
+    if trend.score_streak > 0:
+        direction = "up"
+    elif trend.score_streak < 0:
+        direction = "down"
+    else:
+        direction = "flat"
+    return {
+        "window": window,
+        "discussion_count": trend.discussion_count,
+        "last_score": trend.last_score,
+        "last_mood": trend.last_mood,
+        "score_ema": ema,
+        "volatility": round(math.sqrt(variance), 4),
+        "mood_transitions": trend.mood_transitions,
+        "mood_streak": {"mood": trend.last_mood, "length": trend.mood_streak},
+        "score_streak": {"direction": direction, "length": abs(trend.score_streak)},
+        "updated_at": trend.updated_at.isoformat(),
+    }
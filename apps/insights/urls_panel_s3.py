@@ -0,0 +1,26 @@
+"""
+Stored (S3) panel discussion URL Configuration
+"""
+
+from django.urls import path
+from .views.panel_async_views import (
+    AsyncPanelDiscussionListView,
+    AsyncPanelDiscussionDetailView,
+    AsyncPanelDiscussionSummaryView,
+    AsyncCountryHistoryView
+)
+
+urlpatterns = [
+    path('panel/discussions/', AsyncPanelDiscussionListView.as_view(), name='panel-s3-list'),
+    path(
+        'panel/discussions/<str:discussion_id>/',
+        AsyncPanelDiscussionDetailView.as_view(),
+        name='panel-s3-detail'
+    ),
+    path(
+        'panel/discussions/<str:discussion_id>/summary/',
+        AsyncPanelDiscussionSummaryView.as_view(),
+        name='panel-s3-summary'
+    ),
+    path('panel/history/<str:country_code>/', AsyncCountryHistoryView.as_view(), name='panel-s3-history'),
+]
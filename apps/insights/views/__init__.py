@@ -0,0 +1,425 @@
+"""View logic for insights APIs."""
+from __future__ import annotations
+
+from django.conf import settings
+from django.db.models import prefetch_related_objects
+from django.http import Http404, HttpResponse
+from django.utils.functional import cached_property
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from .. import conditional, fast_serializers, queries, snapshots
+from ..queries import latest_panel_discussions
+from ..models import (
+    Country,
+    CountrySentiment,
+    PanelDiscussion,
+    PanelLatestDiscussion,
+    PanelTranscript,
+)
+from ..pagination import CountryCursorPagination
+from ..projection import CountryProjection
+from ..sentiment import SentimentWindow
+from ..serializers import (
+    CountrySerializer,
+    PanelDiscussionListSerializer,
+    PanelDiscussionSerializer,
+    PanelLatestDiscussionSerializer,
+    PanelTranscriptSerializer,
+)
+from .streaming import streaming_response
+
+
+class CountryViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only viewset exposing countries with nested insights.
+
+    Query params:
+        - fields (optional): Top-level fields to return, e.g. ``code,name,lat,lng``
+        - include (optional): Insight blocks to return, e.g. ``sentiment,weatherNow``
+        - page_size / cursor (optional): Enable cursor pagination on the list
+        - from / to (optional): ISO dates bounding the sentiment series
+        - points (optional): Downsample each sentiment series to N points (LTTB)
+    """
+
+    queryset = (
+        Country.objects.all()
+        .select_related("summary", "weather")
+        .prefetch_related(
+            "sentiments",
+            "news_items",
+        )
+    )
+    serializer_class = CountrySerializer
+    pagination_class = CountryCursorPagination
+    lookup_field = "code"
+
+    @cached_property
+    def projection(self) -> CountryProjection:
+        """Fields requested through ``?fields=`` / ``?include=``."""
+        return CountryProjection.from_query_params(self.request.query_params)
+
+    @cached_property
+    def sentiment_window(self) -> SentimentWindow:
+        """Sentiment bounds and size requested through ``?from=&to=&points=``."""
+        return SentimentWindow.from_query_params(self.request.query_params)
+
+    def get_queryset(self):
+        """Only join and prefetch the relations the projection renders."""
+        sentiments = None
+        if self.sentiment_window.is_bounded:
+            sentiments = self.sentiment_window.filter(CountrySentiment.objects.all())
+        return self.projection.apply(super().get_queryset(), sentiments=sentiments)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["projection"] = self.projection
+        context["sentiment_window"] = self.sentiment_window
+        return context
+
+    def list(self, request, *args, **kwargs):
+        """Serve the country list from the versioned snapshot cache."""
+        return self._snapshot_response(request, self._snapshot_name("countries"), self._list_payload)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Serve a single country from the versioned snapshot cache."""
+        return self._snapshot_response(
+            request,
+            self._snapshot_name(f"country:{kwargs[self.lookup_field]}"),
+            lambda: self._serialize(self.get_object()),
+        )
+
+    @action(detail=True, methods=["get"], url_path="sentiment")
+    def sentiment(self, request, code=None):
+        """
+        Sentiment series for one country, bounded and downsampled in the same
+        way as the nested ``insights.sentiment`` block.
+
+        GET /api/countries/{code}/sentiment/?from=&to=&points=
+        """
+        return self._snapshot_response(
+            request,
+            self._snapshot_name(f"sentiment:{code}", projected=False),
+            lambda: self._sentiment_payload(code),
+        )
+
+    def _sentiment_payload(self, code):
+        """Fetch one country's series with ``values_list`` and no model instances."""
+        country_id = Country.objects.filter(code=code).values_list("id", flat=True).first()
+        if country_id is None:
+            raise Http404
+        window = self.sentiment_window
+        series = queries.sentiment_series(
+            window.filter(CountrySentiment.objects.filter(country_id=country_id)), window
+        )
+        return {"code": code, "sentiment": series.get(country_id, [])}
+
+    def _snapshot_name(self, base, projected=True):
+        """Qualify a snapshot name with the request's projection, window and page."""
+        parts = [base, self.sentiment_window.key]
+        if projected:
+            parts.append(self.projection.key)
+        if self.action == "list":
+            parts.append(self._page_key())
+        return ":".join(filter(None, parts))
+
+    def _page_key(self) -> str:
+        """Identify the requested page for the snapshot key; empty when unpaginated."""
+        paginator = self.paginator
+        params = self.request.query_params
+        if paginator.page_size_query_param not in params:
+            return ""
+        return "page={};size={};host={}".format(
+            params.get(paginator.cursor_query_param, ""),
+            params[paginator.page_size_query_param],
+            self.request.get_host(),
+        )
+
+    def _list_payload(self):
+        """Build the (optionally paginated) country list with the configured query plan."""
+        queryset = self.filter_queryset(self.get_queryset())
+        values_plan = getattr(settings, "INSIGHTS_COUNTRY_QUERY_PLAN", "orm") == "values"
+        if values_plan:
+            # The values plan fetches its own columns; pages only need ids.
+            queryset = queryset.select_related(None).prefetch_related(None).only("id", "name")
+
+        page = self.paginate_queryset(queryset)
+        if values_plan:
+            if page is not None:
+                queryset = queryset.filter(pk__in=[country.pk for country in page]).order_by(
+                    *self.paginator.ordering
+                )
+            data = queries.country_list_payload(queryset, self.projection, self.sentiment_window)
+        else:
+            data = self._serialize(queryset if page is None else page, many=True)
+
+        if page is not None:
+            return self.get_paginated_response(data).data
+        return data
+
+    def _serialize(self, instance, many=False):
+        """Serialize with the DRF tree or, if enabled, the plain-function path."""
+        if getattr(settings, "INSIGHTS_FAST_SERIALIZER", False):
+            if many:
+                return fast_serializers.serialize_countries(
+                    instance, self.projection, self.sentiment_window
+                )
+            return fast_serializers.serialize_country(instance, self.projection, self.sentiment_window)
+        return self.get_serializer(instance, many=many).data
+
+    @staticmethod
+    def _snapshot_response(request, name, serialize):
+        """
+        Return cached JSON bytes for ``name``, rendering them on a miss.
+
+        The ETag is derived from the data version alone, so a matching
+        If-None-Match is answered with a 304 before any query runs.
+        """
+        version = snapshots.get_data_version()
+        etag = conditional.make_etag(name, version)
+        if (response := conditional.not_modified(request, etag=etag)) is not None:
+            return response
+
+        content = snapshots.get_or_render(
+            name,
+            lambda: JSONRenderer().render(serialize()),
+            version=version,
+        )
+        return conditional.set_validators(
+            HttpResponse(content, content_type="application/json"),
+            etag=etag,
+        )
+
+
+class PanelDiscussionViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Panel discussion results API
+
+    list: Get all panel discussions
+    retrieve: Get specific panel discussion with full details
+    latest_by_country: Get latest discussion for a country
+    headlines: Get headline fields of the latest discussion for every country
+    latest: Get the latest full discussion for several countries at once
+    transcript: Page through or stream one discussion's transcript
+    """
+
+    max_bulk_codes = 300
+
+    queryset = PanelDiscussion.objects.all()
+    detail_prefetch = ('analyses', 'votes', 'transcripts')
+
+    def get_serializer_class(self):
+        """Use lightweight serializer for list view"""
+        if self.action == 'list':
+            return PanelDiscussionListSerializer
+        return PanelDiscussionSerializer
+
+    def retrieve(self, request, *args, **kwargs):
+        """Get a panel discussion, honouring If-None-Match / If-Modified-Since"""
+        return self._conditional_detail_response(request, self.get_object())
+
+    @action(detail=False, methods=['get'], url_path='country/(?P<country_code>[^/.]+)')
+    def latest_by_country(self, request, country_code=None):
+        """
+        Get latest panel discussion for a specific country
+
+        GET /api/panels/country/{country_code}/
+        """
+        discussion = PanelDiscussion.objects.filter(
+            country_code=country_code
+        ).order_by('-discussion_date', '-id').first()
+
+        if not discussion:
+            return Response(
+                {'error': f'No discussion found for country {country_code}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return self._conditional_detail_response(request, discussion)
+
+    @action(detail=False, methods=['get'], url_path='headlines')
+    def headlines(self, request):
+        """
+        Get the latest discussion headline for every country in one query
+
+        GET /api/panels/headlines/
+
+        Served from the PanelLatestDiscussion summary table, which
+        `manage.py refresh_latest_panels` rebuilds after each ingest.
+        """
+        serializer = PanelLatestDiscussionSerializer(
+            PanelLatestDiscussion.objects.all(), many=True
+        )
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'], url_path='latest')
+    def latest(self, request):
+        """
+        Get the latest panel discussion for several countries at once
+
+        GET /api/panels/latest/?codes=JP,US&transcripts=0
+
+        Query params:
+            - codes (required): Comma-separated country codes
+            - transcripts (optional): Set to 0/false to omit transcripts
+
+        Returns a mapping of code -> discussion (null when a country has none).
+        The query count is constant: one window-function query plus one
+        prefetch per child table, whatever the number of codes.
+        """
+        raw_codes = request.query_params.get('codes', '').split(',')
+        codes = list(dict.fromkeys(code.strip() for code in raw_codes if code.strip()))
+        if not codes:
+            return Response(
+                {'error': 'codes query parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(codes) > self.max_bulk_codes:
+            return Response(
+                {'error': f'At most {self.max_bulk_codes} codes can be requested at once'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        include_transcripts = self._include_transcripts(request)
+
+        discussions = list(latest_panel_discussions(codes))
+        last_modified = max(
+            (discussion.updated_at or discussion.created_at for discussion in discussions),
+            default=None,
+        )
+        etag = conditional.make_etag(
+            'panels-latest',
+            include_transcripts,
+            *sorted(
+                f'{discussion.country_code}={discussion.pk}@'
+                f'{(discussion.updated_at or discussion.created_at).isoformat()}'
+                for discussion in discussions
+            ),
+        )
+        not_modified = conditional.not_modified(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        prefetch_related_objects(discussions, *self._prefetch_for(include_transcripts))
+        serializer = PanelDiscussionSerializer(
+            discussions,
+            many=True,
+            context={'include_transcripts': include_transcripts},
+        )
+        by_code = {item['country_code']: item for item in serializer.data}
+        return conditional.set_validators(
+            Response({code: by_code.get(code) for code in codes}),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    @action(detail=True, methods=['get'], url_path='transcript')
+    def transcript(self, request, pk=None):
+        """
+        Get a discussion transcript page by page, or stream it as NDJSON
+
+        GET /api/panels/{id}/transcript/?after_turn=10&limit=50
+        GET /api/panels/{id}/transcript/?stream=1
+
+        Query params:
+            - after_turn (optional): Return turns after this turn_order
+            - limit (optional): Page size (default: 50, max: 500)
+            - stream (optional): Set to 1 to stream every remaining turn as
+              newline-delimited JSON, fetched in keyset pages
+        """
+        discussion = self.get_object()
+        try:
+            after_turn = int(request.query_params.get('after_turn', -1))
+            limit = min(int(request.query_params.get('limit', 50)), 500)
+        except ValueError:
+            return Response(
+                {'error': 'after_turn and limit must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if limit < 1:
+            return Response(
+                {'error': 'limit must be positive'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if request.query_params.get('stream') in ('1', 'true'):
+            # DB-backed: under ASGI, pages are fetched on the request's thread
+            return streaming_response(
+                request,
+                self._ndjson(discussion.pk, after_turn),
+                'application/x-ndjson',
+                thread_sensitive=True,
+            )
+
+        page = list(self._turns(discussion.pk, after_turn)[:limit + 1])
+        has_more = len(page) > limit
+        page = page[:limit]
+        return Response({
+            'discussion_id': discussion.pk,
+            'results': page,
+            'next_after_turn': page[-1]['turn_order'] if has_more else None,
+        })
+
+    @staticmethod
+    def _turns(discussion_id, after_turn):
+        """Transcript rows after ``after_turn``, in turn order"""
+        return PanelTranscript.objects.filter(
+            discussion_id=discussion_id, turn_order__gt=after_turn
+        ).order_by('turn_order').values(*PanelTranscriptSerializer.Meta.fields)
+
+    @classmethod
+    def _ndjson(cls, discussion_id, after_turn):
+        """
+        Render turns one per line, fetching them in keyset pages
+
+        Each page is its own ``turn_order > last`` query, so memory stays
+        flat without server-side cursors, which PgBouncer transaction
+        pooling (DB_DISABLE_SERVER_SIDE_CURSORS) rules out.
+        """
+        renderer = JSONRenderer()
+        chunk_size = getattr(settings, 'PANEL_TRANSCRIPT_CHUNK_SIZE', 200)
+        while True:
+            page = list(cls._turns(discussion_id, after_turn)[:chunk_size])
+            for row in page:
+                yield renderer.render(row) + b'\n'
+            if len(page) < chunk_size:
+                return
+            after_turn = page[-1]['turn_order']
+
+    @staticmethod
+    def _include_transcripts(request):
+        """Whether the client wants transcripts embedded (``?transcripts=0`` opts out)"""
+        return request.query_params.get('transcripts', '1').lower() not in ('0', 'false', 'no')
+
+    def _prefetch_for(self, include_transcripts):
+        if include_transcripts:
+            return self.detail_prefetch
+        return tuple(name for name in self.detail_prefetch if name != 'transcripts')
+
+    def _conditional_detail_response(self, request, discussion):
+        """
+        Serialize a discussion with its children unless the client copy is current
+
+        Validators come from the discussion row alone, so a 304 is returned
+        before the analyses, votes and transcripts are prefetched. Pass
+        ``?transcripts=0`` and page through ``transcript/`` for long debates.
+        """
+        include_transcripts = self._include_transcripts(request)
+        last_modified = discussion.updated_at or discussion.created_at
+        etag = conditional.make_etag(
+            'panel', discussion.pk, last_modified.isoformat(), include_transcripts
+        )
+        not_modified = conditional.not_modified(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+
+        prefetch_related_objects([discussion], *self._prefetch_for(include_transcripts))
+        serializer = PanelDiscussionSerializer(
+            discussion, context={'include_transcripts': include_transcripts}
+        )
+        return conditional.set_validators(
+            Response(serializer.data), etag=etag, last_modified=last_modified
+        )
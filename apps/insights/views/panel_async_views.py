@@ -0,0 +1,157 @@
+"""
+Async Panel Discussion Views
+Non-blocking variants of the panel discussion endpoints for ASGI servers
+"""
+
+from django.http import JsonResponse
+from django.views import View
+from rest_framework.exceptions import ValidationError
+
+from ..services.panel_discussion_service import PanelStorageUnavailable, get_panel_service
+from ..trends import parse_window
+
+
+def _error(message, status, headers=None):
+    response = JsonResponse({'success': False, 'error': message}, status=status)
+    for name, value in (headers or {}).items():
+        response[name] = value
+    return response
+
+
+def _unavailable(e: PanelStorageUnavailable):
+    return _error(str(e), 503, {'Retry-After': str(int(e.retry_after))})
+
+
+class AsyncPanelDiscussionListView(View):
+    """List recent panel discussions"""
+
+    async def get(self, request):
+        """
+        GET /api/insights/panel/discussions/
+
+        Query params:
+            - country_code (optional): Filter by country
+            - limit (optional): Max results (default: 20)
+
+        Returns:
+            List of discussions with metadata
+        """
+        try:
+            country_code = request.GET.get('country_code')
+            limit = int(request.GET.get('limit', 20))
+
+            discussions = await get_panel_service().alist_discussions(
+                country_code=country_code,
+                limit=limit
+            )
+
+            return JsonResponse({
+                'success': True,
+                'data': {
+                    'discussions': discussions,
+                    'count': len(discussions),
+                    'country_code': country_code
+                }
+            })
+
+        except PanelStorageUnavailable as e:
+            return _unavailable(e)
+
+        except Exception as e:
+            return _error(str(e), 500)
+
+
+class AsyncPanelDiscussionDetailView(View):
+    """Get specific panel discussion"""
+
+    async def get(self, request, discussion_id):
+        """
+        GET /api/insights/panel/discussions/<discussion_id>/
+
+        Returns:
+            Full discussion data including transcript
+        """
+        try:
+            discussion = await get_panel_service().aget_discussion(discussion_id)
+
+            if not discussion:
+                return _error('Discussion not found', 404)
+
+            return JsonResponse({
+                'success': True,
+                'data': discussion
+            })
+
+        except PanelStorageUnavailable as e:
+            return _unavailable(e)
+
+        except Exception as e:
+            return _error(str(e), 500)
+
+
+class AsyncPanelDiscussionSummaryView(View):
+    """Get discussion summary (lightweight)"""
+
+    async def get(self, request, discussion_id):
+        """
+        GET /api/insights/panel/discussions/<discussion_id>/summary/
+
+        Returns:
+            Summary without full transcript
+        """
+        try:
+            summary = await get_panel_service().aget_discussion_summary(discussion_id)
+
+            if not summary:
+                return _error('Discussion not found', 404)
+
+            return JsonResponse({
+                'success': True,
+                'data': summary
+            })
+
+        except PanelStorageUnavailable as e:
+            return _unavailable(e)
+
+        except Exception as e:
+            return _error(str(e), 500)
+
+
+class AsyncCountryHistoryView(View):
+    """Get discussion history for a country"""
+
+    async def get(self, request, country_code):
+        """
+        GET /api/insights/panel/history/<country_code>/
+
+        Query params:
+            - limit (optional): Max results (default: 10)
+            - window (optional): Analytics EMA window, one of 5, 10, 30 (default: 10)
+
+        Returns:
+            Discussion history with trend analysis and rolling analytics
+        """
+        try:
+            window = parse_window(request.GET.get('window'))
+        except ValidationError as e:
+            return JsonResponse(e.detail, status=400)
+
+        try:
+            limit = int(request.GET.get('limit', 10))
+
+            history = await get_panel_service().aget_country_history(
+                country_code=country_code,
+                limit=limit,
+                window=window
+            )
+
+            return JsonResponse({
+                'success': True,
+                'data': history
+            })
+
+        except PanelStorageUnavailable as e:
+            return _unavailable(e)
+
+        except Exception as e:
+            return _error(str(e), 500)
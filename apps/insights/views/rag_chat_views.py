@@ -7,9 +7,51 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
-import uuid
+import itertools
+import json
 
 from ..services.rag_chat_service import get_rag_service
+from .streaming import streaming_response
+
+STREAM_CONTENT_TYPES = {
+    'sse': 'text/event-stream',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def _stream_format(request):
+    """'sse', 'ndjson' or None (plain JSON) from ?stream=, the body or Accept"""
+    requested = request.query_params.get('stream') or request.data.get('stream')
+    if requested in STREAM_CONTENT_TYPES:
+        return requested
+    if 'text/event-stream' in request.headers.get('Accept', ''):
+        return 'sse'
+    return None
+
+
+def _encode_events(events, stream_format):
+    """Serialize chat events as SSE messages or NDJSON lines"""
+    try:
+        for event in events:
+            payload = json.dumps(event, default=str)
+            if stream_format == 'sse':
+                yield f"event: {event['type']}\ndata: {payload}\n\n"
+            else:
+                yield payload + '\n'
+    except Exception as e:
+        # Headers are already sent: report the failure in-band
+        payload = json.dumps({'type': 'error', 'error': str(e)})
+        yield f"event: error\ndata: {payload}\n\n" if stream_format == 'sse' else payload + '\n'
+
+
+def _positive_int(raw):
+    """Parse an optional positive integer query parameter"""
+    if raw in (None, ''):
+        return None
+    value = int(raw)
+    if value < 1:
+        raise ValueError(raw)
+    return value
 
 
 class RAGChatView(APIView):
@@ -20,8 +62,13 @@ class RAGChatView(APIView):
     {
         "message": "What's the current mood in Japan?",
         "session_id": "optional-session-id",
-        "country_code": "JP"  // optional
+        "country_code": "JP",  // optional
+        "stream": "sse",  // optional: "sse" or "ndjson" (also ?stream=)
+        "trace": true  // optional: include the agent trace (RAG_TRACE_MODE=debug and DEBUG only)
     }
+
+    Streaming responses forward each answer chunk and citation as the
+    agent produces them, ending with a "done" event.
     """
 
     def post(self, request):
@@ -33,20 +80,34 @@ class RAGChatView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Get or create session ID
-        session_id = request.data.get('session_id')
-        if not session_id:
-            session_id = str(uuid.uuid4())
+        # New sessions get their ID from the service (returned in the response)
+        session_id = request.data.get('session_id') or None
 
         country_code = request.data.get('country_code')
 
+        stream_format = _stream_format(request)
+        trace = str(request.query_params.get('trace') or request.data.get('trace') or '').lower() in ('1', 'true')
+
         try:
             rag_service = get_rag_service()
 
+            if stream_format:
+                return self._stream(
+                    request,
+                    rag_service.stream_chat(
+                        message=message,
+                        session_id=session_id,
+                        country_code=country_code,
+                        trace=trace
+                    ),
+                    stream_format
+                )
+
             result = rag_service.chat(
                 message=message,
                 session_id=session_id,
-                country_code=country_code
+                country_code=country_code,
+                trace=trace
             )
 
             return Response({
@@ -60,12 +121,42 @@ class RAGChatView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def perform_content_negotiation(self, request, force=False):
+        # Accept: text/event-stream selects streaming, not a DRF renderer;
+        # plain responses (errors) fall back to JSON instead of a 406
+        if 'text/event-stream' in request.headers.get('Accept', ''):
+            force = True
+        return super().perform_content_negotiation(request, force=force)
+
+    @staticmethod
+    def _stream(request, events, stream_format):
+        """
+        Build the streaming response
+
+        The first event is awaited here, so agent errors still produce a
+        JSON 500 and the response starts with the first chunk. Under ASGI
+        the rest is pulled from a worker thread so chunks are flushed as
+        they arrive instead of being buffered.
+        """
+        first = next(events)
+        response = streaming_response(
+            request,
+            _encode_events(itertools.chain([first], events), stream_format),
+            STREAM_CONTENT_TYPES[stream_format]
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
 
 class RAGSessionHistoryView(APIView):
     """
     Get conversation history
 
-    GET /api/insights/chat/history/?session_id=xxx
+    GET /api/insights/chat/history/?session_id=xxx&limit=10&before=42
+
+    `limit` caps the number of turns (newest first); pass the returned
+    `next_before` as `before` to page back through older turns.
     """
 
     def get(self, request):
@@ -77,15 +168,26 @@ class RAGSessionHistoryView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        try:
+            limit = _positive_int(request.query_params.get('limit'))
+            before = _positive_int(request.query_params.get('before'))
+        except ValueError:
+            return Response(
+                {'error': 'limit and before must be positive integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         try:
             rag_service = get_rag_service()
-            history = rag_service.get_session_history(session_id)
+            history = rag_service.get_session_history(session_id, limit=limit, before=before)
+            oldest_turn = history[0]['turn'] if history else None
 
             return Response({
                 'success': True,
                 'data': {
                     'session_id': session_id,
-                    'history': history
+                    'history': history,
+                    'next_before': oldest_turn if oldest_turn and oldest_turn > 1 else None
                 }
             })
 
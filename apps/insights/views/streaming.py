@@ -0,0 +1,52 @@
+"""
+Streaming Responses
+StreamingHttpResponse bodies that are flushed as they are produced under
+both WSGI and ASGI
+"""
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+
+async def iterate_in_thread(iterator, thread_sensitive=False):
+    """
+    Drive a blocking iterator from a worker thread, one item at a time
+
+    Args:
+        iterator: Blocking iterator
+        thread_sensitive: Run on the request's sync thread, which owns its
+            database connection; required for iterators that query the DB
+
+    Yields:
+        Items of the iterator
+    """
+    done = object()
+    step = sync_to_async(next, thread_sensitive=thread_sensitive)
+    while True:
+        item = await step(iterator, done)
+        if item is done:
+            return
+        yield item
+
+
+def streaming_response(request, iterator, content_type, thread_sensitive=False):
+    """
+    Build a StreamingHttpResponse that is not buffered under ASGI
+
+    Django wraps a sync iterator in sync_to_async(list) when serving it
+    from ASGI, so the whole body is built before the first byte is sent.
+    Under ASGI the iterator is therefore driven asynchronously instead.
+
+    Args:
+        request: DRF or Django request
+        iterator: Blocking iterator of str/bytes chunks
+        content_type: Response content type
+        thread_sensitive: See iterate_in_thread
+
+    Returns:
+        StreamingHttpResponse
+    """
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        iterator = iterate_in_thread(iterator, thread_sensitive=thread_sensitive)
+    return StreamingHttpResponse(iterator, content_type=content_type)
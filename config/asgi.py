@@ -8,3 +8,11 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# Build the shared AWS clients now rather than on the first request, and
+# start the optional panel prefetch scheduler (PANEL_PREFETCH_INTERVAL).
+from apps.insights.services.aws_clients import warm_up  # noqa: E402
+from apps.insights.services.panel_prefetch import start_scheduler  # noqa: E402
+
+warm_up()
+start_scheduler()
@@ -72,6 +72,9 @@ DATABASES = {
         "PASSWORD": env("DB_PASSWORD", default=""),
         "HOST": env("DB_HOST", default=""),
         "PORT": env("DB_PORT", default=""),
+        # Server-side cursors (QuerySet.iterator) do not survive PgBouncer
+        # transaction pooling; set this when connecting through a pooler.
+        "DISABLE_SERVER_SIDE_CURSORS": env.bool("DB_DISABLE_SERVER_SIDE_CURSORS", default=False),
     }
 }
 
@@ -84,6 +87,50 @@ if ENGINE := DATABASES["default"].get("ENGINE"):
         if channel_binding:
             DATABASES["default"].setdefault("OPTIONS", {})["channel_binding"] = channel_binding
 
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# Rendered country payloads are cached per data version; see apps.insights.snapshots.
+INSIGHTS_SNAPSHOT_TTL = env.int("INSIGHTS_SNAPSHOT_TTL", default=86400)
+# Serialize countries with apps.insights.fast_serializers instead of the DRF tree.
+INSIGHTS_FAST_SERIALIZER = env.bool("INSIGHTS_FAST_SERIALIZER", default=False)
+# "orm" builds model instances for the country list; "values" uses apps.insights.queries.
+INSIGHTS_COUNTRY_QUERY_PLAN = env("INSIGHTS_COUNTRY_QUERY_PLAN", default="orm")
+# Rows fetched per keyset page when streaming transcripts.
+PANEL_TRANSCRIPT_CHUNK_SIZE = env.int("PANEL_TRANSCRIPT_CHUNK_SIZE", default=200)
+
+# Shared boto3 clients; see apps/insights/services/aws_clients.py.
+# Region of every client, including the Bedrock model ARNs built from it.
+AWS_REGION = env("AWS_REGION", default="ap-northeast-1")
+AWS_MAX_POOL_CONNECTIONS = env.int("AWS_MAX_POOL_CONNECTIONS", default=32)
+AWS_CONNECT_TIMEOUT = env.float("AWS_CONNECT_TIMEOUT", default=2.0)
+AWS_READ_TIMEOUT = env.float("AWS_READ_TIMEOUT", default=60.0)
+AWS_MAX_ATTEMPTS = env.int("AWS_MAX_ATTEMPTS", default=4)
+# Threads running the async panel views' S3 calls. This caps the S3 requests in flight
+# per worker process (32 by default); raise it together with AWS_MAX_POOL_CONNECTIONS.
+PANEL_ASYNC_IO_THREADS = env.int("PANEL_ASYNC_IO_THREADS", default=AWS_MAX_POOL_CONNECTIONS)
+# Clients created when a WSGI/ASGI worker starts, before the first request.
+AWS_WARM_UP_CLIENTS = env.list("AWS_WARM_UP_CLIENTS", default=["s3", "bedrock-agent-runtime"])
+# Seconds between in-process panel cache prefetches (0 disables the scheduler thread).
+PANEL_PREFETCH_INTERVAL = env.int("PANEL_PREFETCH_INTERVAL", default=0)
+# RAG answer cache; see apps/insights/services/response_cache.py (TTL 0 disables it).
+RAG_RESPONSE_CACHE_TTL = env.int("RAG_RESPONSE_CACHE_TTL", default=3600)
+# Bedrock embedding model for near-duplicate questions, e.g. "amazon.titan-embed-text-v2:0" (empty: exact matches only).
+RAG_RESPONSE_CACHE_EMBEDDING_MODEL = env("RAG_RESPONSE_CACHE_EMBEDDING_MODEL", default="")
+RAG_RESPONSE_CACHE_SIMILARITY = env.float("RAG_RESPONSE_CACHE_SIMILARITY", default=0.92)
+# Share identical in-flight knowledge base queries between workers too (needs a shared CACHE_URL).
+RAG_COALESCE_ACROSS_WORKERS = env.bool("RAG_COALESCE_ACROSS_WORKERS", default=False)
+RAG_COALESCE_WAIT = env.float("RAG_COALESCE_WAIT", default=30)
+# Bedrock agent traces: "off", "sampled" (RAG_TRACE_SAMPLE_RATE of requests, logged) or "debug" (?trace=1 with DEBUG).
+RAG_TRACE_MODE = env("RAG_TRACE_MODE", default="off")
+RAG_TRACE_SAMPLE_RATE = env.float("RAG_TRACE_SAMPLE_RATE", default=0.01)
+# RAG chat history; see apps/insights/services/session_store.py. Empty keeps it in the
+# Django cache (shared across workers with a shared CACHE_URL), "redis://..." in Redis
+# lists (requires the redis package), "memory://" in-process (development only).
+RAG_SESSION_STORE_URL = env("RAG_SESSION_STORE_URL", default="")
+RAG_SESSION_MAX_TURNS = env.int("RAG_SESSION_MAX_TURNS", default=50)
+RAG_SESSION_MAX_BYTES = env.int("RAG_SESSION_MAX_BYTES", default=256 * 1024)
+RAG_SESSION_TTL = env.int("RAG_SESSION_TTL", default=1800)
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -7,4 +7,6 @@ from django.urls import include, path
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include("apps.insights.urls")),
+    path("api/insights/", include("apps.insights.urls_panel_s3")),
+    path("api/insights/", include("apps.insights.urls_rag")),
 ]